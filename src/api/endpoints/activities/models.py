@@ -1,4 +1,4 @@
-from api.models.base import Base
+from api.models.base import Base, GUID
 
 
 db = Base.db
@@ -9,8 +9,9 @@ class Activity(Base):
 
     __tablename__ = 'activities'
 
+    id_type = GUID
     activity_type_id = db.Column(
-        db.String,
+        GUID,
         db.ForeignKey('activity_types.uuid'),
         nullable=False
     )
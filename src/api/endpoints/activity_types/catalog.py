@@ -0,0 +1,95 @@
+"""
+Activity Type Catalog Module.
+
+Activity types rarely change, so they are kept in a process-wide catalog
+that logging and validating activities read instead of the database.
+"""
+import os
+import threading
+import time
+
+from sqlalchemy import inspect
+from sqlalchemy.orm import make_transient_to_detached
+
+from api.models.base import db
+from api.utils.cache import invalidate_on_commit
+from .models import ActivityType
+
+
+class ActivityTypeCatalog(object):
+    """In-memory uuid -> ActivityType map of all activity types.
+
+    The catalog holds detached copies of the rows. It is reloaded whenever
+    a committed transaction changed an activity type in this process, and
+    at least every `ttl` seconds to pick up changes made by other workers.
+    """
+
+    def __init__(self, ttl=300):
+        """Create an empty catalog that expires after `ttl` seconds."""
+        self.ttl = ttl
+        self._catalog = None
+        self._loaded_at = 0
+        self._lock = threading.Lock()
+
+    def refresh(self):
+        """Reload all activity types from the database.
+
+        Return:
+            (types, multiple_participant_ids)
+        """
+        columns = [attribute.key
+                   for attribute in inspect(ActivityType).column_attrs]
+        types = {}
+        for row in ActivityType.query.with_entities(
+                *(getattr(ActivityType, column) for column in columns)):
+            # a copy that isn't tied to the session that loaded it
+            activity_type = ActivityType(**dict(zip(columns, row)))
+            make_transient_to_detached(activity_type)
+            types[activity_type.uuid] = activity_type
+
+        catalog = (types, frozenset(
+            uuid for uuid, activity_type in types.items()
+            if activity_type.supports_multiple_participants))
+        with self._lock:
+            self._catalog = catalog
+            self._loaded_at = time.time()
+        return catalog
+
+    def invalidate(self):
+        """Drop the loaded types so the next lookup reloads them."""
+        with self._lock:
+            self._catalog = None
+
+    def _load(self):
+        catalog = self._catalog
+        if catalog is None or time.time() - self._loaded_at > self.ttl:
+            catalog = self.refresh()
+        return catalog
+
+    @property
+    def types(self):
+        """Return the uuid -> activity type map, loading it when stale."""
+        return self._load()[0]
+
+    @property
+    def multiple_participant_ids(self):
+        """Return the uuids of the multi-participant activity types."""
+        return self._load()[1]
+
+    def get(self, uuid):
+        """Return the activity type with uuid in the current session or None.
+
+        The cached copy is merged without loading it, so relating it to
+        other rows doesn't query the activity types table.
+        """
+        activity_type = self.types.get(uuid)
+        if activity_type is None:
+            return None
+        return db.session.merge(activity_type, load=False)
+
+
+activity_type_catalog = ActivityTypeCatalog(
+    int(os.getenv('ACTIVITY_TYPE_CATALOG_TTL', 300)))
+
+
+invalidate_on_commit([ActivityType], activity_type_catalog)
@@ -1,4 +1,4 @@
-from api.models.base import Base
+from api.models.base import Base, GUID
 
 
 db = Base.db
@@ -9,6 +9,7 @@ class ActivityType(Base):
 
     __tablename__ = 'activity_types'
 
+    id_type = GUID
     value = db.Column(db.Integer, nullable=False)
     supports_multiple_participants = db.Column(db.Boolean, default=False)
 
@@ -1,4 +1,4 @@
-from api.models.base import Base
+from api.models.base import Base, GUID
 
 
 db = Base.db
@@ -10,7 +10,7 @@ class Cohort(Base):
     __tablename__ = 'cohorts'
     center_id = db.Column(db.String, db.ForeignKey('centers.uuid'),
                           nullable=False)
-    society_id = db.Column(db.String, db.ForeignKey('societies.uuid'))
+    society_id = db.Column(GUID, db.ForeignKey('societies.uuid'))
 
     center = db.relationship('Center', back_populates='cohorts')
     society = db.relationship('Society', back_populates='cohorts')
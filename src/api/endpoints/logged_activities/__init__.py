@@ -7,9 +7,11 @@ def logged_activities_bp(Api, Blueprint, emit_email_event, mail):
     from .crud import LoggedActivitiesAPI
     from .user_logged_activities import UserLoggedActivitiesAPI
     from .approve import LoggedActivityApprovalAPI
-    from .reject import LoggedActivityRejectionAPI
+    from .reject import (
+        BulkLoggedActivityRejectionAPI, LoggedActivityRejectionAPI)
     from .request_info import LoggedActivityInfoAPI
-    from .secretary_review import SecretaryReviewLoggedActivityAPI
+    from .secretary_review import (
+        BulkSecretaryReviewAPI, SecretaryReviewLoggedActivityAPI)
 
 
     logged_activities_bp_service = Blueprint('logged_activities_api', __name__)
@@ -53,6 +55,18 @@ def logged_activities_bp(Api, Blueprint, emit_email_event, mail):
         }
     )
 
+    # society secretary bulk logged activities review endpoint
+    logged_activities_api.add_resource(
+        BulkSecretaryReviewAPI,
+        '/logged-activities/review',
+        '/logged-activities/review/',
+        endpoint='bulk_secretary_logged_activities',
+        resource_class_kwargs={
+            'LoggedActivity': LoggedActivity,
+            'db': base.db
+        }
+    )
+
     # success ops request more info on logged activity endpoint
     logged_activities_api.add_resource(
         LoggedActivityInfoAPI,
@@ -88,4 +102,16 @@ def logged_activities_bp(Api, Blueprint, emit_email_event, mail):
             'LoggedActivity': LoggedActivity
         }
     )
+
+    # success ops reject logged_activities in bulk
+    logged_activities_api.add_resource(
+        BulkLoggedActivityRejectionAPI,
+        "/logged-activities/reject",
+        "/logged-activities/reject/",
+        endpoint="bulk_reject_logged_activities",
+        resource_class_kwargs={
+            'LoggedActivity': LoggedActivity,
+            'db': base.db
+        }
+    )
     return logged_activities_bp_service
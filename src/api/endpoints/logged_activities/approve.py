@@ -1,10 +1,10 @@
 from flask_restful import Resource
-from flask import request
+from flask import current_app, request
 
 from api.services.auth import token_required, roles_required
 from api.utils.helpers import response_builder
 
-from .marshmallow_schemas import logged_activities_schema
+from .helpers import approve_logged_activities
 
 
 class LoggedActivityApprovalAPI(Resource):
@@ -34,31 +34,22 @@ class LoggedActivityApprovalAPI(Resource):
                     message='A List/Array with at least one logged activity'
                             ' id is needed!'), 400)
 
-            if len(logged_activities_ids) > 20:
-                return response_builder(dict(
-                    message='Sorry, you can not approve more than 20'
-                            ' logged_activities at a go'), 403)
-
-            bulk_approval_query = self.LoggedActivity.query.filter(
-                    self.LoggedActivity.uuid.in_(payload['loggedActivitiesIds']),
-                    self.LoggedActivity.status.in_(['pending']))
-
-            request_approval_data = bulk_approval_query.all()
-
-            request_approval = bulk_approval_query.update({'status': 'approved'},
-            synchronize_session=False)
+            results, approved = approve_logged_activities(
+                logged_activities_ids,
+                current_app.config['BULK_APPROVAL_CHUNK_SIZE'])
+            results = [dict(id=logged_activity_id, result=result)
+                       for logged_activity_id, result in results.items()]
 
-            if request_approval:
-                for approval in request_approval_data:
-                    approval.society.total_points = approval
-                self.db.session.commit()
+            if approved:
                 return response_builder(dict(
-                    data=logged_activities_schema.dump(request_approval_data).data,
+                    data=approved,
+                    results=results,
                     message='Activity edited successfully'),
                     200)
             else:
                 return response_builder(dict(
                     status= 'fail',
+                    results=results,
                     message='invalid logged_activities_ids or no pending logged activities'
                     ), 400)
         else:
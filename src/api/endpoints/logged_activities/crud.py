@@ -4,15 +4,18 @@ from flask_restful import Resource
 from flask import g, request
 
 from api.services.auth import token_required
+from api.utils.export import export_format, stream_export
 from api.utils.helpers import response_builder, paginate_items
 from api.services.slack_notify import SlackNotification
 
-from .helpers import ParsedResult, parse_log_activity_fields
+from .helpers import (
+    ParsedResult, logged_activity_filters, parse_log_activity_fields,
+    with_serialization_relations
+)
 from .marshmallow_schemas import (
     LogEditActivitySchema, single_logged_activity_schema,
     logged_activities_schema
 )
-from api.models import Role, User
 
 access_time = str(datetime.datetime.utcnow().time())
 
@@ -53,8 +56,7 @@ class LoggedActivitiesAPI(Resource, SlackNotification):
 
             parsed_result = parse_log_activity_fields(
                 result,
-                self.Activity,
-                self.ActivityType
+                self.Activity
             )
             if not isinstance(parsed_result, ParsedResult):
                 return parsed_result
@@ -93,17 +95,10 @@ class LoggedActivitiesAPI(Resource, SlackNotification):
             app.logger.info(
                 'Activity {} logged SUCCESSFULLY. The log time is UTC {}'.format(logged, access_time))
 
-            society_id = g.current_user.society_id
-
             # send notification to the society secretary about logged points
-
-            roles = User.query.filter(User.roles.any(
-                Role.name == "society secretary")).all()
-            # for user in self.all_users:
-            #     users = filter(lambda x: x.society_id==society_id, self.all_users)
-            users = User.query.filter_by(society_id=society_id).all()
             message = "New activities logged. Go to https://societies.andela.com to approve points"
-            SlackNotification.send_notification(self, roles, users, message)
+            self.notify_role("society secretary", message,
+                             society_id=g.current_user.society_id)
 
             return response_builder(dict(
                 data=single_logged_activity_schema.dump(logged_activity).data,
@@ -119,21 +114,46 @@ class LoggedActivitiesAPI(Resource, SlackNotification):
         paginate = request.args.get("paginate", "true")
         message = "all Logged activities fetched successfully"
 
+        try:
+            query = logged_activity_filters.apply(
+                with_serialization_relations(self.LoggedActivity.query),
+                request.args)
+        except ValueError as error:
+            return response_builder(dict(status="fail",
+                                         message=str(error)), 400)
         if paginate.lower() == "false":
-            logged_activities = self.LoggedActivity.query.all()
-            count = self.LoggedActivity.query.count()
-            data = {"count": count}
+            try:
+                export = export_format(request.args)
+            except ValueError as error:
+                return response_builder(dict(status="fail",
+                                             message=str(error)), 400)
+            if export:
+                return stream_export(
+                    query.order_by(self.LoggedActivity.created_at,
+                                   self.LoggedActivity.uuid),
+                    lambda rows: logged_activities_schema.dump(rows).data,
+                    export, 'logged-activities')
+
+            logged_activities = query.all()
+            data = {"count": len(logged_activities)}
         else:
-            logged_activities = self.LoggedActivity.query
-            pagination_result = paginate_items(logged_activities,
-                                               serialize=False)
+            logged_activities = query
+            try:
+                pagination_result = paginate_items(logged_activities,
+                                                   serialize=False)
+            except ValueError as error:
+                return response_builder(dict(
+                    status="fail",
+                    message=str(error)
+                ), 400)
             logged_activities = pagination_result.data
             data = {
                 "count": pagination_result.count,
                 "page": pagination_result.page,
                 "pages": pagination_result.pages,
                 "previous_url": pagination_result.previous_url,
-                "next_url": pagination_result.next_url
+                "next_url": pagination_result.next_url,
+                "next_cursor": pagination_result.next_cursor
             }
 
         data.update(dict(
@@ -174,8 +194,7 @@ class LoggedActivitiesAPI(Resource, SlackNotification):
                 result['date'] = logged_activity.activity_date
             parsed_result = parse_log_activity_fields(
                 result,
-                self.Activity,
-                self.ActivityType
+                self.Activity
             )
             if not isinstance(parsed_result, ParsedResult):
                 return parsed_result
@@ -1,7 +1,17 @@
 import datetime
-from collections import namedtuple
+from collections import OrderedDict, namedtuple
 
+from sqlalchemy.orm import joinedload
+from sqlalchemy.orm.attributes import set_committed_value
+
+from api.endpoints.activity_types.catalog import activity_type_catalog
+from api.models import Society
+from api.models.base import db
+from api.services.points import record_approvals, record_earned
+from api.utils.filters import DateRange, Filter, FilterSet, OneOf, Range
 from api.utils.helpers import response_builder
+from .marshmallow_schemas import logged_activities_schema
+from .models import LoggedActivity
 
 
 ParsedResult = namedtuple(
@@ -9,15 +19,31 @@ ParsedResult = namedtuple(
     ['activity', 'activity_type', 'activity_date', 'activity_value']
 )
 
+LOGGED_ACTIVITY_STATUSES = ('in review', 'pending', 'approved', 'rejected')
+
+logged_activity_filters = FilterSet(
+    OneOf('status', LoggedActivity.status, choices=LOGGED_ACTIVITY_STATUSES,
+          normalize=str.lower),
+    Filter('society', Society.name, joins=[LoggedActivity.society]),
+    Filter('userId', LoggedActivity.user_id),
+    Filter('activityTypeId', LoggedActivity.activity_type_id),
+    DateRange('startDate', 'endDate', LoggedActivity.activity_date),
+    Range('minPoints', 'maxPoints', LoggedActivity.value)
+)
+
 
-def parse_log_activity_fields(result, activity_model, activity_type_model):
-    """Parse the fields of the Log Activity Fields."""
+def parse_log_activity_fields(result, activity_model):
+    """Parse the fields of the Log Activity Fields.
+
+    Activity types are read from the activity type catalog.
+    """
     if result.get('activity_id'):
         activity = activity_model.query.get(result['activity_id'])
         if not activity:
             return response_builder(dict(message='Invalid activity id'), 422)
 
-        activity_type = activity.activity_type
+        activity_type = activity_type_catalog.get(
+            activity.activity_type_id) or activity.activity_type
         if activity_type.supports_multiple_participants and \
                 not (result.get('no_of_participants') and
                      result.get('description')):
@@ -33,9 +59,7 @@ def parse_log_activity_fields(result, activity_model, activity_type_model):
         if activity_date > datetime.date.today():
             return response_builder(dict(message='Invalid activity date'), 422)
 
-        activity_type = activity_type_model.query.get(
-            result['activity_type_id']
-        )
+        activity_type = activity_type_catalog.get(result['activity_type_id'])
         if not activity_type:
             return response_builder(dict(message='Invalid activity type id'),
                                     422)
@@ -55,3 +79,101 @@ def parse_log_activity_fields(result, activity_model, activity_type_model):
     return ParsedResult(
         activity, activity_type, activity_date, activity_value
     )
+
+
+def with_serialization_relations(query):
+    """Eager load every relation LoggedActivitySchema serializes.
+
+    Args:
+        query: query of LoggedActivity rows
+
+    Return:
+        the query, loading users, society, activity and activity type
+        together with the rows
+    """
+    return query.options(
+        joinedload(LoggedActivity.user),
+        joinedload(LoggedActivity.society),
+        joinedload(LoggedActivity.activity),
+        joinedload(LoggedActivity.activity_type),
+        joinedload(LoggedActivity.approver),
+        joinedload(LoggedActivity.reviewer)
+    )
+
+
+def lock_logged_activities(logged_activities_ids):
+    """Load and lock logged activities with the relations they serialize.
+
+    Args:
+        logged_activities_ids (list): ids sent by the client
+
+    Return:
+        (results, rows) where results maps every distinct id to 'missing'
+        and rows are the logged activities that were found
+    """
+    results = OrderedDict(
+        (str(logged_activity_id), 'missing')
+        for logged_activity_id in logged_activities_ids)
+    rows = with_serialization_relations(LoggedActivity.query).filter(
+        LoggedActivity.uuid.in_(list(results))
+    ).with_for_update(of=LoggedActivity).all()
+    return results, rows
+
+
+def change_status(logged_activities, status):
+    """Move logged activities to status with a single UPDATE."""
+    LoggedActivity.query.filter(
+        LoggedActivity.uuid.in_([row.uuid for row in logged_activities])
+    ).update({'status': status}, synchronize_session=False)
+    for row in logged_activities:
+        set_committed_value(row, 'status', status)
+
+
+def group_by_owner(logged_activities):
+    """Group logged activities by the email of the user who logged them."""
+    groups = OrderedDict()
+    for logged_activity in logged_activities:
+        groups.setdefault(logged_activity.user.email, []).append(
+            logged_activity)
+    return groups
+
+
+def approve_logged_activities(logged_activities_ids, chunk_size):
+    """Approve pending logged activities a chunk of ids at a time.
+
+    Every chunk is locked, approved, credited to its societies with one
+    balance update per society and committed before the next one is read,
+    so a large approval never holds more than chunk_size rows.
+
+    Args:
+        logged_activities_ids (list): ids of the activities to approve
+        chunk_size (int): ids approved per transaction
+
+    Return:
+        (results, approved) where results maps every distinct id to
+        'approved', 'skipped' (not pending) or 'missing', and approved is
+        the serialized approved activities
+    """
+    results = OrderedDict.fromkeys(map(str, logged_activities_ids))
+    ids = list(results)
+    approved = []
+
+    for start in range(0, len(ids), chunk_size):
+        chunk_results, rows = lock_logged_activities(
+            ids[start:start + chunk_size])
+
+        pending = [row for row in rows if row.status == 'pending']
+        for row in rows:
+            chunk_results[str(row.uuid)] = \
+                'approved' if row.status == 'pending' else 'skipped'
+        results.update(chunk_results)
+
+        if pending:
+            change_status(pending, 'approved')
+            record_earned(pending)
+            record_approvals(pending)
+            # serialize before the commit expires the rows
+            approved.extend(logged_activities_schema.dump(pending).data)
+        db.session.commit()
+
+    return results, approved
@@ -1,6 +1,6 @@
 from marshmallow import fields, validates_schema, validate, ValidationError
 
-from api.models import User, ActivityType
+from api.endpoints.activity_types.catalog import activity_type_catalog
 from api.utils.marshmallow_schemas import BaseSchema
 
 
@@ -34,17 +34,15 @@ class LoggedActivitySchema(BaseSchema):
     @staticmethod
     def get_approver(obj):
         """Get approver name."""
-        if obj.approver_id:
-            approver = User.query.get(obj.approver_id)
-            return approver.name
+        if obj.approver:
+            return obj.approver.name
         return
 
     @staticmethod
     def get_reviewer(obj):
         """Get reviewer name."""
-        if obj.reviewer_id:
-            reviewer = User.query.get(obj.reviewer_id)
-            return reviewer.name
+        if obj.reviewer:
+            return obj.reviewer.name
         return
 
 
@@ -90,8 +88,8 @@ class LogEditActivitySchema(BaseSchema):
         # bootcamps, tech events etc is made a requirement, it should
         # be removed so that only supported activity types are logged
         # via activity_type_id
-        multi_participant_activities = [x.uuid for x in ActivityType.query.filter_by(
-            supports_multiple_participants=True).all()]
+        multi_participant_activities = \
+            activity_type_catalog.multiple_participant_ids
         if data.get('activity_type_id') in multi_participant_activities \
                 and not data.get('no_of_participants'):
             raise ValidationError(
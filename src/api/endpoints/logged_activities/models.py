@@ -1,4 +1,4 @@
-from api.models.base import Base
+from api.models.base import Base, GUID
 
 
 db = Base.db
@@ -8,6 +8,15 @@ class LoggedActivity(Base):
     """Models Activities logged by fellows."""
 
     __tablename__ = 'logged_activities'
+    __table_args__ = (
+        db.Index('ix_logged_activities_user_id_status', 'user_id', 'status'),
+        db.Index('ix_logged_activities_society_id_status',
+                 'society_id', 'status'),
+        db.Index('ix_logged_activities_created_at_uuid',
+                 'created_at', 'uuid'),
+    )
+
+    id_type = GUID
     value = db.Column(db.Integer, nullable=False)
     status = db.Column(db.String, default='in review')
     approved_at = db.Column(db.DateTime)
@@ -18,13 +27,13 @@ class LoggedActivity(Base):
     approver_id = db.Column(db.String)
     reviewer_id = db.Column(db.String)
     activity_type_id = db.Column(
-        db.String, db.ForeignKey('activity_types.uuid'), nullable=False
+        GUID, db.ForeignKey('activity_types.uuid'), nullable=False
     )
     user_id = db.Column(db.String, db.ForeignKey('users.uuid'), nullable=False)
     society_id = db.Column(
-        db.String, db.ForeignKey('societies.uuid'), nullable=False,
+        GUID, db.ForeignKey('societies.uuid'), nullable=False,
     )
-    activity_id = db.Column(db.String, db.ForeignKey('activities.uuid'))
+    activity_id = db.Column(GUID, db.ForeignKey('activities.uuid'))
 
     activity = db.relationship(
         'Activity', back_populates='logged_activities'
@@ -38,3 +47,14 @@ class LoggedActivity(Base):
     society = db.relationship(
         'Society', back_populates='logged_activities'
     )
+    # approver_id and reviewer_id have no foreign key constraint
+    approver = db.relationship(
+        'User',
+        primaryjoin='foreign(LoggedActivity.approver_id) == User.uuid',
+        viewonly=True
+    )
+    reviewer = db.relationship(
+        'User',
+        primaryjoin='foreign(LoggedActivity.reviewer_id) == User.uuid',
+        viewonly=True
+    )
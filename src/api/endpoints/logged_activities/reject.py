@@ -1,14 +1,19 @@
+from collections import OrderedDict
+
 from flask_restful import Resource
+from flask import request
 
 from api.services.auth import token_required, roles_required
 from api.utils.helpers import response_builder
-from api.models import Role, User
-from api.services.slack_notify import SlackNotification
+from api.services.outbox import queue_slack_role
+from api.services.points import record_rejections
 
-from .marshmallow_schemas import single_logged_activity_schema
+from .helpers import change_status, lock_logged_activities
+from .marshmallow_schemas import (
+    logged_activities_schema, single_logged_activity_schema)
 
 
-class LoggedActivityRejectionAPI(Resource, SlackNotification):
+class LoggedActivityRejectionAPI(Resource):
     """Allows success-ops to reject at least one Logged Activities."""
 
     decorators = [token_required]
@@ -16,7 +21,6 @@ class LoggedActivityRejectionAPI(Resource, SlackNotification):
     def __init__(self, **kwargs):
         """Inject dependency for resource."""
         self.LoggedActivity = kwargs['LoggedActivity']
-        SlackNotification.__init__(self)
 
     @roles_required(["success ops"])
     def put(self, logged_activity_id=None):
@@ -34,6 +38,7 @@ class LoggedActivityRejectionAPI(Resource, SlackNotification):
 
         if logged_activity.status == 'pending':
             logged_activity.status = 'rejected'
+            record_rejections([logged_activity])
 
             user_logged_activity = single_logged_activity_schema.dump(
                 logged_activity).data
@@ -44,14 +49,12 @@ class LoggedActivityRejectionAPI(Resource, SlackNotification):
             del user_logged_activity['societyId']
 
             # Send notification via Slack to the society Secretary
-            society_id = logged_activity.society_id
             message = f"REJECTED! Success Ops have rejected {logged_activity.society.name}'s activity "  + \
                       f"points worth {logged_activity.value}. Logged on {logged_activity.activity_date}, and " + \
                       f"described as *{logged_activity.description}* which " + \
                       f"you had previously approved"
-            roles = User.query.filter(User.roles.any(Role.name=="society secretary")).all()
-            users = User.query.filter_by(society_id=society_id).all()
-            SlackNotification.send_notification(self, roles, users, message)
+            queue_slack_role("society secretary", message,
+                             society_id=logged_activity.society_id)
 
             return response_builder(dict(
                 data=user_logged_activity,
@@ -62,3 +65,71 @@ class LoggedActivityRejectionAPI(Resource, SlackNotification):
                 status='failed',
                 message='This logged activity is either in-review,'
                 ' approved or already rejected'), 403)
+
+
+class BulkLoggedActivityRejectionAPI(Resource):
+    """Allows success-ops to reject many Logged Activities at once."""
+
+    decorators = [token_required]
+
+    def __init__(self, **kwargs):
+        """Inject dependency for resource."""
+        self.LoggedActivity = kwargs['LoggedActivity']
+        self.db = kwargs['db']
+
+    @roles_required(["success ops"])
+    def put(self):
+        """Put method for rejecting logged activities resource."""
+        payload = request.get_json(silent=True) or {}
+        logged_activities_ids = payload.get('loggedActivitiesIds')
+
+        if not isinstance(logged_activities_ids, list) or \
+                not logged_activities_ids:
+            return response_builder(dict(
+                message='A List/Array with at least one logged activity'
+                        ' id is needed!'), 400)
+
+        results, logged_activities = lock_logged_activities(
+            logged_activities_ids)
+        pending = [logged_activity for logged_activity in logged_activities
+                   if logged_activity.status == 'pending']
+        for logged_activity in logged_activities:
+            results[str(logged_activity.uuid)] = 'rejected' \
+                if logged_activity.status == 'pending' else 'skipped'
+        results = [dict(id=logged_activity_id, result=result)
+                   for logged_activity_id, result in results.items()]
+
+        if not pending:
+            return response_builder(dict(
+                status='fail',
+                results=results,
+                message='invalid logged_activities_ids or no pending '
+                        'logged activities'), 400)
+
+        change_status(pending, 'rejected')
+        record_rejections(pending)
+
+        # Send one notification via Slack to each society's Secretary
+        societies = OrderedDict()
+        for logged_activity in pending:
+            societies.setdefault(logged_activity.society, []).append(
+                logged_activity)
+        for society, rejected in societies.items():
+            lines = [f"- {logged_activity.value} points logged on "
+                     f"{logged_activity.activity_date}, described as "
+                     f"*{logged_activity.description}*"
+                     for logged_activity in rejected]
+            message = f"REJECTED! Success Ops have rejected these {society.name} " + \
+                      "activities which you had previously approved:"
+            queue_slack_role("society secretary",
+                             "\n".join([message] + lines),
+                             society_id=society.uuid)
+
+        data = logged_activities_schema.dump(pending).data
+        self.db.session.commit()
+
+        return response_builder(dict(
+            data=data,
+            results=results,
+            message='Activities successfully rejected'),
+            200)
@@ -2,14 +2,19 @@ from flask_restful import Resource
 from flask import request, g
 
 from api.services.auth import token_required, roles_required
+from api.services.outbox import queue_slack, queue_slack_role
+from api.services.points import record_rejections, withdraw_rejections
 from api.utils.helpers import response_builder
-from api.models import Role, User
-from api.services.slack_notify import SlackNotification
 
-from .marshmallow_schemas import single_logged_activity_schema
+from .helpers import change_status, group_by_owner, lock_logged_activities
+from .marshmallow_schemas import (
+    logged_activities_schema, single_logged_activity_schema)
 
+# statuses a secretary may move a logged activity out of
+REVIEWABLE_STATUSES = ('in review', 'pending', 'rejected')
 
-class SecretaryReviewLoggedActivityAPI(Resource, SlackNotification):
+
+class SecretaryReviewLoggedActivityAPI(Resource):
     """Enable society secretary to verify logged activities."""
 
     decorators = [token_required]
@@ -17,7 +22,6 @@ class SecretaryReviewLoggedActivityAPI(Resource, SlackNotification):
     def __init__(self, **kwargs):
         """Inject dependency for resource."""
         self.LoggedActivity = kwargs['LoggedActivity']
-        SlackNotification.__init__(self)
 
     @roles_required(['society secretary'])
     def put(self, logged_activity_id):
@@ -29,7 +33,7 @@ class SecretaryReviewLoggedActivityAPI(Resource, SlackNotification):
                                     400)
 
         logged_activity = self.LoggedActivity.query.filter_by(
-            uuid=logged_activity_id).first()
+            uuid=logged_activity_id).with_for_update().first()
         if not logged_activity:
             return response_builder(dict(message='Logged activity not found'),
                                     404)
@@ -45,38 +49,151 @@ class SecretaryReviewLoggedActivityAPI(Resource, SlackNotification):
             return response_builder(dict(message='Invalid status value.'),
                                     400)
 
+        if logged_activity.status not in REVIEWABLE_STATUSES:
+            return response_builder(dict(
+                message=f"Logged activity can't be {payload.get('status')} "
+                        f"once it is {logged_activity.status}."),
+                409)
+
         # Send notification to success-ops
-        roles = User.query.filter(User.roles.any(Role.name=="success ops")).all()
-        users = User.query.all()
         message = f"The society secretary for {logged_activity.society.name} has approved an activity " + \
                   f"worth {logged_activity.value} points. Go to https://societies.andela.com/u/verify-activities to approve or reject these points" # noqa: E501
 
+        was_rejected = logged_activity.status == "rejected"
         logged_activity.status = payload.get('status')
         if logged_activity.status == "pending":
+            if was_rejected:
+                withdraw_rejections([logged_activity])
             # Send approved notification to success-ops
-            SlackNotification.send_notification(self, roles, users, message)
+            queue_slack_role("success ops", message)
 
             # Send approved notification to the respective fellow
             user_email = logged_activity.user.email
 
             message = f"APPROVED. Your activity points for {logged_activity.description} logged " + \
                       f"on {logged_activity.activity_date} have been approved by your Society's Secretary."
-            slack_id = SlackNotification.get_slack_id(self, user_email)
-            SlackNotification.send_message(self, message, slack_id)
+            queue_slack(user_email, message)
 
 
        # Send notification to a fellow
         if logged_activity.status == "rejected":
+            if not was_rejected:
+                record_rejections([logged_activity])
             user_email = logged_activity.user.email
 
             message = f"Your logged society points worth {logged_activity.value} described as " + \
                       f"{logged_activity.description} have been rejected by your Society's Secretary"
-            slack_id = SlackNotification.get_slack_id(self, user_email)
-            SlackNotification.send_message(self, message, slack_id)
+            queue_slack(user_email, message)
+
+        data = single_logged_activity_schema.dump(logged_activity).data
+        if not logged_activity.save():
+            return response_builder(dict(
+                message='Logged activity could not be updated, try again.'),
+                409)
+
+        return response_builder(
+            dict(data=data,
+                 message="successfully changed status"),
+            200)
+
+
+class BulkSecretaryReviewAPI(Resource):
+    """Enable society secretary to verify many logged activities at once."""
+
+    decorators = [token_required]
+
+    def __init__(self, **kwargs):
+        """Inject dependency for resource."""
+        self.LoggedActivity = kwargs['LoggedActivity']
+        self.db = kwargs['db']
+
+    @roles_required(['society secretary'])
+    def put(self):
+        """Put method on logged activities resource."""
+        payload = request.get_json(silent=True) or {}
+        logged_activities_ids = payload.get('loggedActivitiesIds')
+        status = payload.get('status')
+
+        if not isinstance(logged_activities_ids, list) or \
+                not logged_activities_ids:
+            return response_builder(dict(
+                message='A List/Array with at least one logged activity'
+                        ' id is needed!'), 400)
+
+        if status not in ['pending', 'rejected']:
+            return response_builder(dict(message='Invalid status value.'),
+                                    400)
 
-        logged_activity.save()
+        society = g.current_user.society
+        results, logged_activities = lock_logged_activities(
+            logged_activities_ids)
+
+        foreign = [logged_activity for logged_activity in logged_activities
+                   if not society or logged_activity.society_id != society.uuid]
+        if foreign:
+            societies = ', '.join(sorted({logged_activity.society.name
+                                          for logged_activity in foreign}))
+            return response_builder(dict(
+                message=f"Permission denied, you are not a secretary of {societies}",
+                loggedActivitiesIds=[logged_activity.uuid
+                                     for logged_activity in foreign]
+                ),
+                403)
+
+        changed = []
+        for logged_activity in logged_activities:
+            if logged_activity.status in REVIEWABLE_STATUSES and \
+                    logged_activity.status != status:
+                changed.append(logged_activity)
+                results[str(logged_activity.uuid)] = status
+            else:
+                results[str(logged_activity.uuid)] = 'skipped'
+        results = [dict(id=logged_activity_id, result=result)
+                   for logged_activity_id, result in results.items()]
+
+        if not changed:
+            return response_builder(dict(
+                status='fail',
+                results=results,
+                message='invalid logged_activities_ids or no logged '
+                        'activities to review'), 400)
+
+        unrejected = [logged_activity for logged_activity in changed
+                      if logged_activity.status == 'rejected']
+        change_status(changed, status)
+        if status == 'rejected':
+            record_rejections(changed)
+        else:
+            withdraw_rejections(unrejected)
+        self.queue_notifications(society, changed, status)
+        data = logged_activities_schema.dump(changed).data
+        self.db.session.commit()
 
         return response_builder(
-            dict(data=single_logged_activity_schema.dump(logged_activity).data,
+            dict(data=data, results=results,
                  message="successfully changed status"),
             200)
+
+    @staticmethod
+    def queue_notifications(society, logged_activities, status):
+        """Queue one message per recipient for the reviewed activities."""
+        if status == 'pending':
+            points = sum(logged_activity.value
+                         for logged_activity in logged_activities)
+            queue_slack_role(
+                "success ops",
+                f"The society secretary for {society.name} has approved "
+                f"{len(logged_activities)} activities worth {points} points. "
+                f"Go to https://societies.andela.com/u/verify-activities to approve or reject these points") # noqa: E501
+            heading = "APPROVED. Your activity points for these activities " \
+                      "have been approved by your Society's Secretary:"
+        else:
+            heading = "These logged society points have been rejected by " \
+                      "your Society's Secretary:"
+
+        for user_email, owned in group_by_owner(logged_activities).items():
+            lines = [f"- {logged_activity.description} logged on "
+                     f"{logged_activity.activity_date}, worth "
+                     f"{logged_activity.value} points"
+                     for logged_activity in owned]
+            queue_slack(user_email, "\n".join([heading] + lines))
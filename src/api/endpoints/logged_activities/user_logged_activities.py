@@ -1,12 +1,13 @@
 from flask_restful import Resource
 from flask import g
+from sqlalchemy.orm import joinedload
 
 from api.services.auth import token_required
+from api.services.points import points_summary
 from api.utils.helpers import response_builder, find_d_level
 
+from .helpers import with_serialization_relations
 from .marshmallow_schemas import user_logged_activities_schema
-from .models import db
-from api.endpoints.societies.models import Society
 
 
 class UserLoggedActivitiesAPI(Resource):
@@ -21,28 +22,24 @@ class UserLoggedActivitiesAPI(Resource):
 
     def get(self, user_id):
         """Get a user's logged activities by user_id URL parameter."""
-        user = self.User.query.get(user_id)
+        user = self.User.query.options(
+            joinedload(self.User.society)).get(user_id)
         if not user:
             return response_builder(dict(message="User not found"), 404)
 
         message = "Logged activities fetched successfully"
-        user_logged_activities = user.logged_activities.all()
+        user_logged_activities = with_serialization_relations(
+            user.logged_activities).all()
 
         if not user_logged_activities:
             message = "There are no logged activities for that user."
 
-        points_earned = db.session.query(
-            db.func.sum(self.LoggedActivity.value)
-        ).filter(
-            self.LoggedActivity.user_id == user_id,
-            self.LoggedActivity.status == 'approved'
-        ).scalar()
+        points = points_summary('user', user_id, breakdown=False)
 
         data = user_logged_activities_schema.dump(
                 user_logged_activities
             ).data
-        # Fetch societies data
-        society = Society.query.get(user.society_id)
+        society = user.society
 
         # Fetch D-level info
         user_level = find_d_level(g.current_user_token, user_id)
@@ -52,7 +49,7 @@ class UserLoggedActivitiesAPI(Resource):
             societyId=user.society.uuid if user.society else None,
             activitiesLogged=len(user_logged_activities),
             level=user_level,
-            pointsEarned=points_earned if points_earned else 0,
+            pointsEarned=points['points'],
             usedPoints=society.used_points,
             remainingPoints=society.remaining_points,
             message=message
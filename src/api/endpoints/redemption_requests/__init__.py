@@ -2,7 +2,7 @@
 
 
 def redemption_bp(Api, Blueprint, emit_email_event, mail):
-    from api.models import Center, Society, Role
+    from api.models import Center, Society, Role, base
     from .models import RedemptionRequest
     from .redemption_points import PointRedemptionAPI
     from .redemption_numeration import RedemptionRequestNumeration
@@ -36,7 +36,8 @@ def redemption_bp(Api, Blueprint, emit_email_event, mail):
             'RedemptionRequest': RedemptionRequest,
             'Society': Society,
             'email': emit_email_event,
-            'mail': mail
+            'mail': mail,
+            'db': base.db
         }
     )
 
@@ -49,7 +50,8 @@ def redemption_bp(Api, Blueprint, emit_email_event, mail):
             'RedemptionRequest': RedemptionRequest,
             'email': emit_email_event,
             'mail': mail,
-            'Role': Role
+            'Role': Role,
+            'db': base.db
         }
     )
     return redemption_bp_service
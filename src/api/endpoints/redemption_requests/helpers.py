@@ -1,5 +1,8 @@
 from flask import g
+from sqlalchemy.orm import joinedload
 
+from api.models import Center, Society, User
+from api.utils.filters import DateRange, Filter, FilterSet, Range
 from api.utils.helpers import response_builder
 from api.utils.marshmallow_schemas import basic_info_schema
 
@@ -7,13 +10,58 @@ from api.utils.marshmallow_schemas import basic_info_schema
 from .marshmallow_schemas import redemption_schema
 from .models import RedemptionRequest
 
+redemption_filters = FilterSet(
+    Filter('society', Society.name, joins=[RedemptionRequest.society]),
+    Filter('status', RedemptionRequest.status),
+    Filter('name', RedemptionRequest.name),
+    Filter('center', Center.name, joins=[RedemptionRequest.center]),
+    DateRange('startDate', 'endDate', RedemptionRequest.created_at),
+    Range('minValue', 'maxValue', RedemptionRequest.value)
+)
+
+# status -> statuses a redemption request can move to from it
+REDEMPTION_TRANSITIONS = {
+    'pending': ('approved', 'rejected'),
+    'approved': ('completed',),
+}
+
+
+def lock_redemption(redeem_id):
+    """Load and lock a redemption request with the relations it notifies.
+
+    The row stays locked until the transaction ends, so concurrent reviews
+    of the same request wait and then see its new status.
+    """
+    return RedemptionRequest.query.options(
+        joinedload(RedemptionRequest.user).joinedload(User.society),
+        joinedload(RedemptionRequest.society)
+    ).filter(
+        RedemptionRequest.uuid == redeem_id
+    ).with_for_update(of=RedemptionRequest).populate_existing().one_or_none()
+
+
+def transition_error(redemption, status):
+    """Return a 409 response if redemption can't move to status, else None."""
+    if status in REDEMPTION_TRANSITIONS.get(redemption.status, ()):
+        return None
+    return response_builder(dict(
+        status="fail",
+        message="RedemptionRequest can't be {} once it is {}.".format(
+            status, redemption.status)
+    ), 409)
+
 
 def get_redemption_request(redeem_id):
-    if "society president" in [role.name for role in g.current_user.roles]:
-        redemp_request = g.current_user.society.redemptions.filter_by(
-            uuid=redeem_id).one_or_none()
-    else:
-        redemp_request = RedemptionRequest.query.get(redeem_id)
+    """Load and lock a pending redemption request the user may change.
+
+    The status is checked once the row is locked, so an edit can't race a
+    review of the same request.
+    """
+    redemp_request = lock_redemption(redeem_id)
+    if redemp_request and \
+            "society president" in g.auth_context.role_names and \
+            redemp_request.society_id != g.current_user.society_id:
+        redemp_request = None
     if not redemp_request:
         return response_builder(dict(
             status="fail",
@@ -40,13 +88,43 @@ def serialize_redmp(redemption):
 
 
 def serialize_redemptions(redemptions):
-    """To serialize a list of redemptions."""
-    return map(serialize_redmp, redemptions)
+    """To serialize a list of redemptions.
+
+    The users with their societies and the centers of all the redemptions
+    are loaded with one query each and every one of them is dumped once,
+    instead of lazy loading and dumping them for every redemption.
+
+    Return:
+        list of dicts shaped like serialize_redmp's
+    """
+    redemptions = list(redemptions)
+    user_ids = {redemption.user_id for redemption in redemptions}
+    center_ids = {redemption.center_id for redemption in redemptions}
+
+    users, societies = {}, {}
+    if user_ids:
+        for user in User.query.options(joinedload(User.society)).filter(
+                User.uuid.in_(user_ids)):
+            users[user.uuid] = basic_info_schema.dump(user).data
+            societies[user.uuid] = basic_info_schema.dump(user.society).data
+    centers = {
+        center.uuid: basic_info_schema.dump(center).data
+        for center in Center.query.filter(Center.uuid.in_(center_ids))
+    } if center_ids else {}
+
+    data = []
+    for redemption in redemptions:
+        serial_data, _ = redemption_schema.dump(redemption)
+        serial_data["user"] = users.get(redemption.user_id, {})
+        serial_data["society"] = societies.get(redemption.user_id, {})
+        serial_data["center"] = centers.get(redemption.center_id, {})
+        data.append(serial_data)
+    return data
 
 
 def non_paginated_redemptions(redemptions):
     """To package a list of serialized redemptions."""
-    data = list(serialize_redemptions(redemptions))
+    data = serialize_redemptions(redemptions)
     return dict(
         message="fetched successfully.",
         pages=1,
@@ -1,5 +1,5 @@
 from api.utils.marshmallow_schemas import BaseSchema
-from marshmallow import fields
+from marshmallow import fields, validate
 
 
 class RedemptionRequestSchema(BaseSchema):
@@ -14,6 +14,8 @@ class RedemptionRequestSchema(BaseSchema):
     value = fields.Integer(
         load_from='points',
         required=True,
+        validate=[validate.Range(
+            min=1, error='Points must be greater than 0.')],
         error_messages={
             'required': {'message': 'A value is required.'}
         })
@@ -28,7 +30,8 @@ class EditRedemptionRequestSchema(BaseSchema):
     """Edit RedemptionRequest validator."""
 
     name = fields.String()
-    value = fields.Integer()
+    value = fields.Integer(validate=[validate.Range(
+        min=1, error='Points must be greater than 0.')])
     status = fields.String()
     comment = fields.String()
     rejection_reason = fields.String(load_from='rejection')
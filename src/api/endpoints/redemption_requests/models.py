@@ -1,4 +1,5 @@
-from api.models.base import Base
+from api.endpoints.societies.models import Society
+from api.models.base import Base, GUID
 
 
 db = Base.db
@@ -8,13 +9,19 @@ class RedemptionRequest(Base):
     """Model all redemption requests by Society Presidents."""
 
     __tablename__ = 'redemptions'
+    __table_args__ = (
+        db.Index('ix_redemptions_society_id_status', 'society_id', 'status'),
+        db.Index('ix_redemptions_center_id_status', 'center_id', 'status'),
+        db.Index('ix_redemptions_created_at_uuid', 'created_at', 'uuid'),
+    )
 
+    id_type = GUID
     user_id = db.Column(
         db.String, db.ForeignKey('users.uuid'),
         nullable=False
     )
     society_id = db.Column(
-        db.String, db.ForeignKey('societies.uuid'),
+        GUID, db.ForeignKey('societies.uuid'),
         nullable=False
     )
     center_id = db.Column(
@@ -26,6 +33,8 @@ class RedemptionRequest(Base):
     status = db.Column(db.String, default="pending", nullable=False)
     comment = db.Column(db.String)
     rejection = db.Column(db.String)
+    # points of the society held for this request while it is pending
+    reserved_points = db.Column(db.Integer, nullable=False, default=0)
 
     user = db.relationship(
         'User',
@@ -39,3 +48,27 @@ class RedemptionRequest(Base):
         'Center',
         back_populates='redemption_requests'
     )
+
+    def hold_points(self, value):
+        """Make the request hold value points of its society.
+
+        Only the difference with what the request already holds is
+        reserved or released.
+
+        Return:
+            True if the society had enough remaining points
+        """
+        held = self.reserved_points or 0
+        # the society may only be related and not flushed yet
+        society_id = self.society_id or self.society.uuid
+        if value > held:
+            if not Society.reserve_points(society_id, value - held):
+                return False
+        elif value < held:
+            Society.release_points(society_id, held - value)
+        self.reserved_points = value
+        return True
+
+    def release_points(self):
+        """Give back all the points the request holds."""
+        self.hold_points(0)
@@ -6,22 +6,27 @@ from flask_restful import Resource
 from api.services.auth import token_required, roles_required
 from api.utils.helpers import response_builder
 from api.utils.marshmallow_schemas import basic_info_schema
-from api.services.slack_notify import SlackNotification
-from api.models import Role, User
+from api.services.finance import finance_routing
+from api.services.idempotency import (
+    idempotency_key, remember_response, stored_response)
+from api.services.outbox import queue_batch, queue_email, queue_slack
+from api.services.points import record_redeemed, record_redemption
 
 
 # import from this package
-from .helpers import serialize_redmp
+from .helpers import lock_redemption, serialize_redmp, transition_error
 from .marshmallow_schemas import edit_redemption_request_schema
 
 
-class RedemptionRequestNumeration(Resource, SlackNotification):
+class RedemptionRequestNumeration(Resource):
     """
     Approve or reject Redemption Requests.
 
     After approval or rejection the relevant society get the result of the
     request reflects on the amount of points.
     Only done by success ops.
+    Requests sent with an Idempotency-Key header are applied once, retries
+    get the first response back.
     """
 
     def __init__(self, **kwargs):
@@ -30,7 +35,7 @@ class RedemptionRequestNumeration(Resource, SlackNotification):
         self.Society = kwargs['Society']
         self.email = kwargs['email']
         self.mail = kwargs['mail']
-        SlackNotification.__init__(self)
+        self.db = kwargs['db']
 
     @token_required
     @roles_required(["success ops", "cio"])
@@ -53,7 +58,7 @@ class RedemptionRequestNumeration(Resource, SlackNotification):
                 status="fail",
                 message="RedemptionRequest id must be provided."), 400)
 
-        redemp_request = self.RedemptionRequest.query.get(redeem_id)
+        redemp_request = lock_redemption(redeem_id)
         if not redemp_request:
             return response_builder(dict(
                 data=None,
@@ -61,84 +66,72 @@ class RedemptionRequestNumeration(Resource, SlackNotification):
                 message="Resource does not exist."
             ), 404)
 
+        key = idempotency_key()
+        if key:
+            try:
+                replay = stored_response(key)
+            except ValueError as error:
+                return response_builder(dict(
+                    status="fail",
+                    message=str(error)
+                ), 422)
+            if replay is not None:
+                return replay
+
         status = result.get("status")
         comment = result.get("comment")
         rejection_reason = result.get("rejection") or \
             result.get('rejection_reason')
 
+        if status in ("approved", "rejected"):
+            conflict = transition_error(redemp_request, status)
+            if conflict:
+                return conflict
+
         if status == "approved":
-            user = redemp_request.user
-            society = self.Society.query.get(user.society_id)
-            society.used_points = redemp_request
+            record_redeemed(redemp_request)
+            record_redemption(redemp_request)
             redemp_request.status = status
 
-            # Send slack notification to finance users
-            finance_users = User.query.filter(User.roles.any(Role.name=="finance")).all()
-            for user in finance_users:
-                if user.center_id == redemp_request.center_id:
-                    user_email = user.email
-                    message = f"Redemption Request on *{redemp_request.name}* for " + \
-                              f"*{redemp_request.society.name}* has been " + \
-                              f"approved. Click the link: " + \
-                              f"{request.host_url + 'api/v1/societies/redeem/' + redeem_id} " + \
-                              f"to view more details"
-                    slack_id = SlackNotification.get_slack_id(self, user_email)
-                    SlackNotification.send_message(self, message, slack_id)
-                else:
-                    pass
-
-            # Get the relevant Finance Center to respond on RedemptionRequest
-            center_emails = {"kampala": ".finance@andela.com"}
-            finance_email = redemp_request.center.name.lower() + \
-                center_emails.get(
-                redemp_request.center.name.lower(),
-                "-finance@andela.com"
-                )
+            link = request.host_url + 'api/v1/societies/redeem/' + redeem_id
+            society_name = redemp_request.user.society.name
+            finance = finance_routing.recipients(redemp_request.center_id)
 
-            email_payload = dict(
+            # Slack the center's finance users, email its finance mailboxes
+            finance_message = f"Redemption Request on *{redemp_request.name}* for " + \
+                f"*{redemp_request.society.name}* has been " + \
+                f"approved. Click the link: {link} " + \
+                f"to view more details"
+            finance_email = dict(
                 sender=current_app.config["SENDER_CREDS"],
-                subject="RedemptionRequest for {}".format(
-                    redemp_request.user.society.name),
+                subject="RedemptionRequest for {}".format(society_name),
                 message="Redemption Request on {} has been approved. Click "
                 "the link below <a href='{}'>here</a> to view more "
-                "details.".format(
-                    redemp_request.name,
-                    request.host_url + 'api/v1/societies/redeem/' +
-                    redeem_id
-                ),
-                recipients=[finance_email]
+                "details.".format(redemp_request.name, link),
+                recipients=finance.emails
             )
 
-            self.email.send(
-                current_app._get_current_object(),
-                payload=email_payload,
-                mail=self.mail
-            )
-
-            email_payload = dict(
+            president_email = dict(
                 sender=current_app.config["SENDER_CREDS"],
-                subject="RedemptionRequest for {}".format(
-                    redemp_request.user.society.name),
+                subject="RedemptionRequest for {}".format(society_name),
                 message="Redemption Request on {} has been approved. Finance"
                 " will be in touch.".format(redemp_request.name),
                 recipients=[redemp_request.user.email]
             )
 
             # Send Slack notification to Society President
-            message = f"Redemption Request on" + \
-                      f" *{redemp_request.name}* worth *{redemp_request.value}* points" + \
-                      f" has been approved." + \
-                      f" Finance will be in touch"
-            user_email = redemp_request.user.email
-            slack_id = SlackNotification.get_slack_id(self, user_email)
-            SlackNotification.send_message(self, message, slack_id)
-
-            self.email.send(
-                current_app._get_current_object(),
-                payload=email_payload,
-                mail=self.mail
-            )
+            president_message = f"Redemption Request on" + \
+                f" *{redemp_request.name}* worth *{redemp_request.value}* points" + \
+                f" has been approved." + \
+                f" Finance will be in touch"
+
+            queue_batch(
+                emails=[finance_email, president_email],
+                slack=[(user_email, finance_message)
+                       for user_email in finance.slack] +
+                      [(redemp_request.user.email, president_message)])
         elif status == "rejected":
+            redemp_request.release_points()
             redemp_request.status = status
             redemp_request.rejection = rejection_reason
             email_payload = dict(
@@ -156,14 +149,9 @@ class RedemptionRequestNumeration(Resource, SlackNotification):
                       f" has been rejected for this" + \
                       f" reason: *{rejection_reason}*"
             user_email = redemp_request.user.email
-            slack_id = SlackNotification.get_slack_id(self, user_email)
-            SlackNotification.send_message(self, message, slack_id)
+            queue_slack(user_email, message)
 
-            self.email.send(
-                current_app._get_current_object(),
-                payload=email_payload,
-                mail=self.mail
-            )
+            queue_email(email_payload)
         elif comment:
             email_payload = dict(
                 sender=current_app.config["SENDER_CREDS"],
@@ -173,12 +161,7 @@ class RedemptionRequestNumeration(Resource, SlackNotification):
                 recipients=[redemp_request.user.email]
             )  # cover for requesting more information
 
-            self.email.send(
-                current_app._get_current_object(),
-                payload=email_payload,
-                mail=self.mail
-            )
-
+            queue_email(email_payload)
         else:
             return response_builder(dict(
                 status="Failed",
@@ -186,15 +169,23 @@ class RedemptionRequestNumeration(Resource, SlackNotification):
             ), 400)
 
         redemp_request.comment = comment or redemp_request.comment
-        redemp_request.save()
+        self.db.session.flush()
         mes = f"Redemption request status changed to {status}."
 
         serialized_redemption = serialize_redmp(redemp_request)
         serialized_approved_by, _ = basic_info_schema.dump(g.current_user)
         serialized_redemption["approvedBy"] = serialized_approved_by
 
-        return response_builder(dict(
+        data = dict(
             status="success",
             data=serialized_redemption,
             message=mes
-        ), 200)
+        )
+        response = remember_response(key, data) if key else \
+            response_builder(data, 200)
+        if not redemp_request.save():
+            return response_builder(dict(
+                status="fail",
+                message="RedemptionRequest could not be updated, try again."
+            ), 409)
+        return response
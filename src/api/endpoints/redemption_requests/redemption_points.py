@@ -3,10 +3,11 @@ from flask import request, g, current_app
 from flask_restful import Resource
 
 # from other packages
+from api.utils.export import export_format, stream_export
 from api.utils.helpers import find_item, paginate_items, response_builder
 from api.services.auth import token_required, roles_required
 from api.utils.marshmallow_schemas import basic_info_schema
-from api.services.slack_notify import SlackNotification
+from api.services.slack_notify import SlackNotification, role_member_emails
 
 # from within this package
 from .marshmallow_schemas import (
@@ -15,8 +16,10 @@ from .marshmallow_schemas import (
     edit_redemption_request_schema)
 from .helpers import (
     serialize_redmp,
+    serialize_redemptions,
     get_redemption_request,
-    non_paginated_redemptions)
+    non_paginated_redemptions,
+    redemption_filters)
 
 
 class PointRedemptionAPI(Resource, SlackNotification):
@@ -51,13 +54,6 @@ class PointRedemptionAPI(Resource, SlackNotification):
         if errors:
             return response_builder(errors, 400)
 
-        if result.get('value') > g.current_user.society.remaining_points:
-            return response_builder(dict(
-                message="Redemption request value exceeds your society's "
-                        "remaining points",
-                status="fail"
-            ), 403)
-
         # bug fix this nigeria -> lagos
         if result.get('center') == 'nigeria':
             result['center'] = 'lagos'
@@ -65,22 +61,37 @@ class PointRedemptionAPI(Resource, SlackNotification):
         center = self.Center.query.filter_by(name=result.get('center')).first()
 
         if center:
+            # checked and held in one statement so requests can't overdraw
+            if not self.Society.reserve_points(
+                    g.current_user.society_id, result.get('value')):
+                return response_builder(dict(
+                    message="Redemption request value exceeds your society's "
+                            "remaining points",
+                    status="fail"
+                ), 403)
+
             redemp_request = self.RedemptionRequest(
                 name=result.get('name'),
                 value=result.get('value'),
                 description=result.get('description'),
                 user=g.current_user,
                 center=center,
-                society=g.current_user.society
+                society_id=g.current_user.society_id,
+                reserved_points=result.get('value')
             )
-            redemp_request.save()
+            # a failed insert also rolls the reservation back
+            if not redemp_request.save():
+                return response_builder(dict(
+                    status="fail",
+                    message="RedemptionRequest could not be created, try "
+                            "again."
+                ), 409)
             data, _ = redemption_schema.dump(redemp_request)
             data["center"], _ = basic_info_schema.dump(center)
 
-            CIO = self.Role.query.filter_by(name='cio').first()
-            user_list = [user.email for user in CIO.users]
+            user_list = sorted(role_member_emails('cio'))
 
-            if CIO and CIO.users.all():  # TODO Add logging here
+            if user_list:  # TODO Add logging here
                 email_payload = dict(
                     sender=g.current_user.email,
                     subject="RedemptionRequest for {}".format(
@@ -102,8 +113,7 @@ class PointRedemptionAPI(Resource, SlackNotification):
                 message = f"Redemption Request for {g.current_user.society.name}," + \
                           f" worth {redemp_request.value} points has been created." + \
                           f" Redemption Request reason: *{redemp_request.name}*"
-                slack_id = SlackNotification.get_slack_id(self, user)
-                SlackNotification.send_message(self, message, slack_id)
+                self.notify(user, message)
 
             return response_builder(dict(
                 message="Redemption request created. Success Ops will be in"
@@ -149,7 +159,13 @@ class PointRedemptionAPI(Resource, SlackNotification):
 
         if name:
             redemp_request.name = name
-        if value:
+        if value and value != redemp_request.value:
+            if not redemp_request.hold_points(value):
+                return response_builder(dict(
+                    message="Redemption request value exceeds your "
+                            "society's remaining points",
+                    status="fail"
+                ), 403)
             redemp_request.value = value
         if desc:
             redemp_request.description = desc
@@ -174,34 +190,28 @@ class PointRedemptionAPI(Resource, SlackNotification):
         if redeem_id:
             redemp_request = redemp_request.get(redeem_id)
             return find_item(redemp_request)
-        else:
 
-            if request.args.get('society'):
-                search_term_name = request.args.get('society')
-                society = self.Society.query.filter_by(
-                    name=search_term_name).first()
-                if not society:
-                    mes = f"Society with name:{search_term_name} not found"
-                    return {"message": mes}, 400
-                redemp_request = redemp_request.filter_by(
-                    society_id=society.uuid)
-            elif request.args.get('status'):
-                search_term_status = request.args.get('status')
-                redemp_request = redemp_request.filter_by(
-                    status=search_term_status)
-            elif request.args.get('name'):
-                search_term_name = request.args.get('name')
-                redemp_request = redemp_request.filter_by(
-                    name=search_term_name)
-            elif request.args.get("center"):
-                search_term_center = request.args.get("center")
-                center_query = self.Center.query.filter_by(
-                    name=search_term_center).first()
-                if not center_query:
-                    mes = f"country with name:{search_term_center} not found"
-                    return {"message": mes}, 400
-                redemp_request = redemp_request.filter_by(
-                    center=center_query)
+        # any of the filters can be combined into one statement
+        try:
+            redemp_request = redemption_filters.apply(
+                redemp_request, request.args)
+        except ValueError as error:
+            return response_builder(dict(status="fail",
+                                         message=str(error)), 400)
+
+        if not paginate:
+            try:
+                export = export_format(request.args)
+            except ValueError as error:
+                return response_builder(dict(status="fail",
+                                             message=str(error)), 400)
+            if export:
+                return stream_export(
+                    redemp_request.order_by(
+                        self.RedemptionRequest.created_at,
+                        self.RedemptionRequest.uuid),
+                    serialize_redemptions,
+                    export, 'redemptions')
 
         return (paginate_items(redemp_request)
                 if paginate else non_paginated_redemptions(redemp_request))
@@ -219,6 +229,7 @@ class PointRedemptionAPI(Resource, SlackNotification):
         if not isinstance(redemp_request, self.RedemptionRequest):
             return redemp_request
 
+        redemp_request.release_points()
         redemp_request.delete()
         return response_builder(dict(
             status="success",
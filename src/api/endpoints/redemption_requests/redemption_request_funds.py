@@ -4,20 +4,25 @@ from flask_restful import Resource
 
 # imports from other packages
 from api.services.auth import token_required, roles_required
+from api.services.idempotency import (
+    idempotency_key, remember_response, stored_response)
 from api.utils.helpers import response_builder
 from api.utils.marshmallow_schemas import basic_info_schema
-from api.services.slack_notify import SlackNotification
+from api.services.outbox import queue_email, queue_slack
+from api.services.slack_notify import role_member_emails
 
 # import from this package
-from .helpers import serialize_redmp
+from .helpers import lock_redemption, serialize_redmp, transition_error
 
 
-class RedemptionRequestFunds(Resource, SlackNotification):
+class RedemptionRequestFunds(Resource):
     """
     Mark Redemption Requests are complete.
 
     The Finance Department marks the redemption request as complete once the
-    funds have been sent out.
+    funds have been sent out. Only approved requests can be completed.
+    Notifications go through the outbox so they are only delivered if the
+    completion is committed.
     """
 
     decorators = [token_required]
@@ -28,7 +33,7 @@ class RedemptionRequestFunds(Resource, SlackNotification):
         self.email = kwargs['email']
         self.mail = kwargs['mail']
         self.Role = kwargs['Role']
-        SlackNotification.__init__(self)
+        self.db = kwargs['db']
 
     @roles_required(["finance"])
     def put(self, redeem_id=None):
@@ -46,7 +51,7 @@ class RedemptionRequestFunds(Resource, SlackNotification):
                 status="fail",
                 message="RedemptionRequest id must be provided."), 400)
 
-        redemp_request = self.RedemptionRequest.query.get(redeem_id)
+        redemp_request = lock_redemption(redeem_id)
         if not redemp_request:
             return response_builder(dict(
                 data=None,
@@ -54,13 +59,28 @@ class RedemptionRequestFunds(Resource, SlackNotification):
                 message="Resource does not exist."
             ), 404)
 
+        key = idempotency_key()
+        if key:
+            try:
+                replay = stored_response(key)
+            except ValueError as error:
+                return response_builder(dict(
+                    status="fail",
+                    message=str(error)
+                ), 422)
+            if replay is not None:
+                return replay
+
         status = payload.get("status")
 
         if status == "completed":
+            conflict = transition_error(redemp_request, status)
+            if conflict:
+                return conflict
             redemp_request.status = status
 
-            CIO = self.Role.query.filter_by(name='cio').first()
-            if CIO and CIO.users.all():  # TODO Add logging here
+            cio_emails = sorted(role_member_emails('cio'))
+            if cio_emails:  # TODO Add logging here
                 email_payload = dict(
                     sender=current_app.config["SENDER_CREDS"],
                     subject="RedemptionRequest for {}".format(
@@ -68,15 +88,10 @@ class RedemptionRequestFunds(Resource, SlackNotification):
                     message="Redemption Request on {} has been completed. Finance"
                     " has wired the money to the reciepient.".format(
                         redemp_request.name),
-                    recipients=([user.email for user in CIO.users]
-                                + [redemp_request.user.email])
+                    recipients=cio_emails + [redemp_request.user.email]
                 )
 
-                self.email.send(
-                    current_app._get_current_object(),
-                    payload=email_payload,
-                    mail=self.mail
-                )
+                queue_email(email_payload)
         else:
             return response_builder(dict(
                 status="Failed",
@@ -87,18 +102,25 @@ class RedemptionRequestFunds(Resource, SlackNotification):
         message = f"FUNDS RELEASED! Your redemption request {redemp_request.name} " + \
                   f"worth {redemp_request.value} points has been completed by FINANCE. Funds " + \
                   f"have been wired!"
-        slack_id = SlackNotification.get_slack_id(self, user_email)
-        SlackNotification.send_message(self, message, slack_id)
+        queue_slack(user_email, message)
 
-        redemp_request.save()
+        self.db.session.flush()
         mes = f"Redemption request status changed to {redemp_request.status}."
 
         serialized_redemption = serialize_redmp(redemp_request)
         serialized_completed_by, _ = basic_info_schema.dump(g.current_user)
         serialized_redemption["completedBy"] = serialized_completed_by
 
-        return response_builder(dict(
+        data = dict(
             status="success",
             data=serialized_redemption,
             message=mes
-        ), 200)
+        )
+        response = remember_response(key, data) if key else \
+            response_builder(data, 200)
+        if not redemp_request.save():
+            return response_builder(dict(
+                status="fail",
+                message="RedemptionRequest could not be updated, try again."
+            ), 409)
+        return response
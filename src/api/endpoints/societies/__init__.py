@@ -4,6 +4,8 @@
 def societies_bp(Api, Blueprint):
     from .models import Society
     from .crud import SocietyResource
+    from .society_logged_activities import SocietyLoggedActivitiesAPI
+    from api.endpoints.logged_activities.models import LoggedActivity
 
     societies_bp_service = Blueprint('societies', __name__)
     societies_api = Api(societies_bp_service)
@@ -20,4 +22,16 @@ def societies_bp(Api, Blueprint):
             'Society': Society
         }
     )
+
+    # a society's logged activities, paginated and filterable
+    societies_api.add_resource(
+        SocietyLoggedActivitiesAPI,
+        "/societies/<string:society_id>/logged-activities",
+        "/societies/<string:society_id>/logged-activities/",
+        endpoint="society_logged_activities",
+        resource_class_kwargs={
+            'Society': Society,
+            'LoggedActivity': LoggedActivity
+        }
+    )
     return societies_bp_service
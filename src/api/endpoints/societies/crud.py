@@ -1,10 +1,13 @@
 from flask_restful import Resource
-from flask import request
+from flask import current_app, request, url_for
 
 from api.services.auth import token_required, roles_required
+from api.services.points import points_summary
+from api.endpoints.logged_activities.helpers import \
+    with_serialization_relations
 from api.endpoints.logged_activities.marshmallow_schemas import \
     user_logged_activities_schema
-from api.utils.helpers import response_builder, paginate_items
+from api.utils.helpers import response_builder, paginate_items, keyset_page
 from .marshmallow_schemas import society_schema
 
 
@@ -62,11 +65,22 @@ class SocietyResource(Resource):
             return paginate_items(societies)
 
         if society:
-            society_logged_activities = society.logged_activities.all()
+            # only the newest page is embedded, the rest is served by
+            # /societies/<society_id>/logged-activities
+            limit = current_app.config['PAGE_LIMIT']
+            society_logged_activities, _, next_cursor = keyset_page(
+                with_serialization_relations(society.logged_activities),
+                None, limit)
 
             data, _ = society_schema.dump(society)
             data['loggedActivities'], _ = user_logged_activities_schema.dump(
                 society_logged_activities)
+            data['loggedActivitiesSummary'] = points_summary(
+                'society', society.uuid, breakdown=False)
+            data['loggedActivitiesNextUrl'] = url_for(
+                'societies.society_logged_activities',
+                society_id=society.uuid, cursor=next_cursor, limit=limit,
+                _external=True) if next_cursor else None
 
             return response_builder(dict(
                 societyDetails=data,
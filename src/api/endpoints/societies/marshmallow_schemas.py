@@ -8,6 +8,7 @@ class SocietySchema(BaseSchema):
 
     _total_points = fields.Integer(dump_only=True, dump_to='totalPoints')
     _used_points = fields.Integer(dump_only=True, dump_to='usedPoints')
+    reserved_points = fields.Integer(dump_only=True, dump_to='reservedPoints')
     remaining_points = fields.Integer(dump_only=True, dump_to='remainingPoints')
     color_scheme = fields.String(dump_only=True, dump_to='colorScheme')
 
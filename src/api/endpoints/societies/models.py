@@ -1,4 +1,6 @@
-from api.models.base import Base
+from sqlalchemy.orm.attributes import set_committed_value
+
+from api.models.base import Base, GUID
 
 
 db = Base.db
@@ -8,11 +10,14 @@ class Society(Base):
     """Model Societies in Andela."""
 
     __tablename__ = 'societies'
+    id_type = GUID
     name = db.Column(db.String, nullable=False, unique=True)
     color_scheme = db.Column(db.String)
     logo = db.Column(db.String)
     _total_points = db.Column(db.Integer, default=0)
     _used_points = db.Column(db.Integer, default=0)
+    # points held by pending redemption requests
+    _reserved_points = db.Column(db.Integer, default=0)
 
     members = db.relationship('User', back_populates='society', lazy='dynamic')
     logged_activities = db.relationship(
@@ -30,20 +35,85 @@ class Society(Base):
         """Keep track of all society points."""
         return self._total_points
 
-    @total_points.setter
-    def total_points(self, point):
-        self._total_points += point.value
-
     @property
     def used_points(self):
         """Keep track of redeemed points."""
         return self._used_points
 
-    @used_points.setter
-    def used_points(self, redemption_request):
-        self._used_points += redemption_request.value
+    @property
+    def reserved_points(self):
+        """Keep track of points held by pending redemption requests."""
+        return self._reserved_points or 0
 
     @property
     def remaining_points(self):
         """Keep track of points available for redeemption."""
-        return self.total_points - self.used_points
+        return (self.total_points or 0) - (self.used_points or 0) - \
+            self.reserved_points
+
+    @classmethod
+    def reserve_points(cls, society_id, value):
+        """Hold value points of a society for a redemption request.
+
+        The remaining points are checked and the reservation made by a
+        single `UPDATE ... WHERE remaining >= value`, so concurrent requests
+        can't reserve the same points twice.
+
+        Return:
+            True if the society had enough remaining points
+
+        Raises:
+            ValueError: if value isn't positive
+        """
+        if value <= 0:
+            raise ValueError('Only a positive number of points can be '
+                             'reserved.')
+        table = cls.__table__
+        reserved = db.func.coalesce(table.c._reserved_points, 0)
+        remaining = db.func.coalesce(table.c._total_points, 0) - \
+            db.func.coalesce(table.c._used_points, 0) - reserved
+        return cls._move_reserved(society_id, table.update().where(db.and_(
+            table.c.uuid == society_id, remaining >= value
+        )).values(_reserved_points=reserved + value))
+
+    @classmethod
+    def release_points(cls, society_id, value):
+        """Give back value points reserved for a redemption request.
+
+        Raises:
+            ValueError: if value isn't positive or the society doesn't
+                hold that many reserved points
+        """
+        if value <= 0:
+            raise ValueError('Only a positive number of points can be '
+                             'released.')
+        table = cls.__table__
+        reserved = db.func.coalesce(table.c._reserved_points, 0)
+        released = cls._move_reserved(society_id, table.update().where(
+            db.and_(table.c.uuid == society_id, reserved >= value)
+        ).values(_reserved_points=reserved - value))
+        if not released:
+            raise ValueError('Society {} holds fewer than {} reserved '
+                             'points.'.format(society_id, value))
+        return released
+
+    @classmethod
+    def _move_reserved(cls, society_id, statement):
+        """Run a reservation UPDATE and keep a loaded society in step.
+
+        Return:
+            True if the society's row was updated
+        """
+        society = db.session.identity_map.get(
+            db.session.identity_key(cls, society_id))
+        if db.engine.dialect.name != 'postgresql':
+            updated = db.session.execute(statement).rowcount > 0
+            if society is not None:
+                db.session.expire(society, ['_reserved_points'])
+            return updated
+
+        row = db.session.execute(
+            statement.returning(cls.__table__.c._reserved_points)).first()
+        if row is not None and society is not None:
+            set_committed_value(society, '_reserved_points', row[0])
+        return row is not None
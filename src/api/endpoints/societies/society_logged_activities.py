@@ -0,0 +1,55 @@
+from flask_restful import Resource
+from flask import request
+
+from api.services.auth import token_required
+from api.endpoints.logged_activities.helpers import (
+    logged_activity_filters, with_serialization_relations)
+from api.endpoints.logged_activities.marshmallow_schemas import \
+    user_logged_activities_schema
+from api.utils.helpers import response_builder, paginate_items
+
+
+class SocietyLoggedActivitiesAPI(Resource):
+    """Page through the logged activities of a society."""
+
+    decorators = [token_required]
+
+    def __init__(self, **kwargs):
+        """Inject dependencies for resource."""
+        self.Society = kwargs['Society']
+        self.LoggedActivity = kwargs['LoggedActivity']
+
+    def get(self, society_id):
+        """Get a page of a society's logged activities."""
+        if not self.Society.query.get(society_id):
+            return response_builder(dict(
+                data=None,
+                message="Resource does not exist."
+            ), 404)
+
+        query = self.LoggedActivity.query.filter_by(society_id=society_id)
+        try:
+            query = logged_activity_filters.apply(query, request.args)
+            pagination_result = paginate_items(
+                with_serialization_relations(query), serialize=False)
+        except ValueError as error:
+            return response_builder(dict(
+                status="fail",
+                message=str(error)
+            ), 400)
+        data = {
+            "count": pagination_result.count,
+            "page": pagination_result.page,
+            "pages": pagination_result.pages,
+            "previous_url": pagination_result.previous_url,
+            "next_url": pagination_result.next_url,
+            "next_cursor": pagination_result.next_cursor,
+            "loggedActivities": user_logged_activities_schema.dump(
+                pagination_result.data).data
+        }
+
+        return response_builder(dict(
+            data=data,
+            status="success",
+            message="Logged activities fetched successfully"
+        ), 200)
@@ -1,4 +1,4 @@
-from api.models.base import Base
+from api.models.base import Base, GUID
 
 
 db = Base.db
@@ -8,11 +8,14 @@ class User(Base):
     """Models Users."""
 
     __tablename__ = 'users'
+    __table_args__ = (
+        db.Index('ix_users_society_id', 'society_id'),
+    )
 
     name = db.Column(db.String, nullable=False)
     email = db.Column(db.String, nullable=False, unique=True)
 
-    society_id = db.Column(db.String, db.ForeignKey('societies.uuid'))
+    society_id = db.Column(GUID, db.ForeignKey('societies.uuid'))
     center_id = db.Column(db.String, db.ForeignKey('centers.uuid'))
     cohort_id = db.Column(db.String, db.ForeignKey('cohorts.uuid'))
 
@@ -3,11 +3,23 @@ from flask import g, request
 from flask_restful import Resource
 
 from api.services.auth import roles_required, token_required
+from api.models import Center, Cohort, Society
+from api.utils.export import export_format, stream_export
+from api.utils.filters import DateRange, Filter, FilterSet
 from api.utils.helpers import response_builder, paginate_items
 from api.services.auth.helpers import add_extra_user_info
 from api.utils.marshmallow_schemas import basic_info_schema
 
 from .marshmallow_schema import user_schema, users_schema
+from .models import User
+
+user_filters = FilterSet(
+    Filter('society', Society.name, joins=[User.society]),
+    Filter('center', Center.name, joins=[User.center]),
+    Filter('cohort', Cohort.name, joins=[User.cohort]),
+    Filter('name', User.name),
+    DateRange('startDate', 'endDate', User.created_at)
+)
 
 
 class UserAPI(Resource):
@@ -92,22 +104,42 @@ class UsersAPI(Resource):
         """Get all users in the system."""
         paginate = request.args.get("paginate", "true")
         message = "all existing users fetched successfully"
+        try:
+            users = user_filters.apply(self.User.query, request.args)
+        except ValueError as error:
+            return response_builder(dict(status="fail",
+                                         message=str(error)), 400)
 
         if paginate.lower() == "false":
-            users = self.User.query.all()
-            count = self.User.query.count()
-            data = {"count": count}
+            try:
+                export = export_format(request.args)
+            except ValueError as error:
+                return response_builder(dict(status="fail",
+                                             message=str(error)), 400)
+            if export:
+                return stream_export(
+                    users.order_by(self.User.created_at, self.User.uuid),
+                    lambda rows: users_schema.dump(rows).data,
+                    export, 'users')
+
+            users = users.all()
+            data = {"count": len(users)}
         else:
-            users = self.User.query
-            pagination_result = paginate_items(users,
-                                               serialize=False)
+            try:
+                pagination_result = paginate_items(users, serialize=False)
+            except ValueError as error:
+                return response_builder(dict(
+                    status="fail",
+                    message=str(error)
+                ), 400)
             users = pagination_result.data
             data = {
                 "count": pagination_result.count,
                 "page": pagination_result.page,
                 "pages": pagination_result.pages,
                 "previous_url": pagination_result.previous_url,
-                "next_url": pagination_result.next_url
+                "next_url": pagination_result.next_url,
+                "next_cursor": pagination_result.next_cursor
             }
         data.update(dict(
             users=users_schema.dump(
@@ -1,5 +1,9 @@
 from .base import Base
 from .center import Center
+from .finance import FinanceRoute
+from .idempotency import IdempotencyKey
+from .outbox import OutboxMessage
+from .points import PointsAggregate, PointsTransaction
 from api.endpoints.activities.models import Activity
 from api.endpoints.activity_types.models import ActivityType
 from api.endpoints.cohorts.models import Cohort
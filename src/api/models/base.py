@@ -1,9 +1,15 @@
 """Contain All App Models."""
+import os
+import threading
+import time
 import uuid
 from datetime import datetime
 
 from flask_sqlalchemy import SQLAlchemy
+from sqlalchemy.dialects import postgresql
 from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.ext.declarative import declared_attr
+from sqlalchemy.types import CHAR, TypeDecorator
 
 
 db = SQLAlchemy()
@@ -13,6 +19,101 @@ def generate_uuid():
     return str(uuid.uuid1())
 
 
+_last_uuid7 = [0, 0]
+_uuid7_lock = threading.Lock()
+
+
+def generate_time_ordered_uuid():
+    """Generate a UUIDv7 string, later ids sort after earlier ones.
+
+    The first 48 bits are the unix time in milliseconds and the next 12 a
+    counter, random at the start of every millisecond, so ids generated by
+    a process are strictly increasing both as text and as UUID.
+    """
+    with _uuid7_lock:
+        timestamp = int(time.time() * 1000)
+        last_timestamp, counter = _last_uuid7
+        if timestamp > last_timestamp:
+            counter = int.from_bytes(os.urandom(2), 'big') & 0x7ff
+        else:
+            timestamp, counter = last_timestamp, counter + 1
+            if counter > 0xfff:
+                timestamp, counter = timestamp + 1, 0
+        _last_uuid7[:] = [timestamp, counter]
+
+    random_bits = int.from_bytes(os.urandom(8), 'big') & (2 ** 62 - 1)
+    value = (timestamp << 80) | (0x7 << 76) | (counter << 64) | \
+        (0b10 << 62) | random_bits
+    return str(uuid.UUID(int=value))
+
+
+class GUID(TypeDecorator):
+    """Store uuid strings in a native 16 byte UUID column.
+
+    PostgreSQL gets its UUID type, other databases fall back to CHAR(36).
+    Values are canonical uuid strings in Python either way.
+    """
+
+    impl = CHAR(36)
+
+    def load_dialect_impl(self, dialect):
+        """Pick the column type for the dialect."""
+        if dialect.name == 'postgresql':
+            return dialect.type_descriptor(postgresql.UUID())
+        return dialect.type_descriptor(CHAR(36))
+
+    def process_bind_param(self, value, dialect):
+        """Canonicalize uuids before they are written.
+
+        Raises:
+            ValueError: if value isn't a uuid
+        """
+        if value is None:
+            return None
+        return str(uuid.UUID(str(value)))
+
+    def process_result_value(self, value, dialect):
+        """Return uuids as strings."""
+        return None if value is None else str(value)
+
+    def coerce_compared_value(self, op, value):
+        """Bind values compared with GUID columns leniently."""
+        return GUIDCriterion()
+
+
+class GUIDCriterion(GUID):
+    """GUID of the values a GUID column is compared with.
+
+    A value that isn't a uuid matches no row. It is sent as NULL on
+    PostgreSQL, which would refuse to cast it, instead of raising.
+    """
+
+    def process_bind_param(self, value, dialect):
+        """Canonicalize uuids, let other values match nothing."""
+        try:
+            return super().process_bind_param(value, dialect)
+        except ValueError:
+            return None if dialect.name == 'postgresql' else value
+
+
+class Query(db.Query):
+    """Query of the models, see Base.query_class."""
+
+    def get(self, ident):
+        """Return None for ids that can't be primary keys of a GUID model.
+
+        The primary key lookup binds ident like a written value, which
+        would raise for ids sent by clients that aren't uuids.
+        """
+        mapper = self._mapper_zero()
+        if mapper is not None and isinstance(mapper.primary_key[0].type, GUID):
+            try:
+                uuid.UUID(str(ident))
+            except ValueError:
+                return None
+        return super().get(ident)
+
+
 def camel_case(snake_str):
     """Convert string to camel case."""
     title_str = snake_str.title().replace("_", "")
@@ -25,7 +126,7 @@ user_activity = db.Table('user_activity',
                          db.Column('user_uuid', db.String,
                                    db.ForeignKey('users.uuid'), nullable=False
                                    ),
-                         db.Column('activity_uuid', db.String,
+                         db.Column('activity_uuid', GUID,
                                    db.ForeignKey('activities.uuid'),
                                    nullable=False))
 user_role = db.Table('user_role',
@@ -34,19 +135,32 @@ user_role = db.Table('user_role',
                                ),
                      db.Column('role_uuid', db.String,
                                db.ForeignKey('roles.uuid'),
-                               nullable=False))
+                               nullable=False),
+                     db.Index('ix_user_role_user_uuid', 'user_uuid'),
+                     db.Index('ix_user_role_role_uuid', 'role_uuid'))
 
 
 class Base(db.Model):
     """Base model, contain utility methods and properties."""
 
     db = db
+    query_class = Query
 
     __abstract__ = True
-    uuid = db.Column(db.String, primary_key=True, default=generate_uuid)
+    # type and generator of the primary key, models may override them
+    id_type = db.String
+    id_generator = staticmethod(generate_time_ordered_uuid)
+
+    @declared_attr
+    def uuid(cls):
+        """Primary key, generated by the model's id_generator."""
+        return db.Column(cls.id_type, primary_key=True,
+                         default=lambda: cls.id_generator())
+
     name = db.Column(db.String)
     photo = db.Column(db.String)
-    created_at = db.Column(db.DateTime, default=datetime.utcnow)
+    created_at = db.Column(db.DateTime, nullable=False,
+                           default=datetime.utcnow)
     modified_at = db.Column(db.DateTime, onupdate=datetime.utcnow)
     description = db.Column(db.String)
 
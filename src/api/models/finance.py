@@ -0,0 +1,28 @@
+from api.models.base import Base, GUID
+
+
+db = Base.db
+
+
+class FinanceRoute(Base):
+    """Models a finance address notified about a center's redemptions.
+
+    A center can have several routes. Routes on the 'email' channel are
+    finance mailboxes. Routes on the 'slack' channel are members contacted
+    on Slack in addition to the finance users of the center.
+    """
+
+    __tablename__ = 'finance_routes'
+    __table_args__ = (
+        db.UniqueConstraint('center_id', 'channel', 'email',
+                            name='uq_finance_routes_center_channel_email'),
+    )
+
+    id_type = GUID
+    center_id = db.Column(
+        db.String, db.ForeignKey('centers.uuid'), nullable=False
+    )
+    channel = db.Column(db.String, nullable=False, default='email')
+    email = db.Column(db.String, nullable=False)
+
+    center = db.relationship('Center')
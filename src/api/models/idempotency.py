@@ -0,0 +1,28 @@
+from api.models.base import Base, GUID
+
+
+db = Base.db
+
+
+class IdempotencyKey(Base):
+    """Models the response of a request sent with an Idempotency-Key header.
+
+    A retry with the same key gets the stored response back instead of
+    repeating the change. The fingerprint of the original request is kept
+    so a key can't be reused for a different request. Keys are kept for
+    IDEMPOTENCY_KEY_TTL seconds.
+    """
+
+    __tablename__ = 'idempotency_keys'
+    __table_args__ = (
+        db.UniqueConstraint('user_id', 'key',
+                            name='uq_idempotency_keys_user_id_key'),
+        db.Index('ix_idempotency_keys_created_at', 'created_at'),
+    )
+
+    id_type = GUID
+    user_id = db.Column(db.String, nullable=False)
+    key = db.Column(db.String, nullable=False)
+    fingerprint = db.Column(db.String, nullable=False)
+    status_code = db.Column(db.Integer, nullable=False)
+    response = db.Column(db.Text, nullable=False)
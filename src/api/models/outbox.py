@@ -0,0 +1,33 @@
+from datetime import datetime
+
+from api.models.base import Base, GUID
+
+
+db = Base.db
+
+
+class OutboxMessage(Base):
+    """Models a notification waiting to be delivered by the outbox worker.
+
+    Rows are added in the same transaction as the change they announce, so
+    a notification exists if and only if that change was committed.
+    """
+
+    __tablename__ = 'outbox'
+    id_type = GUID
+
+    channel = db.Column(db.String, nullable=False)  # 'email' or 'slack'
+    recipient = db.Column(db.String, nullable=False)
+    sender = db.Column(db.String)
+    subject = db.Column(db.String)
+    body = db.Column(db.Text, nullable=False)
+    # pending -> sending -> sent, or failed once attempts run out
+    status = db.Column(db.String, nullable=False, default='pending')
+    attempts = db.Column(db.Integer, nullable=False, default=0)
+    available_at = db.Column(db.DateTime, nullable=False,
+                             default=datetime.utcnow)
+    last_error = db.Column(db.String)
+
+    __table_args__ = (
+        db.Index('ix_outbox_status_available_at', 'status', 'available_at'),
+    )
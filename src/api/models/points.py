@@ -0,0 +1,56 @@
+from api.models.base import Base, GUID
+
+
+db = Base.db
+
+
+class PointsTransaction(Base):
+    """Models an entry of the append-only society points ledger.
+
+    Society._total_points and _used_points are running sums of the
+    'earned' and 'redeemed' entries of the society.
+    """
+
+    __tablename__ = 'points_transactions'
+    __table_args__ = (
+        db.Index('ix_points_transactions_society_id_kind',
+                 'society_id', 'kind'),
+    )
+
+    id_type = GUID
+    society_id = db.Column(
+        GUID, db.ForeignKey('societies.uuid'), nullable=False
+    )
+    kind = db.Column(db.String, nullable=False)  # 'earned' or 'redeemed'
+    value = db.Column(db.Integer, nullable=False)
+    logged_activity_id = db.Column(
+        GUID, db.ForeignKey('logged_activities.uuid')
+    )
+    redemption_id = db.Column(GUID, db.ForeignKey('redemptions.uuid'))
+
+
+class PointsAggregate(Base):
+    """Models running points totals of a user or a society.
+
+    Every owner has a 'total' row plus one row per activity type and per
+    month, so a profile reads a handful of rows instead of summing all
+    logged activities.
+    """
+
+    __tablename__ = 'points_aggregates'
+    __table_args__ = (
+        db.UniqueConstraint('scope', 'owner_id', 'dimension', 'bucket',
+                            name='uq_points_aggregates_key'),
+    )
+
+    id_type = GUID
+    scope = db.Column(db.String, nullable=False)  # 'user' or 'society'
+    owner_id = db.Column(db.String, nullable=False)
+    # 'total', 'activity_type' or 'month'
+    dimension = db.Column(db.String, nullable=False)
+    # '' for totals, an activity type id or a 'YYYY-MM' month
+    bucket = db.Column(db.String, nullable=False, default='')
+    points = db.Column(db.Integer, nullable=False, default=0)
+    approved = db.Column(db.Integer, nullable=False, default=0)
+    rejected = db.Column(db.Integer, nullable=False, default=0)
+    redeemed = db.Column(db.Integer, nullable=False, default=0)
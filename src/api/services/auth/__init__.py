@@ -1 +1,3 @@
 from .auth import verify_token, token_required, roles_required
+from .token_cache import verified_tokens
+from .role_registry import role_registry
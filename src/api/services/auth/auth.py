@@ -4,42 +4,75 @@ Authorisation Module.
 This module contains the authorisation required by the client to
 communicate with the API.
 """
-import base64
+import binascii
 from functools import wraps
 import datetime
 
 from flask import current_app, g, request
-from jose import ExpiredSignatureError, JWTError, jwt
+from jose import ExpiredSignatureError, JWTError, jwk, jwt
+from jose.utils import base64url_decode
 
+from .context import AuthContext, load_auth_context
 from .helpers import store_user_details
-from api.models import Role, User
+from .token_cache import load_public_key, verified_tokens
 from api.utils.helpers import response_builder
 
 access_time = str(datetime.datetime.utcnow().time())
 
+
+def verify_signature(authorization_token, public_key):
+    """Verify the RS256 signature of a token exactly once.
+
+    Args:
+        authorization_token (str): the raw JWT
+        public_key (jose.jwk.Key): parsed public key
+
+    Raises:
+        JWTError: if the token is malformed or the signature is invalid
+    """
+    header = jwt.get_unverified_header(authorization_token)
+    if header.get('alg') != 'RS256':
+        raise JWTError('The specified alg value is not allowed')
+
+    if isinstance(authorization_token, str):
+        authorization_token = authorization_token.encode('utf-8')
+    try:
+        signing_input, crypto_segment = authorization_token.rsplit(b'.', 1)
+        signature = base64url_decode(crypto_segment)
+    except (ValueError, TypeError, binascii.Error):
+        raise JWTError('Invalid crypto padding')
+
+    if not public_key.verify(signing_input, signature):
+        raise JWTError('Signature verification failed.')
+
+
 def verify_token(authorization_token, public_key, audience=None, issuer=None):
-    """Validate token."""
+    """Validate token.
+
+    The signature is checked once, the claims are then validated against
+    the audience/issuer and again without them if they don't match.
+    """
     from manage import app
+    if not isinstance(public_key, jwk.Key):
+        public_key = jwk.construct(public_key, 'RS256')
+    verify_signature(authorization_token, public_key)
+
+    options = {
+        'verify_signature': False,
+        'verify_exp': True
+    }
     try:
         payload = jwt.decode(
             authorization_token,
-            public_key,
-            algorithms=['RS256'],
-            options={
-                'verify_signature': True,
-                'verify_exp': True
-            },
+            None,
+            options=options,
             audience=audience,
             issuer=issuer)
     except JWTError:
         payload = jwt.decode(
             authorization_token,
-            public_key,
-            algorithms=['RS256'],
-            options={
-                'verify_signature': True,
-                'verify_exp': True
-            })
+            None,
+            options=options)
     app.logger.info('Token SUCCESSFULLY validated: The ACCESS time is UTC {}'.format(access_time)) # Noqa E501
     return payload
 
@@ -61,13 +94,16 @@ def token_required(f):
                                "supplied is invalid"
 
         try:
-            # decode token
-            public_key = base64.b64decode(
-                current_app.config['PUBLIC_KEY']).decode("utf-8")
-            payload = verify_token(authorization_token,
-                                   public_key,
-                                   current_app.config['API_AUDIENCE'],
-                                   current_app.config['API_ISSUER'])
+            # decode token, reusing the payload of already verified tokens
+            payload = verified_tokens.get(authorization_token)
+            if payload is None:
+                public_key = load_public_key(
+                    current_app.config['PUBLIC_KEY'])
+                payload = verify_token(authorization_token,
+                                       public_key,
+                                       current_app.config['API_AUDIENCE'],
+                                       current_app.config['API_ISSUER'])
+                verified_tokens.set(authorization_token, payload)
         except ExpiredSignatureError:
             expired_response = "The authorization token supplied is expired"
             app.logger.warning('Token HAS EXPIRED!')
@@ -82,16 +118,22 @@ def token_required(f):
         elif not payload["UserInfo"].get("id"):
             return response_builder(dict(message="malformed token"), 401)
         else:
-            user = User.query.get(payload["UserInfo"]["id"])  #TODO check if user id exists
-            # user id returns the name of the user
-            if not user:
+            user_id = payload["UserInfo"]["id"]
+            context = g.get('auth_context')
+            if not context or context.user.uuid != user_id:
+                context = load_auth_context(user_id)
+            if not context:
                 user = store_user_details(payload, authorization_token)
+                context = load_auth_context(user_id) or AuthContext(
+                    user, [(role.uuid, role.name) for role in user.roles])
+            user = context.user
+            g.auth_context = context
             g.current_user = user
             g.current_user_token = authorization_token
 
             # attempt to link user to society
-            if not g.current_user.society and g.current_user.cohort:
-                user.society = g.current_user.cohort.society
+            if not user.society and user.cohort and user.cohort.society:
+                user.society = user.cohort.society
                 user.save()
             app.logger.info('Token Authentication SUCCESSFUL! The CURRENT USER is {}'.format(user))
         return f(*args, **kwargs)
@@ -107,13 +149,7 @@ def roles_required(roles):
     def check_user_role(f):
         @wraps(f)
         def decorated(*args, **kwargs):
-            route_roles = list(filter(lambda r: r is not None,
-                                      [Role.query.filter_by(name=role).first()
-                                       for role in roles]))
-            for role in g.current_user.roles:
-                if role in route_roles:
-                    break
-            else:
+            if not g.auth_context.has_any_role(roles):
                 return response_builder(
                     dict(message="You're unauthorized"
                          " to perform this operation"), 401)
@@ -0,0 +1,58 @@
+"""
+Authentication Context Module.
+
+This module loads everything the auth decorators need to know about the
+current user in a single query and keeps it on `flask.g` for the request.
+"""
+from sqlalchemy.orm import joinedload
+
+from api.models import Cohort, Role, User
+from .role_registry import role_registry
+
+
+class AuthContext(object):
+    """Hold the authenticated user and their roles for one request."""
+
+    def __init__(self, user, roles):
+        """Build the context.
+
+        Args:
+            user (User): the authenticated user
+            roles (iterable): (uuid, name) pairs of the user's roles
+        """
+        self.user = user
+        self.role_uuids = frozenset(uuid for uuid, _ in roles)
+        self.role_names = frozenset(name for _, name in roles)
+
+    def has_any_role(self, role_names):
+        """Check whether the user holds at least one of role_names.
+
+        Names are resolved through the role registry so the check costs
+        no SQL once the registry is loaded.
+        """
+        return not self.role_uuids.isdisjoint(
+            role_registry.uuids_for(role_names))
+
+
+def load_auth_context(user_id):
+    """Load a user with society, cohort and role names in one query.
+
+    Args:
+        user_id (str): uuid of the user
+
+    Return:
+        AuthContext or None if the user does not exist
+    """
+    rows = User.query.options(
+        joinedload(User.society),
+        joinedload(User.cohort).joinedload(Cohort.society)
+    ).outerjoin(User.roles).add_columns(
+        Role.uuid, Role.name
+    ).filter(User.uuid == user_id).all()
+
+    if not rows:
+        return None
+
+    user = rows[0][0]
+    roles = [(uuid, name) for _, uuid, name in rows if uuid is not None]
+    return AuthContext(user, roles)
@@ -4,6 +4,7 @@ import requests
 from flask import jsonify
 
 from api.models import Role, User, Center, Cohort
+from .role_registry import role_registry
 
 
 def add_extra_user_info(token,
@@ -76,16 +77,13 @@ def store_user_details(payload, token):
         location.save()
 
     # set users roles
-    user.roles = [
-        Role.query.filter_by(name=role.lower()).first() for role in roles
-        if role and role != "Andelan" and Role.query.filter_by(
-            name=role.lower()).first() is not None
-    ]
-
+    role_uuids = role_registry.uuids_for(
+        role.lower() for role in roles if role and role != "Andelan")
     # default to fellow
-    user.roles = user.roles if user.roles else [
-        Role.query.filter_by(name='fellow').first()
-    ]
+    if not role_uuids:
+        role_uuids = role_registry.uuids_for(['fellow'])
+    user.roles = Role.query.filter(Role.uuid.in_(role_uuids)).all() \
+        if role_uuids else []
 
     user.save()
     return user
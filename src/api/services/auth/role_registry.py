@@ -0,0 +1,67 @@
+"""
+Role Registry Module.
+
+This module keeps a process-wide map of role names to role uuids so that
+authorization checks don't need to query the roles table.
+"""
+import os
+import threading
+import time
+
+from api.models import Role
+from api.utils.cache import invalidate_on_commit
+
+
+class RoleRegistry(object):
+    """In-memory name -> uuid map of the roles in the system.
+
+    The registry is reloaded whenever a committed transaction changed a
+    role in this process, and at least every `ttl` seconds so that
+    changes made by other workers are eventually picked up.
+    """
+
+    def __init__(self, ttl=300):
+        """Create an empty registry that expires after `ttl` seconds."""
+        self.ttl = ttl
+        self._roles = None
+        self._loaded_at = 0
+        self._lock = threading.Lock()
+
+    def refresh(self):
+        """Reload all roles from the database."""
+        roles = {}
+        for uuid, name in Role.query.with_entities(Role.uuid, Role.name):
+            # keep the first role per name like `filter_by(name).first()`
+            roles.setdefault(name, uuid)
+        with self._lock:
+            self._roles = roles
+            self._loaded_at = time.time()
+        return roles
+
+    def invalidate(self):
+        """Drop the loaded roles so the next lookup reloads them."""
+        with self._lock:
+            self._roles = None
+
+    @property
+    def roles(self):
+        """Return the name -> uuid map, loading it when stale."""
+        roles = self._roles
+        if roles is None or time.time() - self._loaded_at > self.ttl:
+            roles = self.refresh()
+        return roles
+
+    def uuid_for(self, name):
+        """Return the uuid of the role called name or None."""
+        return self.roles.get(name)
+
+    def uuids_for(self, names):
+        """Return the set of uuids of the existing roles among names."""
+        roles = self.roles
+        return {roles[name] for name in names if name in roles}
+
+
+role_registry = RoleRegistry(int(os.getenv('ROLE_REGISTRY_TTL', 300)))
+
+
+invalidate_on_commit([Role], role_registry)
@@ -0,0 +1,92 @@
+"""
+Verified Token Cache Module.
+
+This module keeps the payloads of tokens whose signatures have already been
+verified so that repeated requests with the same token skip the RS256 check.
+"""
+import base64
+import hashlib
+import os
+import threading
+import time
+from collections import OrderedDict
+from functools import lru_cache
+
+from jose import jwk
+
+
+@lru_cache(maxsize=8)
+def load_public_key(encoded_public_key, algorithm='RS256'):
+    """Decode and parse a base64 encoded public key once per process.
+
+    Args:
+        encoded_public_key (str): base64 encoded PEM public key
+        algorithm (str): algorithm the key will be used to verify
+
+    Return:
+        key (jose.jwk.Key): parsed key object ready for verification
+    """
+    public_key = base64.b64decode(encoded_public_key).decode("utf-8")
+    return jwk.construct(public_key, algorithm)
+
+
+class TokenCache(object):
+    """Bounded LRU cache of verified token payloads.
+
+    Entries are keyed by a hash of the token and expire at the token's
+    own `exp` claim.
+    """
+
+    def __init__(self, maxsize=1024):
+        """Create an empty cache holding at most `maxsize` tokens."""
+        self.maxsize = maxsize
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _key(token):
+        """Hash the token so raw credentials are not kept in memory."""
+        if isinstance(token, str):
+            token = token.encode("utf-8")
+        return hashlib.sha256(token).hexdigest()
+
+    def get(self, token):
+        """Return the cached payload for token or None if absent/expired."""
+        key = self._key(token)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, payload = entry
+            if expires_at <= time.time():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return payload
+
+    def set(self, token, payload):
+        """Cache a verified payload until its `exp` claim.
+
+        Payloads without a numeric `exp` claim are never cached.
+        """
+        expires_at = payload.get("exp") if isinstance(payload, dict) else None
+        if not isinstance(expires_at, (int, float)) or self.maxsize <= 0:
+            return
+        key = self._key(token)
+        with self._lock:
+            self._entries[key] = (expires_at, payload)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def clear(self):
+        """Remove all cached tokens."""
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self):
+        """Return the number of cached tokens."""
+        return len(self._entries)
+
+
+verified_tokens = TokenCache(int(os.getenv('TOKEN_CACHE_SIZE', 1024)))
@@ -0,0 +1,2 @@
+from api.services.finance.routing import (
+    FinanceRecipients, FinanceRoutingTable, finance_routing)
@@ -0,0 +1,88 @@
+"""
+Finance Routing Module.
+
+Keeps a process-wide table of the finance recipients of every center so
+that approving a redemption doesn't load the finance users of the system.
+"""
+import os
+import threading
+import time
+from collections import namedtuple
+
+from api.models import Center, FinanceRoute, Role, User
+from api.utils.cache import invalidate_on_commit
+
+
+FinanceRecipients = namedtuple('FinanceRecipients', ['emails', 'slack'])
+
+# mailbox of named centers that have no email route
+DEFAULT_MAILBOX = '{center}-finance@andela.com'
+
+
+class FinanceRoutingTable(object):
+    """In-memory center uuid -> FinanceRecipients map.
+
+    The table is built from the finance routes, the finance users of each
+    center and the center names. It is rebuilt whenever a committed
+    transaction changed a route, a center or a user in this process, and
+    at least every `ttl` seconds to pick up changes made by other workers.
+    """
+
+    def __init__(self, ttl=300):
+        """Create an empty table that expires after `ttl` seconds."""
+        self.ttl = ttl
+        self._routes = None
+        self._loaded_at = 0
+        self._lock = threading.Lock()
+
+    def refresh(self):
+        """Rebuild the table from the database."""
+        emails, slack = {}, {}
+        for center_id, channel, email in FinanceRoute.query.with_entities(
+                FinanceRoute.center_id, FinanceRoute.channel,
+                FinanceRoute.email):
+            recipients = emails if channel == 'email' else slack
+            recipients.setdefault(center_id, set()).add(email)
+
+        for center_id, email in User.query.with_entities(
+                User.center_id, User.email).join(User.roles).filter(
+                    Role.name == 'finance', User.center_id.isnot(None)):
+            slack.setdefault(center_id, set()).add(email)
+
+        routes = {}
+        for center_id, name in Center.query.with_entities(
+                Center.uuid, Center.name):
+            mailboxes = emails.get(center_id)
+            if not mailboxes and name:
+                mailboxes = {DEFAULT_MAILBOX.format(center=name.lower())}
+            routes[center_id] = FinanceRecipients(
+                sorted(mailboxes or ()), sorted(slack.get(center_id, ())))
+
+        with self._lock:
+            self._routes = routes
+            self._loaded_at = time.time()
+        return routes
+
+    def invalidate(self):
+        """Drop the table so the next lookup rebuilds it."""
+        with self._lock:
+            self._routes = None
+
+    @property
+    def routes(self):
+        """Return the center uuid -> recipients map, rebuilding it when stale."""
+        routes = self._routes
+        if routes is None or time.time() - self._loaded_at > self.ttl:
+            routes = self.refresh()
+        return routes
+
+    def recipients(self, center_id):
+        """Return the FinanceRecipients of the center with center_id."""
+        return self.routes.get(center_id, FinanceRecipients([], []))
+
+
+finance_routing = FinanceRoutingTable(
+    int(os.getenv('FINANCE_ROUTING_TTL', 300)))
+
+
+invalidate_on_commit([FinanceRoute, Center, User], finance_routing)
@@ -0,0 +1,3 @@
+from api.services.idempotency.keys import (
+    IDEMPOTENCY_HEADER, idempotency_key, purge_expired_keys,
+    remember_response, stored_response)
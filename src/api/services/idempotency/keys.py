@@ -0,0 +1,96 @@
+"""
+Idempotency Keys Module.
+
+Clients can send an `Idempotency-Key` header with requests that change
+state. The response is stored in the transaction that makes the change,
+so a retry of a committed request gets that response back and nothing is
+applied twice. Responses are kept for IDEMPOTENCY_KEY_TTL seconds, expired
+ones are removed by `manage.py purge_idempotency_keys`.
+"""
+import hashlib
+import json
+from datetime import datetime, timedelta
+
+from flask import current_app, g, request
+
+from api.models import IdempotencyKey
+from api.models.base import db
+from api.utils.helpers import response_builder
+
+
+IDEMPOTENCY_HEADER = 'Idempotency-Key'
+
+
+def idempotency_key():
+    """Return the idempotency key sent with the request or None."""
+    return request.headers.get(IDEMPOTENCY_HEADER, '').strip() or None
+
+
+def _fingerprint():
+    digest = hashlib.sha256()
+    for part in (request.method, request.path):
+        digest.update(part.encode() + b'\0')
+    digest.update(request.get_data())
+    return digest.hexdigest()
+
+
+def _expiry():
+    return datetime.utcnow() - timedelta(
+        seconds=current_app.config['IDEMPOTENCY_KEY_TTL'])
+
+
+def stored_response(key):
+    """Return the response stored for key by the current user or None.
+
+    An expired response is deleted, so the key can be used again.
+
+    Raises:
+        ValueError: if key was used for a different request
+    """
+    stored = IdempotencyKey.query.filter_by(
+        user_id=g.current_user.uuid, key=key).one_or_none()
+    if stored is None:
+        return None
+    if stored.created_at < _expiry():
+        db.session.delete(stored)
+        db.session.flush()
+        return None
+    if stored.fingerprint != _fingerprint():
+        raise ValueError(
+            '{} was already used for another request'.format(
+                IDEMPOTENCY_HEADER))
+    return response_builder(json.loads(stored.response), stored.status_code)
+
+
+def remember_response(key, data, status_code=200):
+    """Store the response for key in the current transaction.
+
+    Args:
+        key (str): idempotency key sent by the client
+        data (dict): response body
+        status_code (int): response status
+
+    Return:
+        the response built from data
+    """
+    db.session.add(IdempotencyKey(
+        user_id=g.current_user.uuid,
+        key=key,
+        fingerprint=_fingerprint(),
+        status_code=status_code,
+        response=json.dumps(data, default=str)
+    ))
+    return response_builder(data, status_code)
+
+
+def purge_expired_keys():
+    """Delete the stored responses older than IDEMPOTENCY_KEY_TTL.
+
+    Return:
+        number of deleted responses
+    """
+    deleted = IdempotencyKey.query.filter(
+        IdempotencyKey.created_at < _expiry()
+    ).delete(synchronize_session=False)
+    db.session.commit()
+    return deleted
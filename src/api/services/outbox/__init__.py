@@ -0,0 +1,3 @@
+from api.services.outbox.messages import (
+    queue_batch, queue_email, queue_slack, queue_slack_role)
+from api.services.outbox.worker import OutboxWorker
@@ -0,0 +1,63 @@
+"""
+Outbox Messages Module.
+
+Endpoints add notifications to the outbox instead of sending them, the rows
+are committed together with the request's changes and delivered later by
+`manage.py drain_outbox`.
+"""
+from api.models import OutboxMessage
+from api.models.base import db
+from api.services.slack_notify.recipients import role_member_emails
+
+
+def _email_rows(payload):
+    return [OutboxMessage(
+        channel='email',
+        recipient=recipient,
+        sender=payload['sender'],
+        subject=payload['subject'],
+        body=payload['message']
+    ) for recipient in payload['recipients']]
+
+
+def _slack_rows(user_email, message):
+    if user_email and message:
+        return [OutboxMessage(
+            channel='slack', recipient=user_email, body=message)]
+    return []
+
+
+def queue_email(payload):
+    """Add an email to the outbox, one row per recipient.
+
+    Args:
+        payload (dict): sender, subject, message and recipients of the
+            email, as passed to the send email signal
+    """
+    db.session.add_all(_email_rows(payload))
+
+
+def queue_slack(user_email, message):
+    """Add a slack message for the member with user_email to the outbox."""
+    db.session.add_all(_slack_rows(user_email, message))
+
+
+def queue_batch(emails=(), slack=()):
+    """Add several emails and slack messages to the outbox at once.
+
+    Args:
+        emails (list): email payloads as taken by queue_email
+        slack (list): (user_email, message) pairs as taken by queue_slack
+    """
+    rows = []
+    for payload in emails:
+        rows.extend(_email_rows(payload))
+    for user_email, message in slack:
+        rows.extend(_slack_rows(user_email, message))
+    db.session.add_all(rows)
+
+
+def queue_slack_role(role_name, message, society_id=None):
+    """Add a slack message for every holder of role_name to the outbox."""
+    for user_email in role_member_emails(role_name, society_id):
+        queue_slack(user_email, message)
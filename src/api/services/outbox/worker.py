@@ -0,0 +1,128 @@
+"""
+Outbox Worker Module.
+
+Claims due outbox rows in batches and delivers them. Rows are claimed with
+`SELECT ... FOR UPDATE SKIP LOCKED` and leased for `lease` seconds, so any
+number of workers can drain the outbox without sending a message twice; a
+worker that dies mid-batch only delays its rows until the lease expires.
+"""
+import logging
+from datetime import datetime, timedelta
+
+from flask_mail import Message
+
+from api.models import OutboxMessage
+from api.models.base import db
+
+
+class OutboxWorker(object):
+    """Deliver outbox messages by email or slack."""
+
+    def __init__(self, mail, transport, batch_size=50, max_attempts=5,
+                 backoff=30, lease=300):
+        """Create a worker.
+
+        Args:
+            mail: Flask-Mail state used to open SMTP connections
+            transport: slack transport exposing `send(user_email, message)`
+            batch_size (int): rows claimed per batch
+            max_attempts (int): deliveries tried before a row fails
+            backoff (int): seconds before the first retry, doubled on every
+                following retry
+            lease (int): seconds a claimed row is hidden from other workers
+        """
+        self.mail = mail
+        self.transport = transport
+        self.batch_size = batch_size
+        self.max_attempts = max_attempts
+        self.backoff = backoff
+        self.lease = lease
+
+    def claim(self):
+        """Lease the next batch of due rows to this worker.
+
+        Return:
+            list of claimed OutboxMessage rows
+        """
+        now = datetime.utcnow()
+        rows = OutboxMessage.query.filter(
+            OutboxMessage.status.in_(('pending', 'sending')),
+            OutboxMessage.available_at <= now
+        ).order_by(
+            OutboxMessage.available_at
+        ).limit(self.batch_size).with_for_update(skip_locked=True).all()
+
+        for row in rows:
+            row.status = 'sending'
+            row.attempts += 1
+            row.available_at = now + timedelta(seconds=self.lease)
+        db.session.commit()
+        return rows
+
+    def drain_batch(self):
+        """Claim and deliver one batch.
+
+        Return:
+            number of rows claimed
+        """
+        rows = self.claim()
+        if not rows:
+            return 0
+
+        emails = [row for row in rows if row.channel == 'email']
+        if emails:
+            self._send_emails(emails)
+        for row in rows:
+            if row.channel == 'slack':
+                self._deliver(row, self.transport.send,
+                              row.recipient, row.body)
+            elif row.channel != 'email':
+                self._failed(row, "Unknown channel {}".format(row.channel))
+        db.session.commit()
+        return len(rows)
+
+    def drain(self):
+        """Deliver batches until nothing is due.
+
+        Return:
+            number of rows claimed
+        """
+        total = 0
+        while True:
+            claimed = self.drain_batch()
+            if not claimed:
+                return total
+            total += claimed
+
+    def _send_emails(self, rows):
+        try:
+            with self.mail.connect() as connection:
+                for row in rows:
+                    message = Message(row.subject, sender=row.sender,
+                                      recipients=[row.recipient])
+                    message.html = row.body
+                    self._deliver(row, connection.send, message)
+        except Exception as error:
+            logging.exception("Could not connect to the mail server")
+            for row in rows:
+                if row.status == 'sending':
+                    self._failed(row, error)
+
+    def _deliver(self, row, send, *args):
+        try:
+            send(*args)
+        except Exception as error:
+            logging.exception("Failed to deliver outbox message %s", row.uuid)
+            self._failed(row, error)
+        else:
+            row.status = 'sent'
+            row.last_error = None
+
+    def _failed(self, row, error):
+        row.last_error = str(error)
+        if row.attempts >= self.max_attempts:
+            row.status = 'failed'
+        else:
+            row.status = 'pending'
+            row.available_at = datetime.utcnow() + timedelta(
+                seconds=self.backoff * 2 ** (row.attempts - 1))
@@ -0,0 +1,5 @@
+from api.services.points.ledger import (
+    reconcile, record_earned, record_redeemed)
+from api.services.points.aggregates import (
+    points_summary, record_approvals, record_redemption, record_rejections,
+    withdraw_rejections)
@@ -0,0 +1,130 @@
+"""
+Points Aggregates Module.
+
+Keeps PointsAggregate rows in step with approvals, rejections and
+redemptions. Changes are summed per row in Python and applied with one
+`UPDATE ... SET x = x + :delta` (an upsert on PostgreSQL) per row, inside
+the caller's transaction.
+"""
+from collections import OrderedDict
+from datetime import datetime
+
+from sqlalchemy import and_
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+
+from api.models import PointsAggregate
+from api.models.base import db
+
+
+COUNTERS = ('points', 'approved', 'rejected', 'redeemed')
+
+
+def _month(date):
+    return (date or datetime.utcnow()).strftime('%Y-%m')
+
+
+def _buckets(activity):
+    """Yield the aggregate keys a logged activity counts towards."""
+    month = _month(activity.activity_date or activity.created_at)
+    for scope, owner_id in (('user', activity.user_id),
+                            ('society', activity.society_id)):
+        yield scope, owner_id, 'total', ''
+        yield scope, owner_id, 'activity_type', activity.activity_type_id
+        yield scope, owner_id, 'month', month
+
+
+def _bump(changes):
+    """Apply counter deltas.
+
+    Args:
+        changes (dict): (scope, owner_id, dimension, bucket) -> dict of
+            counter deltas
+    """
+    table = PointsAggregate.__table__
+    postgres = db.engine.dialect.name == 'postgresql'
+    for (scope, owner_id, dimension, bucket), deltas in changes.items():
+        key = dict(scope=scope, owner_id=str(owner_id), dimension=dimension,
+                   bucket=str(bucket or ''))
+        increments = {name: table.c[name] + delta
+                      for name, delta in deltas.items()}
+        if postgres:
+            db.session.execute(pg_insert(table).values(
+                uuid=PointsAggregate.id_generator(), **key, **deltas
+            ).on_conflict_do_update(
+                constraint='uq_points_aggregates_key', set_=increments))
+            continue
+
+        result = db.session.execute(table.update().where(and_(
+            *(table.c[name] == value for name, value in key.items())
+        )).values(**increments))
+        if not result.rowcount:
+            db.session.execute(table.insert().values(**key, **deltas))
+
+
+def _collect(items, buckets, **deltas):
+    changes = OrderedDict()
+    for item in items:
+        for key in buckets(item):
+            counters = changes.setdefault(key, dict.fromkeys(deltas, 0))
+            for name, delta in deltas.items():
+                counters[name] += delta(item)
+    return changes
+
+
+def record_approvals(logged_activities):
+    """Count approved logged activities and the points they earned."""
+    _bump(_collect(logged_activities, _buckets,
+                   points=lambda activity: activity.value,
+                   approved=lambda activity: 1))
+
+
+def record_rejections(logged_activities):
+    """Count rejected logged activities."""
+    _bump(_collect(logged_activities, _buckets,
+                   rejected=lambda activity: 1))
+
+
+def withdraw_rejections(logged_activities):
+    """Stop counting logged activities that are no longer rejected."""
+    _bump(_collect(logged_activities, _buckets,
+                   rejected=lambda activity: -1))
+
+
+def record_redemption(redemption):
+    """Count points a society redeemed."""
+    month = _month(datetime.utcnow())
+    _bump(_collect(
+        [redemption],
+        lambda item: [('society', item.society_id, 'total', ''),
+                      ('society', item.society_id, 'month', month)],
+        redeemed=lambda item: item.value))
+
+
+def points_summary(scope, owner_id, breakdown=True):
+    """Read the totals and breakdowns of a user or a society.
+
+    Args:
+        scope (str): 'user' or 'society'
+        owner_id (str): id of the user or society
+        breakdown (bool): also read the per activity type and per month
+            rows, otherwise only the single total row is read
+
+    Return:
+        dict with the counters, plus `activityTypes` and `months` mapping
+        activity type ids and months to their counters
+    """
+    summary = dict.fromkeys(COUNTERS, 0)
+    summary.update(activityTypes={}, months={})
+    rows = PointsAggregate.query.filter_by(
+        scope=scope, owner_id=str(owner_id))
+    if not breakdown:
+        rows = rows.filter_by(dimension='total')
+    for row in rows:
+        counters = {name: getattr(row, name) for name in COUNTERS}
+        if row.dimension == 'total':
+            summary.update(counters)
+        elif row.dimension == 'activity_type':
+            summary['activityTypes'][row.bucket] = counters
+        else:
+            summary['months'][row.bucket] = counters
+    return summary
@@ -0,0 +1,97 @@
+"""
+Points Ledger Module.
+
+Every change to a society's points is appended to the points_transactions
+table. Balances are moved with a single `UPDATE ... SET x = x + :delta`
+per society, so concurrent workers can't overwrite each other's changes.
+"""
+from collections import OrderedDict
+
+from api.models import PointsTransaction, Society
+from api.models.base import db
+
+
+BALANCE_COLUMNS = {
+    'earned': Society._total_points,
+    'redeemed': Society._used_points,
+}
+
+
+def _apply(kind, entries):
+    """Append ledger entries and move balances, one UPDATE per society.
+
+    Args:
+        kind (str): 'earned' or 'redeemed'
+        entries (list): PointsTransaction keyword arguments
+    """
+    column = BALANCE_COLUMNS[kind]
+    deltas = OrderedDict()
+    for entry in entries:
+        db.session.add(PointsTransaction(kind=kind, **entry))
+        deltas[entry['society_id']] = \
+            deltas.get(entry['society_id'], 0) + entry['value']
+
+    for society_id, delta in deltas.items():
+        Society.query.filter(Society.uuid == society_id).update(
+            {column: db.func.coalesce(column, 0) + delta},
+            synchronize_session=False)
+        society = db.session.identity_map.get(
+            db.session.identity_key(Society, society_id))
+        if society is not None:
+            db.session.expire(society, [column.key])
+
+
+def record_earned(logged_activities):
+    """Credit the societies of approved logged activities.
+
+    Args:
+        logged_activities (list): LoggedActivity rows being approved
+    """
+    _apply('earned', [
+        dict(society_id=activity.society_id, value=activity.value,
+             logged_activity_id=activity.uuid)
+        for activity in logged_activities
+    ])
+
+
+def record_redeemed(redemption):
+    """Debit the society of an approved redemption request.
+
+    The points the request reserved when it was made are released.
+    """
+    _apply('redeemed', [
+        dict(society_id=redemption.society_id, value=redemption.value,
+             redemption_id=redemption.uuid)
+    ])
+    redemption.release_points()
+
+
+def reconcile(apply=True):
+    """Recompute society balances from the ledger.
+
+    Args:
+        apply (bool): write the recomputed balances, otherwise only report
+
+    Return:
+        list of (society, column name, stored balance, ledger balance) for
+        every balance that didn't match the ledger
+    """
+    sums = {}
+    for society_id, kind, total in db.session.query(
+            PointsTransaction.society_id, PointsTransaction.kind,
+            db.func.sum(PointsTransaction.value)
+    ).group_by(PointsTransaction.society_id, PointsTransaction.kind):
+        sums[(society_id, kind)] = total
+
+    mismatches = []
+    for society in Society.query.order_by(Society.name):
+        for kind, column in BALANCE_COLUMNS.items():
+            stored = getattr(society, column.key) or 0
+            expected = sums.get((society.uuid, kind), 0)
+            if stored != expected:
+                mismatches.append((society, column.key, stored, expected))
+                if apply:
+                    setattr(society, column.key, expected)
+    if apply:
+        db.session.commit()
+    return mismatches
@@ -1 +1,6 @@
-from api.services.slack_notify.notification import SlackNotification
\ No newline at end of file
+from api.services.slack_notify.notification import SlackNotification
+from api.services.slack_notify.dispatcher import NotificationDispatcher
+from api.services.slack_notify.transports import (
+    FakeTransport, NullTransport, SlackTransport, build_transport)
+from api.services.slack_notify.directory import SlackDirectory
+from api.services.slack_notify.recipients import role_member_emails
@@ -0,0 +1,146 @@
+"""
+Slack Directory Module.
+
+Keeps an email -> slack id index of the workspace members so that sending
+a message doesn't require downloading the whole member list.
+"""
+import json
+import logging
+import os
+import tempfile
+import threading
+import time
+
+
+class SlackDirectory(object):
+    """Persistent email -> slack id index with incremental refresh.
+
+    The index is rebuilt from `users.list` when it is older than
+    `refresh_interval` seconds. Emails missing from the index are looked up
+    individually with `users.lookupByEmail`; unknown emails are not looked
+    up again for `miss_interval` seconds. A failed rebuild is not retried
+    for `retry_interval` seconds.
+    """
+
+    def __init__(self, client, path=None, refresh_interval=86400,
+                 miss_interval=3600, page_size=200, retry_interval=300):
+        """Create the directory, loading a previously saved index.
+
+        Args:
+            client (SlackClient): client used to query the workspace
+            path (str): JSON file the index is persisted to, optional
+            refresh_interval (int): seconds before a full rebuild
+            miss_interval (int): seconds to remember unknown emails
+            page_size (int): members requested per `users.list` page
+            retry_interval (int): seconds to wait after a failed rebuild
+        """
+        self.client = client
+        self.path = path
+        self.refresh_interval = refresh_interval
+        self.miss_interval = miss_interval
+        self.page_size = page_size
+        self.retry_interval = retry_interval
+        self._ids = {}
+        self._misses = {}
+        self._refreshed_at = 0
+        self._failed_at = 0
+        self._lock = threading.RLock()
+        self._load()
+
+    def _load(self):
+        if not (self.path and os.path.exists(self.path)):
+            return
+        try:
+            with open(self.path) as index_file:
+                data = json.load(index_file)
+            self._ids = dict(data.get('members', {}))
+            self._refreshed_at = data.get('refreshed_at', 0)
+        except (OSError, ValueError):
+            logging.warning("Ignoring unreadable slack directory %s",
+                            self.path)
+
+    def _save(self):
+        if not self.path:
+            return
+        data = dict(refreshed_at=self._refreshed_at, members=self._ids)
+        directory = os.path.dirname(os.path.abspath(self.path))
+        try:
+            with tempfile.NamedTemporaryFile(
+                    'w', dir=directory, delete=False) as index_file:
+                json.dump(data, index_file)
+            os.replace(index_file.name, self.path)
+        except OSError:
+            logging.warning("Could not save slack directory to %s",
+                            self.path)
+
+    @staticmethod
+    def _email(member):
+        return (member.get('profile') or {}).get('email')
+
+    def refresh(self):
+        """Rebuild the index from every page of `users.list`."""
+        ids = {}
+        cursor = None
+        while True:
+            params = dict(limit=self.page_size)
+            if cursor:
+                params['cursor'] = cursor
+            results = self.client.api_call("users.list", **params)
+            if not results.get('ok', True):
+                logging.warning("users.list failed: %s", results.get('error'))
+                with self._lock:
+                    self._failed_at = time.time()
+                return False
+            for member in results.get('members') or []:
+                email = self._email(member)
+                if email and not member.get('deleted'):
+                    ids[email.lower()] = member.get('id')
+            cursor = (results.get('response_metadata') or {}).get(
+                'next_cursor')
+            if not cursor:
+                break
+
+        with self._lock:
+            self._ids = ids
+            self._misses = {}
+            self._refreshed_at = time.time()
+            self._save()
+        return True
+
+    def _lookup_by_email(self, email):
+        results = self.client.api_call("users.lookupByEmail", email=email)
+        if results.get('ok') and results.get('user'):
+            return results['user'].get('id')
+        return None
+
+    def get_slack_id(self, user_email):
+        """Return the slack id for user_email or None if not a member."""
+        if not user_email:
+            return None
+        email = user_email.lower()
+
+        with self._lock:
+            now = time.time()
+            if now - self._refreshed_at > self.refresh_interval and \
+                    now - self._failed_at > self.retry_interval:
+                self.refresh()
+
+            slack_id = self._ids.get(email)
+            if slack_id:
+                return slack_id
+
+            missed_at = self._misses.get(email)
+            if missed_at and time.time() - missed_at < self.miss_interval:
+                return None
+
+            slack_id = self._lookup_by_email(email)
+            if slack_id:
+                self._ids[email] = slack_id
+                self._save()
+            else:
+                self._misses[email] = time.time()
+            return slack_id
+
+    def __len__(self):
+        """Return the number of indexed members."""
+        return len(self._ids)
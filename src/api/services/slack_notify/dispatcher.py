@@ -0,0 +1,103 @@
+"""
+Slack Notification Dispatcher.
+
+Request handlers enqueue messages and return immediately; a background
+worker coalesces messages to the same recipient and hands them to the
+configured transport.
+"""
+import logging
+import queue
+import threading
+import time
+from collections import OrderedDict
+
+
+class NotificationDispatcher(object):
+    """Queue Slack messages and deliver them off the request path."""
+
+    def __init__(self, transport, window=2.0, run_async=True):
+        """Create a dispatcher.
+
+        Args:
+            transport: object exposing `send(user_email, message)`
+            window (float): seconds to wait for more messages to the same
+                recipient before delivering
+            run_async (bool): deliver from a background thread, otherwise
+                messages wait for an explicit `flush()`
+        """
+        self.transport = transport
+        self.window = window
+        self.run_async = run_async
+        self._queue = queue.Queue()
+        self._worker = None
+        self._lock = threading.Lock()
+
+    def enqueue(self, user_email, message):
+        """Schedule message for the member with user_email."""
+        if not (user_email and message):
+            return
+        self._queue.put((user_email, message))
+        if self.run_async:
+            self._ensure_worker()
+
+    @property
+    def queue_depth(self):
+        """Return the number of messages waiting to be delivered."""
+        return self._queue.qsize()
+
+    def flush(self):
+        """Deliver every queued message now."""
+        batch = []
+        while True:
+            try:
+                batch.append(self._queue.get_nowait())
+            except queue.Empty:
+                break
+        self._deliver(batch)
+
+    @staticmethod
+    def coalesce(batch):
+        """Merge messages to the same recipient into one.
+
+        Args:
+            batch (list): (user_email, message) tuples in arrival order
+
+        Return:
+            list of (user_email, message) with one entry per recipient
+        """
+        messages = OrderedDict()
+        for user_email, message in batch:
+            recipient_messages = messages.setdefault(user_email, [])
+            if message not in recipient_messages:
+                recipient_messages.append(message)
+        return [(user_email, "\n\n".join(recipient_messages))
+                for user_email, recipient_messages in messages.items()]
+
+    def _deliver(self, batch):
+        for user_email, message in self.coalesce(batch):
+            try:
+                self.transport.send(user_email, message)
+            except Exception:
+                logging.exception("Failed to send slack message to %s",
+                                  user_email)
+
+    def _ensure_worker(self):
+        with self._lock:
+            if self._worker is None or not self._worker.is_alive():
+                self._worker = threading.Thread(
+                    target=self._run, name='slack-dispatcher', daemon=True)
+                self._worker.start()
+
+    def _run(self):
+        while True:
+            batch = [self._queue.get()]
+            deadline = time.time() + self.window
+            while True:
+                remaining = deadline - time.time()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(self._queue.get(timeout=remaining))
+                except queue.Empty:
+                    break
+            self._deliver(batch)
@@ -1,53 +1,25 @@
-import os
-import logging
+from flask import current_app
 
-from slackclient import SlackClient
+from .recipients import role_member_emails
 
 
 class SlackNotification(object):
+    """Mixin giving resources non-blocking Slack notifications."""
 
     def __init__(self):
-        slack_token = os.getenv('SLACK_API_TOKEN')
-        if slack_token:
-            self.sc = SlackClient(slack_token)
-        else:
-            pass
-
-
-
-    def get_slack_id(self, user_email):
-        user_email = user_email
-        results = self.sc.api_call("users.list")
-        users = results.get("members")
-
-        if users:
-            user_id = [
-                user.get("id")
-                for user in users
-                if user.get("profile").get("email") == user_email
-            ]
-
-        try:
-            return user_id[0]
-        except Exception:
-            logging.info("User not found")
-            return None
-
-
-    def send_message(self, message, slack_id):
-        self.sc.api_call(
-            "chat.postEphemeral",
-            channel=slack_id,
-            text=message,
-            username='@notifier',
-            user=slack_id,
-            as_user=True,
-            icon_emoji=':ninja:',
-        )
-
-    def send_notification(self, roles, users, message):
-        for role in roles:
-            if role in users:
-                user_email = role.email
-                slack_id = self.get_slack_id(user_email)
-                self.send_message(message, slack_id)
+        self.dispatcher = current_app.extensions['slack_dispatcher']
+
+    def notify(self, user_email, message):
+        """Queue a slack message for the member with user_email."""
+        self.dispatcher.enqueue(user_email, message)
+
+    def notify_role(self, role_name, message, society_id=None):
+        """Queue message for every holder of role_name.
+
+        Args:
+            role_name (str): role whose members are notified
+            message (str): text of the notification
+            society_id (str): only notify members of this society
+        """
+        for user_email in role_member_emails(role_name, society_id):
+            self.notify(user_email, message)
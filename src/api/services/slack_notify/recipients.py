@@ -0,0 +1,33 @@
+"""
+Notification Recipients Module.
+
+Resolves who should receive a notification directly in SQL instead of
+loading users into memory and matching them in Python.
+"""
+from api.models import User
+from api.models.base import user_role
+from api.services.auth.role_registry import role_registry
+
+
+def role_member_emails(role_name, society_id=None):
+    """Return the emails of users holding a role, in a single query.
+
+    The role is looked up in the role registry, so only the users and
+    their role links are read.
+
+    Args:
+        role_name (str): name of the role e.g. "society secretary"
+        society_id (str): restrict to members of this society, optional
+
+    Return:
+        set of email addresses
+    """
+    role_uuid = role_registry.uuid_for(role_name)
+    if role_uuid is None:
+        return set()
+    query = User.query.with_entities(User.email).join(
+        user_role, user_role.c.user_uuid == User.uuid).filter(
+            user_role.c.role_uuid == role_uuid)
+    if society_id is not None:
+        query = query.filter(User.society_id == society_id)
+    return {email for email, in query.distinct()}
@@ -0,0 +1,93 @@
+"""
+Slack Notification Transports.
+
+A transport delivers a message to a recipient identified by email. The
+dispatcher doesn't care how; tests plug in the fake transport.
+"""
+import logging
+
+from slackclient import SlackClient
+
+from .directory import SlackDirectory
+
+
+class SlackTransport(object):
+    """Deliver messages through the Slack Web API."""
+
+    def __init__(self, slack_token, directory_path=None,
+                 directory_refresh_interval=86400):
+        """Create a Slack client and the member directory it uses."""
+        self.sc = SlackClient(slack_token)
+        self.directory = SlackDirectory(
+            self.sc,
+            path=directory_path,
+            refresh_interval=directory_refresh_interval
+        )
+
+    def get_slack_id(self, user_email):
+        """Find the slack id of the workspace member with user_email."""
+        slack_id = self.directory.get_slack_id(user_email)
+        if not slack_id:
+            logging.info("User not found")
+        return slack_id
+
+    def send(self, user_email, message):
+        """Send an ephemeral message to the member with user_email."""
+        slack_id = self.get_slack_id(user_email)
+        if not slack_id:
+            return False
+
+        self.sc.api_call(
+            "chat.postEphemeral",
+            channel=slack_id,
+            text=message,
+            username='@notifier',
+            user=slack_id,
+            as_user=True,
+            icon_emoji=':ninja:',
+        )
+        return True
+
+
+class FakeTransport(object):
+    """Record messages in memory instead of sending them."""
+
+    def __init__(self):
+        """Start with an empty outbox."""
+        self.sent = []
+
+    def send(self, user_email, message):
+        """Record the message."""
+        self.sent.append((user_email, message))
+        return True
+
+
+class NullTransport(object):
+    """Drop messages when Slack isn't configured."""
+
+    def send(self, user_email, message):
+        """Log and discard the message."""
+        logging.info("Slack is not configured, dropping message to %s",
+                     user_email)
+        return False
+
+
+def build_transport(config):
+    """Create the transport selected by the app configuration.
+
+    Args:
+        config (dict): Flask app config
+
+    Return:
+        a transport exposing `send(user_email, message)`
+    """
+    if config.get('SLACK_TRANSPORT') == 'fake':
+        return FakeTransport()
+    if config.get('SLACK_API_TOKEN'):
+        return SlackTransport(
+            config['SLACK_API_TOKEN'],
+            directory_path=config.get('SLACK_DIRECTORY_PATH'),
+            directory_refresh_interval=config.get(
+                'SLACK_DIRECTORY_REFRESH_INTERVAL', 86400)
+        )
+    return NullTransport()
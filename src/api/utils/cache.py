@@ -0,0 +1,36 @@
+"""Keep process-wide caches in step with the rows they were built from."""
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session, object_session
+
+
+def invalidate_on_commit(models, cache):
+    """Invalidate cache after every committed change to one of models.
+
+    Inserts, updates and deletes of the models flag the session, and the
+    cache is invalidated once that transaction commits. The flag of a
+    rolled back transaction is dropped without touching the cache.
+
+    Args:
+        models (list): mapped classes the cache is built from
+        cache: object with an `invalidate()` method
+    """
+    flag = 'invalidate_cache_{}'.format(id(cache))
+
+    def mark_changed(mapper, connection, target):
+        session = object_session(target)
+        if session is not None:
+            session.info[flag] = True
+
+    def invalidate(session):
+        if session.info.pop(flag, False):
+            cache.invalidate()
+
+    def forget_changes(session, previous_transaction):
+        session.info.pop(flag, None)
+
+    for model in models:
+        for event_name in ('after_insert', 'after_update', 'after_delete'):
+            event.listen(model, event_name, mark_changed)
+    event.listen(Session, 'after_commit', invalidate)
+    event.listen(Session, 'after_soft_rollback', forget_changes)
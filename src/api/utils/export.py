@@ -0,0 +1,100 @@
+"""Stream listings as NDJSON or CSV without loading every row."""
+
+import csv
+import io
+import json
+
+from flask import Response, current_app, stream_with_context
+
+EXPORT_FORMATS = {
+    'ndjson': 'application/x-ndjson',
+    'csv': 'text/csv'
+}
+
+
+def export_format(args):
+    """Return the export format requested in args, None for plain JSON.
+
+    Raises:
+        ValueError: if the format isn't one of EXPORT_FORMATS
+    """
+    export = args.get('format', '').lower().strip()
+    if export in ('', 'json'):
+        return None
+    if export not in EXPORT_FORMATS:
+        raise ValueError('format must be one of: json, {}'.format(
+            ', '.join(sorted(EXPORT_FORMATS))))
+    return export
+
+
+def iter_chunks(query, chunk_size):
+    """Yield lists of up to chunk_size rows of query.
+
+    Rows are fetched with a server side cursor where the driver supports
+    one, so only a chunk of rows is held at a time.
+    """
+    chunk = []
+    for row in query.yield_per(chunk_size):
+        chunk.append(row)
+        if len(chunk) == chunk_size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def flatten(record, prefix=''):
+    """Flatten nested dicts into dotted keys for a CSV row."""
+    row = {}
+    for key, value in record.items():
+        if isinstance(value, dict):
+            row.update(flatten(value, '{}{}.'.format(prefix, key)))
+        else:
+            row[prefix + key] = value
+    return row
+
+
+def _ndjson_lines(chunks):
+    for records in chunks:
+        yield ''.join(json.dumps(record, default=str) + '\n'
+                      for record in records)
+
+
+def _csv_lines(chunks):
+    buffer = io.StringIO()
+    writer = None
+    for records in chunks:
+        for record in records:
+            row = flatten(record)
+            if writer is None:
+                # the columns are taken from the first row
+                writer = csv.DictWriter(buffer, fieldnames=list(row),
+                                        extrasaction='ignore')
+                writer.writeheader()
+            writer.writerow(row)
+        yield buffer.getvalue()
+        buffer.seek(0)
+        buffer.truncate()
+
+
+def stream_export(query, serialize, export, filename):
+    """Build a streamed response of every row of query.
+
+    Args:
+        query (Query): rows to export, in the order they are written
+        serialize (callable): turns a list of rows into a list of dicts
+        export (str): one of EXPORT_FORMATS
+        filename (str): name the download is saved as, without extension
+
+    Return:
+        Response written one chunk of rows at a time
+    """
+    chunk_size = current_app.config['EXPORT_CHUNK_SIZE']
+    chunks = (serialize(rows) for rows in iter_chunks(query, chunk_size))
+    lines = _csv_lines(chunks) if export == 'csv' else _ndjson_lines(chunks)
+
+    response = Response(stream_with_context(lines),
+                        mimetype=EXPORT_FORMATS[export])
+    response.headers['Content-Disposition'] = \
+        'attachment; filename={}.{}'.format(filename, export)
+    return response
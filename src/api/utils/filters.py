@@ -0,0 +1,142 @@
+"""Declarative filters applied to listings from request arguments."""
+
+from datetime import datetime, timedelta
+
+from sqlalchemy import DateTime
+
+
+class Filter(object):
+    """Filter a query on a column when its request argument is sent.
+
+    Columns of related models are reached by listing the relationships to
+    join in `joins`, every relationship is joined at most once per query.
+    """
+
+    def __init__(self, arg, column, joins=()):
+        """Filter on column with the value of the `arg` request argument."""
+        self.arg = arg
+        self.column = column
+        self.joins = tuple(joins)
+
+    @property
+    def args(self):
+        """Return the request arguments this filter reads."""
+        return (self.arg,)
+
+    def criteria(self, values):
+        """Return the SQL criteria for the sent values of self.args.
+
+        Raises:
+            ValueError: if a value is invalid
+        """
+        return [self.column == values[self.arg]]
+
+
+class OneOf(Filter):
+    """Match any of a comma separated list of values."""
+
+    def __init__(self, arg, column, choices=None, joins=(), normalize=None):
+        """Optionally restrict the accepted values to choices.
+
+        Every value is passed through normalize, e.g. str.lower, when given.
+        """
+        super().__init__(arg, column, joins)
+        self.choices = choices
+        self.normalize = normalize
+
+    def criteria(self, values):
+        """Return an IN criterion for the listed values."""
+        options = [value.strip() for value in values[self.arg].split(',')]
+        if self.normalize:
+            options = [self.normalize(option) for option in options]
+        if self.choices and set(options) - set(self.choices):
+            raise ValueError('{} must be one of: {}'.format(
+                self.arg, ', '.join(self.choices)))
+        return [self.column.in_(options)]
+
+
+class Range(Filter):
+    """Bound a column by a lower and an upper argument, both inclusive."""
+
+    def __init__(self, min_arg, max_arg, column, joins=()):
+        """Read the bounds from the min_arg and max_arg arguments."""
+        super().__init__(min_arg, column, joins)
+        self.min_arg = min_arg
+        self.max_arg = max_arg
+
+    @property
+    def args(self):
+        """Return the request arguments this filter reads."""
+        return (self.min_arg, self.max_arg)
+
+    def parse(self, arg, value):
+        """Convert a bound sent as text."""
+        try:
+            return int(value)
+        except ValueError:
+            raise ValueError('{} must be a number'.format(arg))
+
+    def criteria(self, values):
+        """Return the criteria for the sent bounds."""
+        criteria = []
+        if values.get(self.min_arg):
+            criteria.append(
+                self.column >= self.parse(self.min_arg, values[self.min_arg]))
+        if values.get(self.max_arg):
+            criteria.append(self.upper_bound(
+                self.parse(self.max_arg, values[self.max_arg])))
+        return criteria
+
+    def upper_bound(self, value):
+        """Return the criterion for the upper bound."""
+        return self.column <= value
+
+
+class DateRange(Range):
+    """Bound a date or datetime column by YYYY-MM-DD dates."""
+
+    def parse(self, arg, value):
+        """Convert a YYYY-MM-DD bound."""
+        try:
+            return datetime.strptime(value, '%Y-%m-%d').date()
+        except ValueError:
+            raise ValueError('{} must be a YYYY-MM-DD date'.format(arg))
+
+    def upper_bound(self, value):
+        """Include the whole end day of datetime columns."""
+        if isinstance(self.column.type, DateTime):
+            return self.column < value + timedelta(days=1)
+        return self.column <= value
+
+
+class FilterSet(object):
+    """Combine any of the filters sent in a request into one query."""
+
+    def __init__(self, *filters):
+        """Create a set of the filters a listing supports."""
+        self.filters = filters
+
+    def apply(self, query, values):
+        """Filter query with every filter an argument was sent for.
+
+        Args:
+            query (Query): listing to filter
+            values (dict): request arguments
+
+        Return:
+            the filtered query
+
+        Raises:
+            ValueError: if an argument value is invalid
+        """
+        joined = set()
+        for query_filter in self.filters:
+            if not any(values.get(arg) for arg in query_filter.args):
+                continue
+            for relationship in query_filter.joins:
+                # relationships compare into SQL, so track them by name
+                if str(relationship) not in joined:
+                    query = query.join(relationship)
+                    joined.add(str(relationship))
+            query = query.filter(*query_filter.criteria(values))
+        return query
@@ -1,21 +1,113 @@
 """Contain utility functions and constants."""
 
+import base64
+import binascii
+import json
 import requests, os
 from collections import namedtuple
+from datetime import datetime
+
 from flask import current_app, jsonify, request, url_for
+from sqlalchemy import tuple_
 
 from api.models import RedemptionRequest, Cohort
 
 
 PaginatedResult = namedtuple(
     'PaginatedResult',
-    ['data', 'count', 'page', 'pages', 'previous_url', 'next_url']
+    ['data', 'count', 'page', 'pages', 'previous_url', 'next_url',
+     'next_cursor']
 )
+PaginatedResult.__new__.__defaults__ = (None,)
+
+
+def encode_cursor(item):
+    """Build an opaque cursor pointing at item."""
+    position = json.dumps([item.created_at.isoformat(), item.uuid])
+    return base64.urlsafe_b64encode(position.encode()).decode().rstrip('=')
+
+
+def decode_cursor(cursor):
+    """Return the (created_at, uuid) position cursor points at.
+
+    Raise:
+        ValueError if the cursor is malformed
+    """
+    try:
+        created_at, uuid = json.loads(
+            base64.urlsafe_b64decode(cursor + '=' * (-len(cursor) % 4))
+            .decode())
+    except (TypeError, UnicodeError, binascii.Error) as error:
+        raise ValueError(error)
+    for date_format in ('%Y-%m-%dT%H:%M:%S.%f', '%Y-%m-%dT%H:%M:%S'):
+        try:
+            return datetime.strptime(created_at, date_format), uuid
+        except (TypeError, ValueError):
+            continue
+    raise ValueError(f"Invalid cursor date {created_at}")
+
+
+def keyset_query(query, position=None):
+    """Order query newest first and start it after position.
+
+    The (created_at, uuid) row comparison and ordering match the
+    ix_*_created_at_uuid indexes, so a page is a range scan of the index.
+
+    Args:
+        query: query of a model deriving from Base
+        position (tuple): (created_at, uuid) of the last row already seen
+
+    Return:
+        query
+    """
+    model = query.column_descriptions[0]['entity']
+    query = query.order_by(None).order_by(
+        model.created_at.desc(), model.uuid.desc())
+    if position:
+        query = query.filter(
+            tuple_(model.created_at, model.uuid) < tuple(position))
+    return query
+
+
+def keyset_page(query, cursor, limit, with_count=False):
+    """Fetch the rows of query that follow cursor, newest first.
+
+    Rows are ordered on (created_at, uuid) so each page is an index range
+    scan instead of an OFFSET over all previous pages.
+
+    Args:
+        query: query of a model deriving from Base
+        cursor (str): cursor of the last row already seen, empty for the
+            first page
+        limit (int): number of rows to return
+        with_count (bool): also count all rows of query
+
+    Return:
+        (items, count, next_cursor), count is None unless requested and
+        next_cursor is None on the last page
+    """
+    count = query.order_by(None).count() if with_count else None
+    position = decode_cursor(cursor) if cursor else None
+
+    items = keyset_query(query, position).limit(limit + 1).all()
+    next_cursor = encode_cursor(items[limit - 1]) \
+        if len(items) > limit else None
+    return items[:limit], count, next_cursor
 
 
 def paginate_items(fetched_data, serialize=True):
-    """Paginate all roles for display."""
-    from api.endpoints.redemption_requests.helpers import serialize_redmp
+    """Paginate all roles for display.
+
+    Pages are numbered unless a `cursor` argument is sent, rows are then
+    returned newest first starting after the cursor. The total count is
+    only computed in cursor mode when `count=true` is sent.
+
+    Raise:
+        ValueError if the cursor is malformed and serialize is False,
+        a 400 response is returned for it otherwise
+    """
+    from api.endpoints.redemption_requests.helpers import \
+        serialize_redemptions
 
     _page = request.args.get('page', type=int) or \
         current_app.config['DEFAULT_PAGE']
@@ -24,47 +116,75 @@ def paginate_items(fetched_data, serialize=True):
     page = current_app.config['DEFAULT_PAGE'] if _page < 0 else _page
     limit = current_app.config['PAGE_LIMIT'] if _limit < 0 else _limit
 
-    fetched_data = fetched_data.paginate(
-        page=page,
-        per_page=limit,
-        error_out=False
-    )
-    if fetched_data.items:
-        previous_url = None
-        next_url = None
+    previous_url = None
+    next_url = None
+    next_cursor = None
+
+    if 'cursor' in request.args:
+        try:
+            items, count, next_cursor = keyset_page(
+                fetched_data, request.args['cursor'], limit,
+                with_count=request.args.get('count', '').lower() == 'true'
+            )
+        except ValueError:
+            if not serialize:
+                raise ValueError("Invalid cursor.")
+            return response_builder(dict(
+                status="fail",
+                message="Invalid cursor."
+            ), 400)
+        page = pages = None
+
+        if next_cursor:
+            args = request.args.to_dict()
+            args.update(request.view_args or {}, cursor=next_cursor,
+                        limit=limit)
+            next_url = url_for(request.endpoint, _external=True, **args)
+    else:
+        fetched_data = fetched_data.paginate(
+            page=page,
+            per_page=limit,
+            error_out=False
+        )
+        items = fetched_data.items
+        count = fetched_data.total
+        page = fetched_data.page
+        pages = fetched_data.pages
 
+        # keep the path parameters and filters of the current request
+        args = request.args.to_dict()
+        args.update(request.view_args or {}, limit=limit)
         if fetched_data.has_next:
-            next_url = url_for(request.endpoint, limit=limit,
-                               page=page+1, _external=True)
+            args['page'] = page + 1
+            next_url = url_for(request.endpoint, _external=True, **args)
         if fetched_data.has_prev:
-            previous_url = url_for(request.endpoint, limit=limit,
-                                   page=page-1, _external=True)
+            args['page'] = page - 1
+            previous_url = url_for(request.endpoint, _external=True, **args)
 
+    if items:
         if serialize:
-            data_list = []
-            for _fetched_item in fetched_data.items:
-                if isinstance(_fetched_item, RedemptionRequest):
-                    data_item = serialize_redmp(_fetched_item)
-                    data_list.append(data_item)
-                else:
-                    data_item = _fetched_item.serialize()
-                    data_list.append(data_item)
+            if isinstance(items[0], RedemptionRequest):
+                # related rows of the whole page are loaded together
+                data_list = serialize_redemptions(items)
+            else:
+                data_list = [item.serialize() for item in items]
         else:
-            data_list = fetched_data.items
+            data_list = items
 
             return PaginatedResult(
-                data_list, fetched_data.total, fetched_data.page,
-                fetched_data.pages, previous_url, next_url
+                data_list, count, page, pages, previous_url, next_url,
+                next_cursor
             )
 
         return response_builder(dict(
             status="success",
             data=data_list,
-            count=fetched_data.total,
-            pages=fetched_data.pages,
+            count=count,
+            pages=pages,
             nextUrl=next_url,
             previousUrl=previous_url,
-            currentPage=fetched_data.page,
+            currentPage=page,
+            nextCursor=next_cursor,
             message="fetched successfully."
         ), 200)
 
@@ -0,0 +1,105 @@
+"""
+Index Advisor Module.
+
+Runs EXPLAIN on the query shapes behind the hot endpoints and reports the
+ones that scan a whole table instead of using an index.
+"""
+import re
+from collections import OrderedDict
+from datetime import datetime
+
+from api.models import LoggedActivity, RedemptionRequest, User
+from api.models.base import db, user_role
+from api.utils.helpers import keyset_query
+
+
+# sample values only shape the plan, the queries are never run
+PAGE_POSITION = (datetime(2018, 1, 1), '00000000-0000-7000-8000-000000000000')
+QUERY_SHAPES = OrderedDict([
+    ('user points earned', lambda: db.session.query(
+        db.func.sum(LoggedActivity.value)).filter(
+            LoggedActivity.user_id == 'user-id',
+            LoggedActivity.status == 'approved')),
+    ('society logged activities by status', lambda: LoggedActivity.query
+        .filter_by(society_id='society-id', status='approved')),
+    ('logged activities page', lambda: keyset_query(
+        LoggedActivity.query, PAGE_POSITION).limit(10)),
+    ('society redemptions by status', lambda: RedemptionRequest.query
+        .filter_by(society_id='society-id', status='pending')),
+    ('center redemptions by status', lambda: RedemptionRequest.query
+        .filter_by(center_id='center-id', status='approved')),
+    ('redemptions page', lambda: keyset_query(
+        RedemptionRequest.query, PAGE_POSITION).limit(10)),
+    ('society members', lambda: User.query.filter_by(
+        society_id='society-id')),
+    ('role members', lambda: db.session.query(user_role).filter(
+        user_role.c.role_uuid == 'role-id')),
+])
+
+POSTGRES_SEQ_SCAN = re.compile(r'Seq Scan on (\w+)')
+SQLITE_SCAN = re.compile(r'^SCAN (?:TABLE )?(\w+)(.*)$')
+
+
+def explain(query, connection):
+    """Return the plan of query as a list of lines.
+
+    Args:
+        query: SQLAlchemy query to explain
+        connection: connection the plan is requested on
+
+    Return:
+        list of str
+    """
+    compiled = query.statement.compile(dialect=connection.dialect)
+    params = compiled.params
+    if compiled.positional:
+        params = tuple(params[name] for name in compiled.positiontup)
+
+    if connection.dialect.name == 'sqlite':
+        rows = connection.execute(
+            'EXPLAIN QUERY PLAN ' + str(compiled), params)
+        return [row[-1] for row in rows]
+    rows = connection.execute('EXPLAIN ' + str(compiled), params)
+    return [row[0] for row in rows]
+
+
+def sequential_scans(plan):
+    """Return the tables a plan reads without using an index."""
+    tables = []
+    for line in plan:
+        match = POSTGRES_SEQ_SCAN.search(line)
+        if match:
+            tables.append(match.group(1))
+            continue
+        match = SQLITE_SCAN.match(line.strip())
+        if match and 'USING' not in match.group(2):
+            tables.append(match.group(1))
+    return tables
+
+
+def advise(shapes=None):
+    """Explain every registered query shape.
+
+    On PostgreSQL sequential scans are disabled while planning so that a
+    small table doesn't hide a missing index.
+
+    Args:
+        shapes (dict): name -> function building the query, defaults to
+            QUERY_SHAPES
+
+    Return:
+        OrderedDict of shape name -> (plan lines, sequentially read tables)
+    """
+    report = OrderedDict()
+    connection = db.engine.connect()
+    transaction = connection.begin()
+    try:
+        if connection.dialect.name == 'postgresql':
+            connection.execute('SET LOCAL enable_seqscan = off')
+        for name, build_query in (shapes or QUERY_SHAPES).items():
+            plan = explain(build_query(), connection)
+            report[name] = (plan, sequential_scans(plan))
+    finally:
+        transaction.rollback()
+        connection.close()
+    return report
@@ -17,16 +17,18 @@ from api.endpoints.activity_types import activitiy_type_bp
 from api.endpoints.users import users_bp
 from api.models import Base
 from api.models import Center, Cohort, Society, Activity, Role, User
+from api.services.auth import role_registry
+from api.services.slack_notify import NotificationDispatcher, build_transport
 
 
 config_name = os.getenv('APP_SETTINGS', default='production').lower()
 
 try:
     from .config import configuration
-    from .email_handeler import send_email_async
+    from .email_handeler import EmailWorkerPool, send_email_async
 except ImportError:
     from config import configuration
-    from email_handeler import send_email_async
+    from email_handeler import EmailWorkerPool, send_email_async
 
 
 def create_app(config=configuration[config_name]):
@@ -47,6 +49,29 @@ def create_app(config=configuration[config_name]):
     mail = Mail(app)
     mail.init_app(app)
 
+    # send emails from a bounded pool of workers sharing SMTP connections
+    app.extensions['email_pool'] = EmailWorkerPool(
+        app, mail,
+        workers=app.config['EMAIL_WORKERS'],
+        maxsize=app.config['EMAIL_QUEUE_SIZE'],
+        batch_size=app.config['EMAIL_BATCH_SIZE'],
+        max_retries=app.config['EMAIL_MAX_RETRIES'],
+        backoff=app.config['EMAIL_RETRY_BACKOFF']
+    )
+
+    # queue slack notifications so requests don't wait on Slack
+    slack_dispatcher = NotificationDispatcher(
+        build_transport(app.config),
+        window=app.config['SLACK_COALESCE_WINDOW'],
+        run_async=app.config['SLACK_NOTIFICATIONS_ASYNC']
+    )
+    app.extensions['slack_dispatcher'] = slack_dispatcher
+
+    if not slack_dispatcher.run_async:
+        @app.teardown_request
+        def flush_slack_notifications(exception=None):
+            slack_dispatcher.flush()
+
     # enable cross origin resource sharing
     CORS(app)
 
@@ -106,6 +131,11 @@ def create_app(config=configuration[config_name]):
         url_prefix=url_version_1
     )
 
+    # load the role registry used by authorization checks
+    @app.before_first_request
+    def load_role_registry():
+        role_registry.refresh()
+
     # enable health check ping to API
     @app.route('/')
     def health_check_url():
@@ -33,11 +33,43 @@ class Config(object):
         # can be int or valid cron day string
     )
 
+    SLACK_API_TOKEN = os.environ.get('SLACK_API_TOKEN')
+    SLACK_TRANSPORT = os.getenv('SLACK_TRANSPORT', 'slack')
+    SLACK_NOTIFICATIONS_ASYNC = True
+    # seconds to wait for more messages to the same recipient
+    SLACK_COALESCE_WINDOW = float(os.getenv('SLACK_COALESCE_WINDOW', 2))
+    # email -> slack id index, rebuilt from users.list once a day
+    SLACK_DIRECTORY_PATH = os.getenv(
+        'SLACK_DIRECTORY_PATH', os.path.join(BASE_DIR, 'slack_directory.json'))
+    SLACK_DIRECTORY_REFRESH_INTERVAL = int(
+        os.getenv('SLACK_DIRECTORY_REFRESH_INTERVAL', 86400))
+
     MAIL_SERVER = os.environ.get('MAIL_SERVER')
     MAIL_PORT = int(os.environ.get('MAIL_PORT', 25))
     MAIL_USE_TLS = os.environ.get('MAIL_USE_TLS') is not None
     MAIL_USERNAME = os.environ.get('MAIL_USERNAME')
     MAIL_PASSWORD = os.environ.get('MAIL_PASSWORD')
+    EMAIL_WORKERS = int(os.getenv('EMAIL_WORKERS', 2))
+    EMAIL_QUEUE_SIZE = int(os.getenv('EMAIL_QUEUE_SIZE', 100))
+    # messages sent over one SMTP connection
+    EMAIL_BATCH_SIZE = int(os.getenv('EMAIL_BATCH_SIZE', 20))
+    EMAIL_MAX_RETRIES = int(os.getenv('EMAIL_MAX_RETRIES', 3))
+    EMAIL_RETRY_BACKOFF = float(os.getenv('EMAIL_RETRY_BACKOFF', 1))
+
+    # notifications delivered by `manage.py drain_outbox`
+    OUTBOX_BATCH_SIZE = int(os.getenv('OUTBOX_BATCH_SIZE', 50))
+    OUTBOX_MAX_ATTEMPTS = int(os.getenv('OUTBOX_MAX_ATTEMPTS', 5))
+    OUTBOX_RETRY_BACKOFF = int(os.getenv('OUTBOX_RETRY_BACKOFF', 30))
+    # seconds a claimed batch is hidden from other workers
+    OUTBOX_LEASE = int(os.getenv('OUTBOX_LEASE', 300))
+    OUTBOX_POLL_INTERVAL = float(os.getenv('OUTBOX_POLL_INTERVAL', 5))
+
+    # rows fetched and written per chunk by `format=ndjson|csv` exports
+    EXPORT_CHUNK_SIZE = int(os.getenv('EXPORT_CHUNK_SIZE', 500))
+    # logged activities approved per transaction by a bulk approval
+    BULK_APPROVAL_CHUNK_SIZE = int(os.getenv('BULK_APPROVAL_CHUNK_SIZE', 500))
+    # seconds a stored Idempotency-Key response can be replayed for
+    IDEMPOTENCY_KEY_TTL = int(os.getenv('IDEMPOTENCY_KEY_TTL', 86400))
 
 
 class Development(Config):
@@ -58,6 +90,8 @@ class Testing(Config):
     SQLALCHEMY_DATABASE_URI = os.environ.get('TEST_DATABASE') or \
         "sqlite:///" + Config.BASE_DIR + "/dev_db.sqlite"
     PUBLIC_KEY = os.environ.get('PUBLIC_KEY_TEST')
+    SLACK_TRANSPORT = 'fake'
+    SLACK_NOTIFICATIONS_ASYNC = False
     ISSUER = "tests"
     API_IDENTIFIER = "tests"
     NOTIFICATIONS_SENDER = os.getenv(
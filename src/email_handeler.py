@@ -1,5 +1,9 @@
-from threading import Thread
+import logging
 import os
+import queue
+import threading
+import time
+
 from flask_mail import Message
 
 
@@ -9,14 +13,130 @@ def construct_email_mes(subject, sender, recipients, body):
     return msg
 
 
-def send_email(app, message, mail):
-    with app.app_context():
-        mail.send(message)
+class EmailWorkerPool(object):
+    """Send emails from a fixed number of background workers.
+
+    Messages wait in a bounded queue. Each worker takes whatever is queued,
+    up to `batch_size` messages, and sends them over a single SMTP
+    connection. Failed messages are retried with exponential backoff.
+    """
+
+    def __init__(self, app, mail, workers=2, maxsize=100, batch_size=20,
+                 max_retries=3, backoff=1.0, enqueue_timeout=5):
+        """Create a pool, workers are started on the first message.
+
+        Args:
+            app (Flask): app whose context the workers send in
+            mail (Mail): Flask-Mail extension used to connect
+            workers (int): number of worker threads
+            maxsize (int): messages that may wait in the queue
+            batch_size (int): messages sent per SMTP connection
+            max_retries (int): attempts after the first failed one
+            backoff (float): seconds before the first retry, doubled on
+                every following retry
+            enqueue_timeout (float): seconds to wait for room in a full queue
+        """
+        self.app = app
+        self.mail = mail
+        self.workers = workers
+        self.batch_size = batch_size
+        self.max_retries = max_retries
+        self.backoff = backoff
+        self.enqueue_timeout = enqueue_timeout
+        self._queue = queue.Queue(maxsize)
+        self._threads = []
+        self._lock = threading.Lock()
+
+    def enqueue(self, message):
+        """Queue message for delivery.
+
+        Return:
+            True if the message was queued, False if the queue stayed full
+        """
+        self._ensure_workers()
+        try:
+            self._queue.put(message, timeout=self.enqueue_timeout)
+        except queue.Full:
+            logging.error("Email queue is full, dropping %r", message.subject)
+            return False
+        return True
+
+    @property
+    def queue_depth(self):
+        """Return the number of messages waiting to be sent."""
+        return self._queue.qsize()
+
+    def flush(self):
+        """Send every queued message from the calling thread."""
+        while True:
+            batch = self._take_batch(block=False)
+            if not batch:
+                break
+            self._send_batch(batch)
+
+    def _take_batch(self, block=True):
+        batch = []
+        try:
+            batch.append(self._queue.get(block=block))
+        except queue.Empty:
+            return batch
+        while len(batch) < self.batch_size:
+            try:
+                batch.append(self._queue.get_nowait())
+            except queue.Empty:
+                break
+        return batch
+
+    def _send_batch(self, batch):
+        pending = batch
+        attempt = 0
+        while pending:
+            failed = []
+            sent = set()
+            with self.app.app_context():
+                try:
+                    with self.mail.connect() as connection:
+                        for message in pending:
+                            try:
+                                connection.send(message)
+                                sent.add(id(message))
+                            except Exception:
+                                logging.exception("Failed to send email %r",
+                                                  message.subject)
+                                failed.append(message)
+                except Exception:
+                    logging.exception("Mail server connection failed")
+                    # the connection may fail on close after sending some
+                    # messages, only the others are retried
+                    failed = [message for message in pending
+                              if id(message) not in sent]
+            if not failed:
+                break
+            if attempt >= self.max_retries:
+                logging.error("Giving up on %d email(s) after %d retries",
+                              len(failed), attempt)
+                break
+            time.sleep(self.backoff * 2 ** attempt)
+            attempt += 1
+            pending = failed
+
+    def _ensure_workers(self):
+        with self._lock:
+            self._threads = [thread for thread in self._threads
+                             if thread.is_alive()]
+            while len(self._threads) < self.workers:
+                thread = threading.Thread(
+                    target=self._run, name='email-worker', daemon=True)
+                thread.start()
+                self._threads.append(thread)
+
+    def _run(self):
+        while True:
+            self._send_batch(self._take_batch())
 
 
 def send_email_async(app, **kwargs):
     payload = kwargs['payload']
-    mail = kwargs['mail']
     message = construct_email_mes(
         payload['subject'],
         payload['sender'],
@@ -27,6 +147,6 @@ def send_email_async(app, **kwargs):
     environment = os.environ.get('APP_SETTINGS')
     allowed_env = ["production", "staging", "development"]
     if environment and (environment.lower() in allowed_env):
-        Thread(target=send_email, args=(app, message, mail)).start()
+        app.extensions['email_pool'].enqueue(message)
     else:
         return message
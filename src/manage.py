@@ -6,6 +6,9 @@ import csv
 import os
 import sys
 import logging
+import time
+
+import click
 
 from flask_migrate import Migrate
 from flask.cli import FlaskGroup
@@ -15,6 +18,10 @@ from api.models import Cohort, Society
 
 from app import create_app
 from api.models.base import db
+from api.services.idempotency import purge_expired_keys
+from api.services.outbox import OutboxWorker
+from api.services.points import reconcile
+from api.utils.index_advisor import advise
 from run_tests import test
 
 
@@ -136,6 +143,68 @@ def link_society_cohort_csv_data(path='data/cohort_data.csv'):
                     linker(cohort_name.lower(), society_name.lower())
 
 
+@cli.command()
+@click.option('--batch-size', type=int, default=None,
+              help='Rows claimed per batch.')
+@click.option('--once', is_flag=True,
+              help='Exit once nothing is due instead of polling.')
+def drain_outbox(batch_size, once):
+    """Deliver queued email and slack notifications."""
+    config = app.config
+    worker = OutboxWorker(
+        app.extensions['mail'],
+        app.extensions['slack_dispatcher'].transport,
+        batch_size=batch_size or config['OUTBOX_BATCH_SIZE'],
+        max_attempts=config['OUTBOX_MAX_ATTEMPTS'],
+        backoff=config['OUTBOX_RETRY_BACKOFF'],
+        lease=config['OUTBOX_LEASE']
+    )
+    while True:
+        delivered = worker.drain()
+        if delivered:
+            print(f"Processed {delivered} outbox message(s).")
+        if once:
+            return
+        time.sleep(config['OUTBOX_POLL_INTERVAL'])
+
+
+@cli.command()
+def purge_idempotency_keys():
+    """Delete stored Idempotency-Key responses past their retention."""
+    print(f"Deleted {purge_expired_keys()} expired idempotency key(s).")
+
+
+@cli.command()
+@click.option('--verbose', is_flag=True, help='Print every query plan.')
+def index_advisor(verbose):
+    """Report hot queries that scan whole tables."""
+    missing = 0
+    for name, (plan, scanned_tables) in advise().items():
+        if scanned_tables:
+            missing += 1
+            print(f"SEQ SCAN  {name}: {', '.join(scanned_tables)}")
+        else:
+            print(f"ok        {name}")
+        if verbose:
+            for line in plan:
+                print(f"            {line}")
+    if missing:
+        sys.exit(1)
+
+
+@cli.command()
+@click.option('--dry-run', is_flag=True,
+              help='Only report balances that differ from the ledger.')
+def reconcile_points(dry_run):
+    """Recompute society points balances from the points ledger."""
+    mismatches = reconcile(apply=not dry_run)
+    for society, column, stored, expected in mismatches:
+        print(f"{society.name}: {column} was {stored}, ledger says "
+              f"{expected}")
+    action = "Found" if dry_run else "Fixed"
+    print(f"{action} {len(mismatches)} mismatched balance(s).")
+
+
 @cli.command()
 def tests():
     """Run the tests."""
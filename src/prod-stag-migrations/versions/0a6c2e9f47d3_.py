@@ -0,0 +1,25 @@
+"""add idempotency keys created_at index
+
+Revision ID: 0a6c2e9f47d3
+Revises: f1b7d3a08c42
+Create Date: 2026-10-19 11:02:37.114829
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = '0a6c2e9f47d3'
+down_revision = 'f1b7d3a08c42'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_index('ix_idempotency_keys_created_at', 'idempotency_keys',
+                    ['created_at'], unique=False)
+
+
+def downgrade():
+    op.drop_index('ix_idempotency_keys_created_at',
+                  table_name='idempotency_keys')
@@ -0,0 +1,49 @@
+"""add finance routes
+
+Revision ID: 2d8e4b71f3a9
+Revises: 9b3f6a2e8d14
+Create Date: 2026-10-18 23:41:07.318254
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision = '2d8e4b71f3a9'
+down_revision = '9b3f6a2e8d14'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table('finance_routes',
+    sa.Column('uuid', postgresql.UUID(), nullable=False),
+    sa.Column('name', sa.String(), nullable=True),
+    sa.Column('photo', sa.String(), nullable=True),
+    sa.Column('created_at', sa.DateTime(), nullable=True),
+    sa.Column('modified_at', sa.DateTime(), nullable=True),
+    sa.Column('description', sa.String(), nullable=True),
+    sa.Column('center_id', sa.String(), nullable=False),
+    sa.Column('channel', sa.String(), nullable=False),
+    sa.Column('email', sa.String(), nullable=False),
+    sa.ForeignKeyConstraint(['center_id'], ['centers.uuid'], ),
+    sa.PrimaryKeyConstraint('uuid'),
+    sa.UniqueConstraint('center_id', 'channel', 'email',
+                        name='uq_finance_routes_center_channel_email')
+    )
+
+    # the mailboxes that used to be derived from the center names
+    op.execute(
+        "INSERT INTO finance_routes (uuid, created_at, center_id, channel, "
+        "email) "
+        "SELECT md5(random()::text || uuid)::uuid, now(), uuid, 'email', "
+        "lower(name) || CASE WHEN lower(name) = 'kampala' "
+        "THEN '.finance@andela.com' ELSE '-finance@andela.com' END "
+        "FROM centers WHERE name IS NOT NULL"
+    )
+
+
+def downgrade():
+    op.drop_table('finance_routes')
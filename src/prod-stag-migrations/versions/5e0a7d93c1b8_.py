@@ -0,0 +1,58 @@
+"""add society points ledger
+
+Revision ID: 5e0a7d93c1b8
+Revises: c52d9e1f4a70
+Create Date: 2026-10-18 18:25:47.630145
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision = '5e0a7d93c1b8'
+down_revision = 'c52d9e1f4a70'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table('points_transactions',
+    sa.Column('uuid', postgresql.UUID(), nullable=False),
+    sa.Column('name', sa.String(), nullable=True),
+    sa.Column('photo', sa.String(), nullable=True),
+    sa.Column('created_at', sa.DateTime(), nullable=True),
+    sa.Column('modified_at', sa.DateTime(), nullable=True),
+    sa.Column('description', sa.String(), nullable=True),
+    sa.Column('society_id', postgresql.UUID(), nullable=False),
+    sa.Column('kind', sa.String(), nullable=False),
+    sa.Column('value', sa.Integer(), nullable=False),
+    sa.Column('logged_activity_id', postgresql.UUID(), nullable=True),
+    sa.Column('redemption_id', postgresql.UUID(), nullable=True),
+    sa.ForeignKeyConstraint(['society_id'], ['societies.uuid'], ),
+    sa.ForeignKeyConstraint(['logged_activity_id'],
+                            ['logged_activities.uuid'], ),
+    sa.ForeignKeyConstraint(['redemption_id'], ['redemptions.uuid'], ),
+    sa.PrimaryKeyConstraint('uuid')
+    )
+    op.create_index('ix_points_transactions_society_id_kind',
+                    'points_transactions', ['society_id', 'kind'],
+                    unique=False)
+
+    # open the ledger with the current balances so it reconciles
+    for kind, column in (('earned', '_total_points'),
+                         ('redeemed', '_used_points')):
+        op.execute(
+            "INSERT INTO points_transactions "
+            "(uuid, name, created_at, society_id, kind, value) "
+            f"SELECT md5(random()::text || uuid::text)::uuid, "
+            f"'opening balance', now(), uuid, '{kind}', {column} "
+            f"FROM societies WHERE coalesce({column}, 0) != 0"
+        )
+
+
+def downgrade():
+    op.drop_index('ix_points_transactions_society_id_kind',
+                  table_name='points_transactions')
+    op.drop_table('points_transactions')
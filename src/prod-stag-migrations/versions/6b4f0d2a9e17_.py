@@ -0,0 +1,38 @@
+"""make created_at not null
+
+Revision ID: 6b4f0d2a9e17
+Revises: 0a6c2e9f47d3
+Create Date: 2026-10-19 15:26:48.903512
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '6b4f0d2a9e17'
+down_revision = '0a6c2e9f47d3'
+branch_labels = None
+depends_on = None
+
+
+TABLES = [
+    'activities', 'activity_types', 'centers', 'cohorts', 'finance_routes',
+    'idempotency_keys', 'logged_activities', 'outbox', 'points_aggregates',
+    'points_transactions', 'redemptions', 'roles', 'societies', 'users',
+]
+
+
+def upgrade():
+    for table in TABLES:
+        op.execute(f"UPDATE {table} SET created_at = "
+                   f"COALESCE(modified_at, CURRENT_TIMESTAMP) "
+                   f"WHERE created_at IS NULL")
+        op.alter_column(table, 'created_at', existing_type=sa.DateTime(),
+                        nullable=False)
+
+
+def downgrade():
+    for table in reversed(TABLES):
+        op.alter_column(table, 'created_at', existing_type=sa.DateTime(),
+                        nullable=True)
@@ -0,0 +1,40 @@
+"""add idempotency keys
+
+Revision ID: 7c1e5f93b0d6
+Revises: 2d8e4b71f3a9
+Create Date: 2026-10-19 01:12:44.902117
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision = '7c1e5f93b0d6'
+down_revision = '2d8e4b71f3a9'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table('idempotency_keys',
+    sa.Column('uuid', postgresql.UUID(), nullable=False),
+    sa.Column('name', sa.String(), nullable=True),
+    sa.Column('photo', sa.String(), nullable=True),
+    sa.Column('created_at', sa.DateTime(), nullable=True),
+    sa.Column('modified_at', sa.DateTime(), nullable=True),
+    sa.Column('description', sa.String(), nullable=True),
+    sa.Column('user_id', sa.String(), nullable=False),
+    sa.Column('key', sa.String(), nullable=False),
+    sa.Column('fingerprint', sa.String(), nullable=False),
+    sa.Column('status_code', sa.Integer(), nullable=False),
+    sa.Column('response', sa.Text(), nullable=False),
+    sa.PrimaryKeyConstraint('uuid'),
+    sa.UniqueConstraint('user_id', 'key',
+                        name='uq_idempotency_keys_user_id_key')
+    )
+
+
+def downgrade():
+    op.drop_table('idempotency_keys')
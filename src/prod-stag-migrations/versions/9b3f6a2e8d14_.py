@@ -0,0 +1,84 @@
+"""add points aggregates
+
+Revision ID: 9b3f6a2e8d14
+Revises: 5e0a7d93c1b8
+Create Date: 2026-10-18 20:02:13.904562
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision = '9b3f6a2e8d14'
+down_revision = '5e0a7d93c1b8'
+branch_labels = None
+depends_on = None
+
+
+MONTH = "to_char(coalesce(activity_date, created_at::date), 'YYYY-MM')"
+BUCKETS = [
+    ('total', "''"),
+    ('activity_type', 'activity_type_id::text'),
+    ('month', MONTH),
+]
+OWNERS = [('user', 'user_id'), ('society', 'society_id::text')]
+
+
+def backfill(counters, source, where, dimensions, owners):
+    """Sum source rows into aggregates, adding to existing rows."""
+    for dimension, bucket in dimensions:
+        for scope, owner in owners:
+            op.execute(
+                "INSERT INTO points_aggregates (uuid, created_at, scope, "
+                "owner_id, dimension, bucket, points, approved, rejected, "
+                "redeemed) "
+                f"SELECT md5(random()::text || {owner} || {bucket})::uuid, "
+                f"now(), '{scope}', {owner}, '{dimension}', {bucket}, "
+                f"{counters} FROM {source} WHERE {where} "
+                f"GROUP BY {owner}, {bucket} "
+                "ON CONFLICT ON CONSTRAINT uq_points_aggregates_key "
+                "DO UPDATE SET "
+                "points = points_aggregates.points + EXCLUDED.points, "
+                "approved = points_aggregates.approved + EXCLUDED.approved, "
+                "rejected = points_aggregates.rejected + EXCLUDED.rejected, "
+                "redeemed = points_aggregates.redeemed + EXCLUDED.redeemed"
+            )
+
+
+def upgrade():
+    op.create_table('points_aggregates',
+    sa.Column('uuid', postgresql.UUID(), nullable=False),
+    sa.Column('name', sa.String(), nullable=True),
+    sa.Column('photo', sa.String(), nullable=True),
+    sa.Column('created_at', sa.DateTime(), nullable=True),
+    sa.Column('modified_at', sa.DateTime(), nullable=True),
+    sa.Column('description', sa.String(), nullable=True),
+    sa.Column('scope', sa.String(), nullable=False),
+    sa.Column('owner_id', sa.String(), nullable=False),
+    sa.Column('dimension', sa.String(), nullable=False),
+    sa.Column('bucket', sa.String(), nullable=False),
+    sa.Column('points', sa.Integer(), nullable=False),
+    sa.Column('approved', sa.Integer(), nullable=False),
+    sa.Column('rejected', sa.Integer(), nullable=False),
+    sa.Column('redeemed', sa.Integer(), nullable=False),
+    sa.PrimaryKeyConstraint('uuid'),
+    sa.UniqueConstraint('scope', 'owner_id', 'dimension', 'bucket',
+                        name='uq_points_aggregates_key')
+    )
+
+    backfill("sum(value), count(*), 0, 0", 'logged_activities',
+             "status = 'approved'", BUCKETS, OWNERS)
+    backfill("0, 0, count(*), 0", 'logged_activities',
+             "status = 'rejected'", BUCKETS, OWNERS)
+    backfill("0, 0, 0, sum(value)", 'redemptions',
+             "status IN ('approved', 'completed')",
+             [('total', "''"),
+              ('month', "to_char(coalesce(modified_at, created_at), "
+                        "'YYYY-MM')")],
+             [('society', 'society_id::text')])
+
+
+def downgrade():
+    op.drop_table('points_aggregates')
@@ -0,0 +1,44 @@
+"""add indexes for hot filters
+
+Revision ID: a81c4e07b2d5
+Revises: 3f9b2c61d8a4
+Create Date: 2026-10-18 14:03:21.552810
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = 'a81c4e07b2d5'
+down_revision = '3f9b2c61d8a4'
+branch_labels = None
+depends_on = None
+
+
+INDEXES = [
+    ('ix_logged_activities_user_id_status', 'logged_activities',
+     ['user_id', 'status']),
+    ('ix_logged_activities_society_id_status', 'logged_activities',
+     ['society_id', 'status']),
+    ('ix_logged_activities_created_at_uuid', 'logged_activities',
+     ['created_at', 'uuid']),
+    ('ix_redemptions_society_id_status', 'redemptions',
+     ['society_id', 'status']),
+    ('ix_redemptions_center_id_status', 'redemptions',
+     ['center_id', 'status']),
+    ('ix_redemptions_created_at_uuid', 'redemptions',
+     ['created_at', 'uuid']),
+    ('ix_users_society_id', 'users', ['society_id']),
+    ('ix_user_role_user_uuid', 'user_role', ['user_uuid']),
+    ('ix_user_role_role_uuid', 'user_role', ['role_uuid']),
+]
+
+
+def upgrade():
+    for name, table, columns in INDEXES:
+        op.create_index(name, table, columns, unique=False)
+
+
+def downgrade():
+    for name, table, _ in reversed(INDEXES):
+        op.drop_index(name, table_name=table)
@@ -0,0 +1,95 @@
+"""store generated ids as native uuids
+
+Revision ID: c52d9e1f4a70
+Revises: a81c4e07b2d5
+Create Date: 2026-10-18 16:40:09.218734
+
+"""
+import uuid
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision = 'c52d9e1f4a70'
+down_revision = 'a81c4e07b2d5'
+branch_labels = None
+depends_on = None
+
+
+# tables whose uuid is generated by the API
+TABLES = ['societies', 'activity_types', 'activities', 'logged_activities',
+          'redemptions', 'outbox']
+
+# (table, column, referenced table) for every key pointing at TABLES
+FOREIGN_KEYS = [
+    ('users', 'society_id', 'societies'),
+    ('cohorts', 'society_id', 'societies'),
+    ('redemptions', 'society_id', 'societies'),
+    ('logged_activities', 'society_id', 'societies'),
+    ('logged_activities', 'activity_type_id', 'activity_types'),
+    ('logged_activities', 'activity_id', 'activities'),
+    ('activities', 'activity_type_id', 'activity_types'),
+    ('user_activity', 'activity_uuid', 'activities'),
+]
+
+UUID_PATTERN = '^[0-9a-fA-F]{8}-?([0-9a-fA-F]{4}-?){3}[0-9a-fA-F]{12}$'
+
+
+def fk_name(table, column):
+    # postgres' default constraint name
+    return f'{table}_{column}_fkey'
+
+
+def replace_invalid_ids(connection):
+    """Give rows with a non uuid id a new one, updating references."""
+    for table in TABLES:
+        invalid_ids = [row[0] for row in connection.execute(
+            sa.text(f'SELECT uuid FROM {table} WHERE uuid !~ :pattern'),
+            pattern=UUID_PATTERN)]
+        for old_id in invalid_ids:
+            new_id = str(uuid.uuid1())
+            connection.execute(
+                sa.text(f'UPDATE {table} SET uuid = :new WHERE uuid = :old'),
+                new=new_id, old=old_id)
+            for fk_table, column, referenced in FOREIGN_KEYS:
+                if referenced == table:
+                    connection.execute(sa.text(
+                        f'UPDATE {fk_table} SET {column} = :new '
+                        f'WHERE {column} = :old'), new=new_id, old=old_id)
+
+
+def upgrade():
+    for table, column, _ in FOREIGN_KEYS:
+        op.drop_constraint(fk_name(table, column), table, type_='foreignkey')
+
+    replace_invalid_ids(op.get_bind())
+
+    for table in TABLES:
+        op.alter_column(table, 'uuid', type_=postgresql.UUID(),
+                        postgresql_using='uuid::uuid')
+    for table, column, _ in FOREIGN_KEYS:
+        op.alter_column(table, column, type_=postgresql.UUID(),
+                        postgresql_using=f'{column}::uuid')
+
+    for table, column, referenced in FOREIGN_KEYS:
+        op.create_foreign_key(fk_name(table, column), table, referenced,
+                              [column], ['uuid'])
+
+
+def downgrade():
+    for table, column, _ in FOREIGN_KEYS:
+        op.drop_constraint(fk_name(table, column), table, type_='foreignkey')
+
+    for table, column, _ in FOREIGN_KEYS:
+        op.alter_column(table, column, type_=sa.String(),
+                        postgresql_using=f'{column}::text')
+    for table in TABLES:
+        op.alter_column(table, 'uuid', type_=sa.String(),
+                        postgresql_using='uuid::text')
+
+    for table, column, referenced in FOREIGN_KEYS:
+        op.create_foreign_key(fk_name(table, column), table, referenced,
+                              [column], ['uuid'])
@@ -0,0 +1,33 @@
+"""add societies reserved points
+
+Revision ID: e4a92c6d1b58
+Revises: 7c1e5f93b0d6
+Create Date: 2026-10-19 02:03:51.227640
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'e4a92c6d1b58'
+down_revision = '7c1e5f93b0d6'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.add_column('societies',
+                  sa.Column('_reserved_points', sa.Integer(), nullable=True))
+
+    # pending requests hold the points they were made for
+    op.execute(
+        "UPDATE societies SET _reserved_points = COALESCE(("
+        "SELECT SUM(redemptions.value) FROM redemptions "
+        "WHERE redemptions.society_id = societies.uuid "
+        "AND redemptions.status = 'pending'), 0)"
+    )
+
+
+def downgrade():
+    op.drop_column('societies', '_reserved_points')
@@ -0,0 +1,32 @@
+"""add redemptions reserved points
+
+Revision ID: f1b7d3a08c42
+Revises: e4a92c6d1b58
+Create Date: 2026-10-19 10:26:13.540981
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'f1b7d3a08c42'
+down_revision = 'e4a92c6d1b58'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.add_column('redemptions',
+                  sa.Column('reserved_points', sa.Integer(), nullable=False,
+                            server_default='0'))
+
+    # the society reservations were backfilled from the pending requests
+    op.execute(
+        "UPDATE redemptions SET reserved_points = value "
+        "WHERE status = 'pending'"
+    )
+
+
+def downgrade():
+    op.drop_column('redemptions', 'reserved_points')
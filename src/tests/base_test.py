@@ -3,7 +3,9 @@
 import base64
 import datetime
 import os
+from contextlib import contextmanager
 from jose import jwt
+from sqlalchemy import event
 from unittest import TestCase, mock
 from slackclient import SlackClient
 
@@ -460,6 +462,62 @@ class BaseTestCase(TestCase):
         self.hackathon.save()
         self.test_user.save()
 
+    def log_activities(self, count, society=None, **kwargs):
+        """Log count activities of the test user on consecutive days.
+
+        Args:
+            count (int): number of activities to log
+            society (Society): society they are logged to, invictus by
+                default
+            kwargs: LoggedActivity columns to override, e.g. status
+
+        Return:
+            uuids of the logged activities
+        """
+        activities = []
+        for number in range(count):
+            fields = dict(
+                name="logged activity {}".format(number),
+                value=10,
+                user=self.test_user,
+                society=society or self.invictus,
+                activity_type=self.hackathon,
+                activity_date=datetime.date(2018, 1, 1) +
+                datetime.timedelta(days=number)
+            )
+            fields.update(kwargs)
+            activities.append(LoggedActivity(**fields))
+        db.session.add_all(activities)
+        db.session.commit()
+        return [activity.uuid for activity in activities]
+
+    @staticmethod
+    @contextmanager
+    def record_statements():
+        """Record the SQL statements run inside the with block.
+
+        Yield:
+            list the statements are appended to
+        """
+        statements = []
+
+        def record(conn, cursor, statement, *args):
+            statements.append(statement)
+
+        event.listen(db.engine, 'before_cursor_execute', record)
+        try:
+            yield statements
+        finally:
+            event.remove(db.engine, 'before_cursor_execute', record)
+
+    def count_queries(self, url, headers):
+        """Return the response of url and the number of queries it ran."""
+        db.session.expunge_all()
+        with self.record_statements() as statements:
+            response = self.client.get(url, headers=headers)
+        self.assertEqual(response.status_code, 200)
+        return response, len(statements)
+
     @staticmethod
     def generate_token(payload):
         """Generate token."""
@@ -1,5 +1,11 @@
 """Authorization Test Suite."""
-from .base_test import BaseTestCase
+import time
+from unittest import mock
+
+from .base_test import BaseTestCase, db
+from api.services.auth import verified_tokens, verify_token
+from api.services.auth.context import load_auth_context
+from api.services.auth.token_cache import TokenCache
 
 
 class AuthTestCase(BaseTestCase):
@@ -46,3 +52,58 @@ class AuthTestCase(BaseTestCase):
 
         response_message = response.data.decode('utf-8')
         self.assertIn(error_message, response_message)
+
+    def test_verified_token_is_cached(self):
+        """Test that a token's signature is only verified once."""
+        verified_tokens.clear()
+        with mock.patch('api.services.auth.auth.verify_token',
+                        wraps=verify_token) as mocked_verify:
+            for _ in range(3):
+                response = self.client.get('api/v1/societies',
+                                           headers=self.header)
+                self.assertEqual(response.status_code, 200)
+
+        self.assertEqual(mocked_verify.call_count, 1)
+
+    def test_token_cache_evicts_least_recently_used(self):
+        """Test that the token cache is bounded."""
+        cache = TokenCache(maxsize=2)
+        exp = time.time() + 60
+        cache.set("token-1", {"exp": exp})
+        cache.set("token-2", {"exp": exp})
+        cache.get("token-1")
+        cache.set("token-3", {"exp": exp})
+
+        self.assertEqual(len(cache), 2)
+        self.assertIsNotNone(cache.get("token-1"))
+        self.assertIsNone(cache.get("token-2"))
+
+    def test_token_cache_expires_entries(self):
+        """Test that cached payloads are dropped at the token's exp."""
+        cache = TokenCache()
+        cache.set("expired", {"exp": time.time() - 1})
+        cache.set("no-exp", {"UserInfo": {}})
+
+        self.assertIsNone(cache.get("expired"))
+        self.assertIsNone(cache.get("no-exp"))
+
+    def test_auth_context_loaded_in_one_query(self):
+        """Test that user, society, cohort and roles load in one query."""
+        self.president.save()
+        user_id = self.president.uuid
+        db.session.expunge_all()
+        with self.record_statements() as statements:
+            context = load_auth_context(user_id)
+            society_name = context.user.society.name
+            cohort_name = context.user.cohort.name
+
+        self.assertEqual(len(statements), 1)
+        self.assertEqual(society_name, "Phoenix")
+        self.assertEqual(cohort_name, "cohort-1")
+        self.assertEqual(context.role_names, {"society president"})
+        self.assertTrue(context.has_any_role(["society president", "cio"]))
+        self.assertFalse(context.has_any_role(["success ops"]))
+
+    def test_load_auth_context_for_unknown_user(self):
+        """Test that no context is built for users not in the DB."""
+        self.assertIsNone(load_auth_context("-Kunknown_user"))
@@ -1,7 +1,10 @@
 """Test suite for Point Redemption Module."""
 import json
+from unittest import mock
 
 from .points_redemption_base_test_case_setup import PointRedemptionBaseTestCase
+from api.models import RedemptionRequest, Society
+from api.models.base import db
 
 
 class CreateDeleteRedemptionRequest(PointRedemptionBaseTestCase):
@@ -30,6 +33,33 @@ class CreateDeleteRedemptionRequest(PointRedemptionBaseTestCase):
         self.assertIn(message, response_details["message"])
         self.assertEqual(response.status_code, 201)
 
+    def test_create_redemption_request_save_failure(self):
+        """Test that a request that can't be saved isn't announced."""
+        self.phoenix._total_points = 5000
+        self.phoenix.save()
+        self.lagos.save()
+        requests = RedemptionRequest.query.count()
+
+        def failed_save(redemption):
+            db.session.rollback()
+            return False
+
+        with mock.patch.object(RedemptionRequest, 'save', failed_save), \
+                mock.patch('api.endpoints.redemption_requests.'
+                           'redemption_points.role_member_emails') as cios:
+            response = self.client.post(
+                "api/v1/societies/redeem",
+                data=json.dumps(dict(reason="T-shirt Funds Request",
+                                     value=2000, center="Lagos")),
+                headers=self.society_president,
+                content_type='application/json')
+
+        self.assertEqual(response.status_code, 409)
+        cios.assert_not_called()
+        self.assertEqual(RedemptionRequest.query.count(), requests)
+        self.assertEqual(
+            Society.query.get(self.phoenix.uuid).reserved_points, 0)
+
     def test_create_redemption_request_when_remaining_points_inadequate(self):
         """
         Test that creating a redemption request fails when a society
@@ -56,6 +86,51 @@ class CreateDeleteRedemptionRequest(PointRedemptionBaseTestCase):
         self.assertEqual(message, response_details["message"])
         self.assertEqual(response.status_code, 403)
 
+    def test_create_redemption_request_reserves_points(self):
+        """Test that pending requests can't redeem the same points twice."""
+        self.phoenix._total_points = 5000
+        self.phoenix.save()
+        self.lagos.save()
+
+        statuses = []
+        for _ in range(3):
+            response = self.client.post(
+                "api/v1/societies/redeem",
+                data=json.dumps(dict(reason="T-shirt Funds Request",
+                                     value=2000, center="Lagos")),
+                headers=self.society_president,
+                content_type='application/json')
+            statuses.append(response.status_code)
+
+        self.assertEqual(statuses, [201, 201, 403])
+        society = Society.query.get(self.phoenix.uuid)
+        self.assertEqual(
+            (society.reserved_points, society.remaining_points), (4000, 1000))
+
+        redemption = society.redemptions.filter_by(value=2000).first()
+        response = self.client.delete(
+            f"api/v1/societies/redeem/{redemption.uuid}",
+            headers=self.society_president)
+
+        self.assertEqual(response.status_code, 200)
+        society = Society.query.get(self.phoenix.uuid)
+        self.assertEqual(society.remaining_points, 3000)
+
+    def test_create_redemption_request_with_negative_points(self):
+        """Test that points can't be credited by a negative request."""
+        self.lagos.save()
+
+        response = self.client.post(
+            "api/v1/societies/redeem",
+            data=json.dumps(dict(reason="Refund", value=-500,
+                                 center="Lagos")),
+            headers=self.society_president,
+            content_type='application/json')
+
+        self.assertEqual(response.status_code, 400)
+        society = Society.query.get(self.phoenix.uuid)
+        self.assertEqual(society.reserved_points, 0)
+
     def test_create_redemption_request_no_payload(self):
         """Test RedemptionRequest creation without payload fails."""
         response = self.client.post("api/v1/societies/redeem",
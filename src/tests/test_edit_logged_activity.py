@@ -2,6 +2,8 @@ import datetime
 import json
 
 from .base_test import BaseTestCase, LoggedActivity
+from api.models import OutboxMessage
+from api.services.points import points_summary
 
 class EditLoggedActivityTestCase(BaseTestCase):
     """Edit activity test cases."""
@@ -130,6 +132,10 @@ class EditLoggedActivityTestCase(BaseTestCase):
         self.assertEqual(response_payload.get('data').get('status'),
                          payload.get('status'))
         self.assertEqual(response.status_code, 200)
+        self.assertIn(
+            ('slack', self.log_alibaba_challenge.user.email),
+            [(row.channel, row.recipient) for row in
+             OutboxMessage.query.filter_by(status='pending')])
 
     def test_secretary_edit_reject_activity_works(self):
         """Test secretary can change status to rejected."""
@@ -147,6 +153,55 @@ class EditLoggedActivityTestCase(BaseTestCase):
                          payload.get('status'))
         self.assertEqual(response.status_code, 200)
 
+    def test_secretary_review_rejection_round_trip(self):
+        """Test moving a rejected activity back to pending uncounts it."""
+        uuid = self.log_alibaba_challenge.uuid
+        user_id = self.log_alibaba_challenge.user_id
+
+        for status, rejected in (('rejected', 1), ('pending', 0)):
+            response = self.client.put(
+                f'/api/v1/logged-activities/review/{uuid}',
+                data=json.dumps({'status': status}),
+                headers=self.society_secretary
+            )
+
+            self.assertEqual(response.status_code, 200)
+            self.assertEqual(points_summary('user', user_id)['rejected'],
+                             rejected)
+
+        response = self.client.put(
+            '/api/v1/logged-activities/review',
+            data=json.dumps(dict(loggedActivitiesIds=[uuid],
+                                 status='rejected')),
+            headers=self.society_secretary
+        )
+        self.assertEqual(response.status_code, 200)
+        response = self.client.put(
+            '/api/v1/logged-activities/review',
+            data=json.dumps(dict(loggedActivitiesIds=[uuid],
+                                 status='pending')),
+            headers=self.society_secretary
+        )
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(points_summary('user', user_id)['rejected'], 0)
+
+    def test_secretary_review_approved_activity_fails(self):
+        """Test an approved activity can't be reviewed again."""
+        self.log_alibaba_challenge.status = 'approved'
+        self.log_alibaba_challenge.save()
+        uuid = self.log_alibaba_challenge.uuid
+
+        response = self.client.put(
+            f'/api/v1/logged-activities/review/{uuid}',
+            data=json.dumps({'status': 'rejected'}),
+            headers=self.society_secretary
+        )
+
+        self.assertEqual(response.status_code, 409)
+        self.assertEqual(LoggedActivity.query.get(uuid).status, 'approved')
+        self.assertEqual(points_summary(
+            'user', self.log_alibaba_challenge.user_id)['rejected'], 0)
+
     def test_secretary_edit_invalid_input(self):
         """Test invalid input is rejected."""
         payload = {'status': 'invalid'}
@@ -188,3 +243,64 @@ class EditLoggedActivityTestCase(BaseTestCase):
         self.assertEqual(response_payload.get('message'),
                          'status is required.')
         self.assertEqual(response.status_code, 400)
+
+    def test_secretary_bulk_review(self):
+        """Test secretary can review many logged activities at once."""
+        second = LoggedActivity(
+            name="my other logged activity",
+            description="Spoke at the meetup",
+            value=100,
+            user=self.test_user,
+            society=self.invictus,
+            activity_type=self.tech_event
+        )
+        second.save()
+        approved = LoggedActivity(
+            name="my approved logged activity",
+            value=100,
+            status='approved',
+            user=self.test_user,
+            society=self.invictus,
+            activity_type=self.tech_event
+        )
+        approved.save()
+        ids = [self.log_alibaba_challenge.uuid, second.uuid, approved.uuid,
+               '-KlHerwfafcvavefa']
+
+        response = self.client.put(
+            '/api/v1/logged-activities/review',
+            data=json.dumps(dict(loggedActivitiesIds=ids, status='pending')),
+            headers=self.society_secretary
+        )
+
+        self.assertEqual(response.status_code, 200)
+        response_payload = json.loads(response.data)
+        self.assertEqual(
+            [result['result'] for result in response_payload['results']],
+            ['pending', 'pending', 'skipped', 'missing'])
+        self.assertEqual(
+            LoggedActivity.query.filter_by(status='pending').count(), 2)
+
+        # the fellow gets a single message for both activities
+        messages = OutboxMessage.query.filter_by(
+            recipient=self.test_user.email).all()
+        self.assertEqual(len(messages), 1)
+        self.assertIn(second.description, messages[0].body)
+
+    def test_secretary_bulk_review_other_society(self):
+        """Test bulk review fails for activities of another society."""
+        self.log_alibaba_challenge2.save()
+        ids = [self.log_alibaba_challenge.uuid,
+               self.log_alibaba_challenge2.uuid]
+
+        response = self.client.put(
+            '/api/v1/logged-activities/review/',
+            data=json.dumps(dict(loggedActivitiesIds=ids, status='rejected')),
+            headers=self.society_secretary
+        )
+
+        self.assertEqual(response.status_code, 403)
+        self.assertEqual(json.loads(response.data)['loggedActivitiesIds'],
+                         [self.log_alibaba_challenge2.uuid])
+        self.assertEqual(
+            LoggedActivity.query.filter_by(status='rejected').count(), 0)
@@ -0,0 +1,96 @@
+from .base_test import BaseTestCase
+from email_handeler import EmailWorkerPool, construct_email_mes
+
+
+class FakeMail(object):
+    """Record the connections opened and the messages sent over them."""
+
+    def __init__(self, failures=0, fail_on_close=0):
+        self.failures = failures
+        self.fail_on_close = fail_on_close
+        self.connections = []
+
+    def connect(self):
+        connection = FakeConnection(self)
+        self.connections.append(connection)
+        return connection
+
+
+class FakeConnection(object):
+    def __init__(self, mail):
+        self.mail = mail
+        self.sent = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        if self.mail.fail_on_close:
+            self.mail.fail_on_close -= 1
+            raise ConnectionError("smtp closed unexpectedly")
+        return False
+
+    def send(self, message):
+        if self.mail.failures:
+            self.mail.failures -= 1
+            raise ConnectionError("smtp unavailable")
+        self.sent.append(message)
+
+
+class EmailWorkerPoolTestCase(BaseTestCase):
+    """Test the email worker pool."""
+
+    def make_message(self, number):
+        return construct_email_mes(
+            "Subject {}".format(number), "sender@andela.com",
+            ["user{}@andela.com".format(number)], "body")
+
+    def test_queued_emails_share_connections(self):
+        """Test that queued emails are sent in batches per connection."""
+        mail = FakeMail()
+        pool = EmailWorkerPool(self.app, mail, batch_size=3)
+        for number in range(5):
+            pool._queue.put(self.make_message(number))
+        self.assertEqual(pool.queue_depth, 5)
+
+        pool.flush()
+
+        self.assertEqual(pool.queue_depth, 0)
+        self.assertEqual([len(connection.sent)
+                          for connection in mail.connections], [3, 2])
+
+    def test_failed_emails_are_retried(self):
+        """Test that failed emails are retried on a new connection."""
+        mail = FakeMail(failures=2)
+        pool = EmailWorkerPool(self.app, mail, max_retries=2, backoff=0)
+        pool._queue.put(self.make_message(1))
+
+        pool.flush()
+
+        self.assertEqual(len(mail.connections), 3)
+        self.assertEqual(len(mail.connections[-1].sent), 1)
+
+        mail = FakeMail(failures=5)
+        pool = EmailWorkerPool(self.app, mail, max_retries=1, backoff=0)
+        pool._queue.put(self.make_message(2))
+
+        pool.flush()
+
+        self.assertEqual(len(mail.connections), 2)
+        self.assertFalse(any(connection.sent
+                             for connection in mail.connections))
+
+    def test_emails_sent_before_a_failed_close_are_not_resent(self):
+        """Test that only unsent emails are retried after a failed close."""
+        mail = FakeMail(failures=1, fail_on_close=1)
+        pool = EmailWorkerPool(self.app, mail, backoff=0)
+        for number in range(3):
+            pool._queue.put(self.make_message(number))
+
+        pool.flush()
+
+        sent = [message.subject for connection in mail.connections
+                for message in connection.sent]
+        self.assertEqual(sorted(sent),
+                         ["Subject 0", "Subject 1", "Subject 2"])
+        self.assertEqual(len(mail.connections), 2)
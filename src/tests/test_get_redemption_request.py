@@ -2,6 +2,7 @@
 import json
 import uuid
 
+from .base_test import RedemptionRequest
 from .points_redemption_base_test_case_setup import PointRedemptionBaseTestCase
 
 
@@ -31,6 +32,46 @@ class GetRedemptionRequest(PointRedemptionBaseTestCase):
         self.assertIn(message, response_details["message"])
         self.assertEqual(response.status_code, 200)
 
+    def test_export_redemption_requests_as_ndjson(self):
+        """Test streaming redemptions with their user and center."""
+        response = self.client.get(
+            "api/v1/societies/redeem?paginate=false&format=ndjson",
+            headers=self.cio)
+
+        self.assertEqual(response.status_code, 200)
+        rows = [json.loads(line) for line in
+                response.get_data(as_text=True).splitlines()]
+        self.assertIn(self.redemp_req.uuid, {row["id"] for row in rows})
+        for row in rows:
+            self.assertIn("name", row["user"])
+            self.assertIn("name", row["center"])
+
+    def test_listing_redemption_requests_uses_constant_queries(self):
+        """Test that users, societies and centers are loaded per page."""
+        self.sparks_president.save()
+        for user, center in ((self.sparks_president, self.nairobi),
+                             (self.sparks_president, self.kampala),
+                             (self.test_user, self.lagos)):
+            RedemptionRequest(name="Bootcamp funds", value=100, user=user,
+                              center=center, society=user.society).save()
+        names = {self.test_user.name, self.sparks_president.name}
+        url = "api/v1/societies/redeem"
+        self.count_queries(url, self.cio)  # authenticate the user first
+
+        # the page, its users with their societies and its centers
+        response, queries = self.count_queries(url, self.cio)
+        self.assertEqual(queries, 3)
+        redemptions = json.loads(response.data)["data"]
+        self.assertEqual(len(redemptions), 4)
+        self.assertEqual(
+            {redemption["user"]["name"] for redemption in redemptions},
+            names)
+        self.assertEqual(
+            {redemption["center"]["name"] for redemption in redemptions},
+            {"Nairobi", "Kampala", "Lagos"})
+        for redemption in redemptions:
+            self.assertIn("name", redemption["society"])
+
     def test_get_existing_redemption_requests_by_id(self):
         """Test retrieval of Redemption Requests."""
         response = self.client.get(
@@ -130,8 +171,8 @@ class GetRedemptionRequest(PointRedemptionBaseTestCase):
         message = f'not found'
         response_details = json.loads(response.data)
 
-        self.assertTrue(response_details["message"].find(message))
-        self.assertEqual(response.status_code, 400)
+        self.assertIn(message, response_details["message"])
+        self.assertEqual(response.status_code, 404)
 
     def test_get_non_existing_redemption_requests_by_status(self):
         """Test retrieval of Redemption Requests."""
@@ -157,4 +198,35 @@ class GetRedemptionRequest(PointRedemptionBaseTestCase):
         response_details = json.loads(response.data)
 
         self.assertIn(message, response_details["message"])
-        self.assertEqual(response.status_code, 400)
+        self.assertEqual(response.status_code, 404)
+
+    def test_get_redemption_requests_by_combined_filters(self):
+        """Test that filters are combined in a single statement."""
+        self.sparks_president.save()
+        for value, status in ((100, "pending"), (300, "pending"),
+                              (300, "approved")):
+            RedemptionRequest(name="Bootcamp funds", value=value,
+                              status=status, user=self.sparks_president,
+                              center=self.nairobi,
+                              society=self.sparks).save()
+        url = ("api/v1/societies/redeem?society=sparks&status=pending"
+               "&center=Nairobi&minValue=200&startDate=2018-01-01")
+        url = url.replace("sparks", self.sparks.name)
+        self.count_queries(url, self.cio)  # authenticate the user first
+
+        response, queries = self.count_queries(url, self.cio)
+
+        redemptions = json.loads(response.data)["data"]
+        self.assertEqual([(redemption["value"], redemption["status"])
+                          for redemption in redemptions],
+                         [(300, "pending")])
+        # the filtered page, its users and its centers
+        self.assertEqual(queries, 3)
+
+    def test_get_redemption_requests_by_invalid_range(self):
+        """Test that malformed range filters are rejected."""
+        for query in ("minValue=many", "endDate=yesterday"):
+            response = self.client.get(
+                f"api/v1/societies/redeem?{query}", headers=self.cio)
+
+            self.assertEqual(response.status_code, 400)
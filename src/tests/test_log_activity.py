@@ -3,6 +3,7 @@ import datetime
 import json
 
 from .base_test import BaseTestCase
+from api.endpoints.activity_types.catalog import activity_type_catalog
 
 
 class LogActivityTestCase(BaseTestCase):
@@ -29,6 +30,43 @@ class LogActivityTestCase(BaseTestCase):
             response_content['message'], 'Activity logged successfully'
         )
 
+    def test_log_activity_reads_activity_types_from_catalog(self):
+        """Test that logging an activity doesn't query activity types."""
+        activity_type_catalog.refresh()
+        payload = json.dumps(dict(
+            activityTypeId=f'{self.interview.uuid}',
+            date=str(datetime.date.today() - datetime.timedelta(days=5)),
+            description='Interviewed two candidates',
+            noOfParticipants=2
+        ))
+        with self.record_statements() as statements:
+            response = self.client.post(
+                'api/v1/logged-activities',
+                headers=self.header, data=payload
+            )
+
+        self.assertEqual(response.status_code, 201)
+        response_content = json.loads(response.get_data(as_text=True))
+        self.assertEqual(response_content['data']['points'],
+                         self.interview.value * 2)
+        # rows expired by the commit may be reloaded for the response
+        insert = next(index for index, statement in enumerate(statements)
+                      if statement.startswith('INSERT INTO logged_activities'))
+        self.assertFalse([statement for statement in statements[:insert]
+                          if 'FROM activity_types' in statement])
+
+    def test_activity_type_catalog_follows_edits(self):
+        """Test that edited activity types are reloaded."""
+        self.assertNotIn(self.hackathon.uuid,
+                         activity_type_catalog.multiple_participant_ids)
+
+        self.hackathon.supports_multiple_participants = True
+        self.hackathon.save()
+
+        self.assertIn(self.hackathon.uuid,
+                      activity_type_catalog.multiple_participant_ids)
+        self.assertIsNone(activity_type_catalog.get('unknown'))
+
     def test_log_activity_using_activity_type_uuid_is_successful(self):
         """Test that logging an activity with activity_type uuid works."""
         self.hackathon.save()
@@ -101,6 +101,58 @@ class LoggedActivitiesTestCase(BaseTestCase):
         self.assertEqual(logged_activities_count,
                          response_content['data']['count'])
 
+    def test_export_logged_activities_as_ndjson(self):
+        """Test streaming every logged activity as one JSON line each."""
+        self.app.config['EXPORT_CHUNK_SIZE'] = 1
+        response = self.client.get(
+            '/api/v1/logged-activities?paginate=false&format=ndjson',
+            headers=self.header
+        )
+
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response.is_streamed)
+        self.assertEqual(response.mimetype, 'application/x-ndjson')
+        rows = [json.loads(line) for line in
+                response.get_data(as_text=True).splitlines()]
+        self.assertEqual(len(rows), LoggedActivity.query.count())
+        self.assertEqual({row['id'] for row in rows},
+                         {activity.uuid
+                          for activity in LoggedActivity.query})
+
+        response = self.client.get(
+            '/api/v1/logged-activities?paginate=false&format=xml',
+            headers=self.header
+        )
+        self.assertEqual(response.status_code, 400)
+
+    def test_get_logged_activities_by_filters(self):
+        """Test combining logged activity filters."""
+        self.log_alibaba_challenge.status = 'approved'
+        self.log_alibaba_challenge.save()
+
+        response = self.client.get(
+            f'/api/v1/logged-activities?society={self.invictus.name}'
+            f'&status=approved,pending&userId={self.test_user.uuid}'
+            f'&minPoints={self.log_alibaba_challenge.value}',
+            headers=self.header
+        )
+
+        self.assertEqual(response.status_code, 200)
+        activities = json.loads(response.data)['data']['loggedActivities']
+        self.assertEqual([activity['id'] for activity in activities],
+                         [self.log_alibaba_challenge.uuid])
+
+        response = self.client.get(
+            '/api/v1/logged-activities?status=done', headers=self.header)
+        self.assertEqual(response.status_code, 400)
+
+        response = self.client.get(
+            '/api/v1/logged-activities?cursor=not-a-cursor',
+            headers=self.header)
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(json.loads(response.data)['message'],
+                         'Invalid cursor.')
+
     def test_get_logged_activities_message_when_user_does_not_exist(self):
         """Test that a 404 error is thrown when a user does not exist."""
         response = self.client.get(
@@ -111,3 +163,24 @@ class LoggedActivitiesTestCase(BaseTestCase):
 
         self.assertEqual(response_content['message'], "User not found")
         self.assertEqual(response.status_code, 404)
+
+    def test_listing_logged_activities_uses_constant_queries(self):
+        """Test that related rows are loaded with the logged activities."""
+        names = {self.test_user.name, self.test_user_2.name}
+        self.log_alibaba_challenge.approver_id = self.test_user_2.uuid
+        self.log_alibaba_challenge.reviewer_id = self.test_user_2.uuid
+        self.log_alibaba_challenge2.approver_id = self.test_user.uuid
+        self.log_alibaba_challenge2.save()
+        urls = ['/api/v1/logged-activities?paginate=false',
+                '/api/v1/logged-activities',
+                f'/api/v1/users/{self.test_user.uuid}/logged-activities']
+        self.count_queries(urls[0], self.header)  # authenticate the user first
+
+        # the user endpoint also loads the user and sums the points
+        self.assertEqual([self.count_queries(url, self.header)[1] for url in urls],
+                         [1, 1, 3])
+        response, _ = self.count_queries(urls[0], self.header)
+        activities = json.loads(response.data)['data']['loggedActivities']
+        self.assertEqual(len(activities), 2)
+        self.assertEqual(
+            {activity['approvedBy'] for activity in activities}, names)
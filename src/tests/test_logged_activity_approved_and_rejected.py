@@ -1,6 +1,8 @@
 import json
+import uuid
 
-from .base_test import BaseTestCase
+from .base_test import BaseTestCase, LoggedActivity, db
+from api.models import OutboxMessage
 
 
 class LoggedActivityApprovalTestCase(BaseTestCase):
@@ -116,17 +118,26 @@ class LoggedActivityApprovalTestCase(BaseTestCase):
         self.assertEqual(response.status_code, 400)
         self.assertEqual(response_details['message'], message)
 
-    def test_approving_over_twenty_logged_activities_fails(self):
+    def test_approving_over_twenty_logged_activities_in_chunks(self):
 
         """
-        Test a scenario where approval for logged activities fails
-        if logged activities request is more than 20.
+        Test a scenario where more than 20 logged activities are approved
+        over several transactions and every id gets its own result.
         """
 
         self.successops_role.save()
+        self.app.config['BULK_APPROVAL_CHUNK_SIZE'] = 10
+        self.log_alibaba_challenge.status = 'rejected'
+        self.log_alibaba_challenge.save()
+        pending_ids = \
+            self.log_activities(15, self.invictus, status='pending') + \
+            self.log_activities(10, self.sparks, status='pending')
+        missing_id = str(uuid.uuid4())
+        invictus_points = self.invictus.total_points or 0
+
         self.payload = dict(
-            status='approved',
-            loggedActivitiesIds=['i' for count in range(0, 21)]
+            loggedActivitiesIds=pending_ids + [
+                self.log_alibaba_challenge.uuid, missing_id, pending_ids[0]]
         )
 
         response = self.client.put(
@@ -135,11 +146,42 @@ class LoggedActivityApprovalTestCase(BaseTestCase):
            headers=self.success_ops
         )
 
-        message = 'Sorry, you can not approve more than 20 logged_activities at a go'
         response_details = json.loads(response.get_data(as_text=True))
 
-        self.assertEqual(response.status_code, 403)
-        self.assertEqual(response_details['message'], message)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(response_details['data']), 25)
+        results = {result['id']: result['result']
+                   for result in response_details['results']}
+        self.assertEqual(len(response_details['results']), 27)
+        self.assertEqual({results[pending_id] for pending_id in pending_ids},
+                         {'approved'})
+        self.assertEqual(results[self.log_alibaba_challenge.uuid], 'skipped')
+        self.assertEqual(results[missing_id], 'missing')
+        db.session.expire_all()
+        self.assertEqual(self.invictus.total_points, invictus_points + 150)
+
+    def test_bulk_approval_updates_each_society_once(self):
+
+        """
+        Test a scenario where the points of a large approval are added to
+        each society with a single update.
+        """
+
+        self.successops_role.save()
+        pending_ids = \
+            self.log_activities(30, self.invictus, status='pending') + \
+            self.log_activities(30, self.sparks, status='pending')
+        with self.record_statements() as statements:
+            response = self.client.put(
+               f'/api/v1/logged-activities/approve/',
+               data=json.dumps(dict(loggedActivitiesIds=pending_ids)),
+               headers=self.success_ops
+            )
+
+        self.assertEqual(response.status_code, 200)
+        society_updates = [statement for statement in statements
+                           if statement.startswith('UPDATE societies')]
+        self.assertEqual(len(society_updates), 2)
 
     def test_approving_when_all_logged_activities_invalid_fails(self):
 
@@ -260,3 +302,57 @@ class LoggedActivityRejectTestCase(BaseTestCase):
 
         self.assertEqual(response.status_code, 403)
         self.assertEqual(response_details['message'], message)
+
+    def test_bulk_reject_logged_activities(self):
+
+        """
+        Test a scenario where success ops reject many logged activities and
+        each society secretary gets one notification.
+        """
+
+        self.successops_role.save()
+        self.secretary.save()
+        self.log_alibaba_challenge.status = 'approved'
+        self.log_alibaba_challenge.save()
+        pending_ids = self.log_activities(3, self.invictus, status='pending')
+
+        response = self.client.put(
+           '/api/v1/logged-activities/reject',
+           data=json.dumps(dict(loggedActivitiesIds=pending_ids + [
+               self.log_alibaba_challenge.uuid])),
+           headers=self.success_ops
+        )
+
+        response_details = json.loads(response.get_data(as_text=True))
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response_details['message'],
+                         'Activities successfully rejected')
+        self.assertEqual(
+            [result['result'] for result in response_details['results']],
+            ['rejected'] * 3 + ['skipped'])
+        self.assertEqual(
+            LoggedActivity.query.filter_by(status='rejected').count(), 3)
+        self.assertEqual(OutboxMessage.query.filter_by(
+            recipient=self.secretary.email).count(), 1)
+
+    def test_bulk_reject_without_pending_logged_activities(self):
+
+        """
+        Test a scenario where bulk rejection fails when none of the logged
+        activities are pending.
+        """
+
+        self.successops_role.save()
+
+        response = self.client.put(
+           '/api/v1/logged-activities/reject/',
+           data=json.dumps(dict(loggedActivitiesIds=['13567788'])),
+           headers=self.success_ops
+        )
+
+        response_details = json.loads(response.get_data(as_text=True))
+
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(response_details['results'],
+                         [dict(id='13567788', result='missing')])
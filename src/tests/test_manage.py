@@ -1,6 +1,7 @@
 import os
 
 from .base_test import BaseTestCase, ActivityType, Society, db
+from api.utils.index_advisor import QUERY_SHAPES, advise, sequential_scans
 from api.utils.initial_data import generete_initial_data_run_time_env
 
 
@@ -56,3 +57,16 @@ class ManagementCommandsTestCase(BaseTestCase):
             new_activity_types_count, initial_activity_types_count
         )
         self.assertEqual(new_societies_count, initial_societies_count)
+
+    def test_index_advisor_finds_no_sequential_scans(self):
+        '''Test that every registered query shape uses an index'''
+        report = advise()
+
+        self.assertEqual(list(report), list(QUERY_SHAPES))
+        self.assertEqual(
+            {name: tables for name, (_, tables) in report.items() if tables},
+            {})
+        self.assertEqual(sequential_scans(
+            ['Seq Scan on redemptions  (cost=0.00..1.01 rows=1 width=32)',
+             'SCAN TABLE users', 'SCAN users USING INDEX ix_users_society_id']
+        ), ['redemptions', 'users'])
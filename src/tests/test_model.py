@@ -1,9 +1,15 @@
 """Models TestSuite."""
+import uuid
+
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.exc import StatementError
 
 from .base_test import (
     BaseTestCase, Activity, ActivityType, Cohort, Center,
     LoggedActivity, Society, User, Role, RedemptionRequest
 )
+from api.models.base import (
+    GUID, GUIDCriterion, db, generate_time_ordered_uuid)
 
 
 class UserTestCase(BaseTestCase):
@@ -131,6 +137,48 @@ class SocietyTestCase(BaseTestCase):
 
         self.assertTrue([len(societies), 4])
 
+    def test_society_id_is_a_canonical_uuid(self):
+        """Test that generated ids round trip as canonical uuid strings."""
+        self.phoenix.save()
+        society_id = self.phoenix.uuid
+
+        self.assertEqual(str(uuid.UUID(society_id)), society_id)
+        self.assertEqual(
+            Society.query.get(society_id.upper()).uuid, society_id)
+        self.assertIsNone(Society.query.get("not-a-uuid"))
+        self.assertIsNone(
+            Society.query.filter_by(uuid="not-a-uuid").one_or_none())
+        self.assertEqual(GUIDCriterion().process_bind_param(
+            "not-a-uuid", postgresql.dialect()), None)
+        with self.assertRaises(ValueError):
+            GUID().process_bind_param("not-a-uuid", postgresql.dialect())
+
+    def test_invalid_ids_are_not_written(self):
+        """Test that writing an id that isn't a uuid fails."""
+        self.redemp_req.save()
+        self.redemp_req.society_id = "not-a-uuid"
+
+        with self.assertRaises(StatementError) as context:
+            db.session.flush()
+        self.assertIsInstance(context.exception.orig, ValueError)
+        db.session.rollback()
+
+    def test_generated_ids_are_time_ordered(self):
+        """Test that ids sort in creation order as text and as uuids."""
+        ids = [generate_time_ordered_uuid() for _ in range(2000)]
+
+        self.assertEqual(sorted(ids), ids)
+        self.assertEqual(len(set(ids)), len(ids))
+        self.assertEqual({uuid.UUID(id_).version for id_ in ids}, {7})
+
+        societies = [Society(name=f"society {number}")
+                     for number in range(3)]
+        for society in societies:
+            society.save()
+        self.assertEqual(
+            [society.uuid for society in societies],
+            sorted(society.uuid for society in societies))
+
     def test_save_null_values(self):
         """Test for false return if society name is null."""
         test_society = Society(name=None)
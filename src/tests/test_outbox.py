@@ -0,0 +1,113 @@
+import json
+
+from .base_test import BaseTestCase
+from .test_email import FakeMail
+from api.models import Center, FinanceRoute, OutboxMessage, User
+from api.models.base import db
+from api.services.finance import finance_routing
+from api.services.outbox import OutboxWorker, queue_email, queue_slack
+from api.services.slack_notify import FakeTransport
+
+
+class OutboxTestCase(BaseTestCase):
+    """Test the notifications outbox."""
+
+    def setUp(self):
+        """Save the records used by the redemption flow."""
+        BaseTestCase.setUp(self)
+        self.successops_role.save()
+        self.redemp_req.save()
+
+    def test_redemption_approval_writes_to_outbox(self):
+        """Test that approving a redemption queues its notifications."""
+        response = self.client.put(
+            f"api/v1/societies/redeem/verify/{self.redemp_req.uuid}",
+            data=json.dumps(dict(status="approved")),
+            headers=self.success_ops,
+            content_type='application/json'
+        )
+
+        self.assertEqual(response.status_code, 200)
+        channels = sorted(
+            (row.channel, row.recipient)
+            for row in OutboxMessage.query.filter_by(status='pending'))
+        self.assertIn(('email', self.redemp_req.user.email), channels)
+        self.assertIn(('slack', self.redemp_req.user.email), channels)
+        self.assertEqual(
+            len([channel for channel in channels if channel[0] == 'email']),
+            2)
+
+    def test_redemption_approval_routes_to_center_finance(self):
+        """Test that approval notifies only the finance team of its center."""
+        center = self.redemp_req.center
+        other_center = self.lagos if center is not self.lagos else self.kampala
+        self.finance_role.save()
+        for name, user_center in (("local", center), ("remote", other_center)):
+            User(uuid=f"-finance-{name}", name=f"Finance {name}",
+                 email=f"{name}.finance@andela.com", center=user_center,
+                 roles=[self.finance_role]).save()
+        FinanceRoute(center=center, email="payouts@andela.com").save()
+
+        response = self.client.put(
+            f"api/v1/societies/redeem/verify/{self.redemp_req.uuid}",
+            data=json.dumps(dict(status="approved")),
+            headers=self.success_ops,
+            content_type='application/json'
+        )
+
+        self.assertEqual(response.status_code, 200)
+        recipients = {
+            (row.channel, row.recipient)
+            for row in OutboxMessage.query.filter_by(status='pending')}
+        self.assertIn(('email', "payouts@andela.com"), recipients)
+        self.assertIn(('slack', "local.finance@andela.com"), recipients)
+        self.assertNotIn(('slack', "remote.finance@andela.com"), recipients)
+        self.assertNotIn(
+            ('email', f"{center.name.lower()}-finance@andela.com"),
+            recipients)
+
+    def test_finance_routing_is_invalidated_on_commit(self):
+        """Test that a new route is picked up after it is committed."""
+        center = self.redemp_req.center
+        self.assertEqual(
+            finance_routing.recipients(center.uuid).emails,
+            [f"{center.name.lower()}-finance@andela.com"])
+
+        FinanceRoute(center=center, email="payouts@andela.com").save()
+
+        self.assertEqual(finance_routing.recipients(center.uuid).emails,
+                         ["payouts@andela.com"])
+
+    def test_finance_routing_skips_unnamed_centers(self):
+        """Test that a center without a name gets no default mailbox."""
+        center = Center()
+        center.save()
+
+        self.assertEqual(finance_routing.recipients(center.uuid).emails, [])
+
+    def test_worker_delivers_and_retries(self):
+        """Test that the worker marks rows sent or schedules a retry."""
+        queue_email(dict(sender="ops@andela.com", subject="Approved",
+                         message="body", recipients=["a@andela.com"]))
+        queue_slack("a@andela.com", "approved")
+        db.session.commit()
+
+        mail, transport = FakeMail(failures=1), FakeTransport()
+        worker = OutboxWorker(mail, transport, max_attempts=2, backoff=0)
+
+        self.assertEqual(worker.drain(), 3)
+        email = OutboxMessage.query.filter_by(channel='email').one()
+        slack = OutboxMessage.query.filter_by(channel='slack').one()
+        self.assertEqual(transport.sent, [("a@andela.com", "approved")])
+        self.assertEqual((slack.status, slack.attempts), ('sent', 1))
+        self.assertEqual((email.status, email.attempts), ('sent', 2))
+        self.assertEqual(len(mail.connections), 2)
+
+        queue_slack("b@andela.com", "approved")
+        db.session.commit()
+        transport.send = lambda user_email, message: 1 / 0
+
+        self.assertEqual(worker.drain(), 2)
+        slack = OutboxMessage.query.filter_by(recipient="b@andela.com").one()
+        self.assertEqual((slack.status, slack.attempts), ('failed', 2))
+        self.assertIn("division by zero", slack.last_error)
@@ -0,0 +1,121 @@
+import json
+
+from .base_test import BaseTestCase, Society
+from api.models import PointsTransaction
+from api.models.base import db
+from api.services.points import points_summary, reconcile
+
+
+class PointsLedgerTestCase(BaseTestCase):
+    """Test the society points ledger."""
+
+    def setUp(self):
+        """Save two pending logged activities of different societies."""
+        BaseTestCase.setUp(self)
+        self.successops_role.save()
+        self.log_alibaba_challenge.status = 'pending'
+        self.log_alibaba_challenge2.status = 'pending'
+        self.log_alibaba_challenge.save()
+        self.log_alibaba_challenge2.save()
+        self.invictus._total_points = 0
+        self.sparks._total_points = 0
+        db.session.commit()
+
+    def approve(self, *logged_activities):
+        return self.client.put(
+            '/api/v1/logged-activities/approve/',
+            data=json.dumps(dict(loggedActivitiesIds=[
+                activity.uuid for activity in logged_activities])),
+            headers=self.success_ops
+        )
+
+    def test_approval_credits_societies_through_the_ledger(self):
+        """Test that approvals append entries and move balances."""
+        response = self.approve(self.log_alibaba_challenge,
+                                self.log_alibaba_challenge2)
+        self.assertEqual(response.status_code, 200)
+
+        # approving again doesn't credit the activities twice
+        self.assertEqual(self.approve(self.log_alibaba_challenge)
+                         .status_code, 400)
+
+        self.assertEqual(Society.query.get(self.invictus.uuid).total_points,
+                         self.log_alibaba_challenge.value)
+        self.assertEqual(Society.query.get(self.sparks.uuid).total_points,
+                         self.log_alibaba_challenge2.value)
+        entries = PointsTransaction.query.filter_by(kind='earned').all()
+        self.assertEqual(
+            {entry.logged_activity_id for entry in entries},
+            {self.log_alibaba_challenge.uuid,
+             self.log_alibaba_challenge2.uuid})
+        self.assertEqual(reconcile(apply=False), [])
+
+    def test_reconcile_restores_balances_from_the_ledger(self):
+        """Test that reconciliation rewrites drifted balances."""
+        self.approve(self.log_alibaba_challenge)
+        invictus = Society.query.get(self.invictus.uuid)
+        invictus._total_points = 1
+        invictus._used_points = 7
+        db.session.commit()
+
+        mismatches = reconcile()
+
+        self.assertEqual(
+            sorted((society.name, column, stored, expected)
+                   for society, column, stored, expected in mismatches),
+            [(invictus.name, '_total_points', 1,
+              self.log_alibaba_challenge.value),
+             (invictus.name, '_used_points', 7, 0)])
+        invictus = Society.query.get(self.invictus.uuid)
+        self.assertEqual(invictus.total_points,
+                         self.log_alibaba_challenge.value)
+        self.assertEqual(reconcile(apply=False), [])
+
+    def test_redemption_approval_debits_the_society(self):
+        """Test that approving a redemption appends a redeemed entry."""
+        self.redemp_req.save()
+        used_points = self.redemp_req.society.used_points or 0
+
+        response = self.client.put(
+            f"api/v1/societies/redeem/verify/{self.redemp_req.uuid}",
+            data=json.dumps(dict(status="approved")),
+            headers=self.success_ops,
+            content_type='application/json'
+        )
+
+        self.assertEqual(response.status_code, 200)
+        society = Society.query.get(self.redemp_req.society_id)
+        self.assertEqual(society.used_points,
+                         used_points + self.redemp_req.value)
+        entry = PointsTransaction.query.filter_by(kind='redeemed').one()
+        self.assertEqual((entry.redemption_id, entry.value),
+                         (self.redemp_req.uuid, self.redemp_req.value))
+
+    def test_aggregates_follow_approvals_and_rejections(self):
+        """Test that profile totals are maintained by the review flows."""
+        self.approve(self.log_alibaba_challenge)
+        response = self.client.put(
+            '/api/v1/logged-activities/reject/'
+            f'{self.log_alibaba_challenge2.uuid}',
+            headers=self.success_ops
+        )
+        self.assertEqual(response.status_code, 200)
+
+        summary = points_summary('user', self.test_user.uuid)
+        value = self.log_alibaba_challenge.value
+        self.assertEqual(
+            (summary['points'], summary['approved'], summary['rejected']),
+            (value, 1, 1))
+        self.assertEqual(
+            summary['activityTypes'][self.hackathon.uuid]['points'], value)
+        self.assertEqual(
+            sum(month['points'] for month in summary['months'].values()),
+            value)
+        self.assertEqual(points_summary('society', self.sparks.uuid)[
+            'rejected'], 1)
+
+        response = self.client.get(
+            f'/api/v1/users/{self.test_user.uuid}/logged-activities',
+            headers=self.header
+        )
+        self.assertEqual(json.loads(response.data)['pointsEarned'], value)
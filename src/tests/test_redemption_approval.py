@@ -1,7 +1,12 @@
 import json
 import uuid
+from datetime import datetime, timedelta
 
 from .base_test import BaseTestCase
+from api.models import (
+    IdempotencyKey, OutboxMessage, PointsTransaction, RedemptionRequest,
+    Society)
+from api.services.idempotency import purge_expired_keys
 
 
 class PointRedemptionApprovalTestCase(BaseTestCase):
@@ -84,6 +89,10 @@ class PointRedemptionApprovalTestCase(BaseTestCase):
 
         self.assertIn(message, response_details["message"])
         self.assertEqual(response.status_code, 200)
+        self.assertEqual(
+            [(row.channel, row.recipient) for row in
+             OutboxMessage.query.filter_by(status='pending')],
+            [('email', self.redemp_req.user.email)])
 
     def test_get_non_existing_point_redemption_details_by_finance(self):
         """Test retrieval of Redemption Requests."""
@@ -119,6 +128,8 @@ class PointRedemptionApprovalTestCase(BaseTestCase):
         When a redemption request funds have been sent out the redemption
         reequest should be marked as completed.
         """
+        self.redemp_req.status = "approved"
+        self.redemp_req.save()
         completion_payload = dict(status="completed")
 
         response = self.client.put(
@@ -133,3 +144,134 @@ class PointRedemptionApprovalTestCase(BaseTestCase):
 
         self.assertIn(message, response_details["message"])
         self.assertEqual(response.status_code, 200)
+
+    def test_point_redemption_reviewed_once(self):
+        """Test that a reviewed redemption request can't be approved again."""
+        for expected_status in (200, 409):
+            response = self.client.put(
+                f"api/v1/societies/redeem/verify/{self.redemp_req.uuid}",
+                data=json.dumps(dict(status="approved")),
+                headers=self.success_ops,
+                content_type='application/json'
+            )
+            self.assertEqual(response.status_code, expected_status)
+
+        self.assertEqual(
+            PointsTransaction.query.filter_by(kind='redeemed').count(), 1)
+
+    def test_point_redemption_completion_requires_approval(self):
+        """Test that a pending redemption request can't be completed."""
+        response = self.client.put(
+            f"api/v1/societies/redeem/funds/{self.redemp_req.uuid}",
+            data=json.dumps(dict(status="completed")),
+            headers=self.finance,
+            content_type='application/json'
+        )
+
+        self.assertEqual(response.status_code, 409)
+        self.assertIn("once it is pending",
+                      json.loads(response.data)["message"])
+
+    def test_point_redemption_approval_retry_with_idempotency_key(self):
+        """Test that a retried approval replays the first response."""
+        headers = dict(self.success_ops, **{"Idempotency-Key": "retry-1"})
+        responses = [self.client.put(
+            f"api/v1/societies/redeem/verify/{self.redemp_req.uuid}",
+            data=json.dumps(dict(status="approved")),
+            headers=headers,
+            content_type='application/json'
+        ) for _ in range(2)]
+
+        self.assertEqual([response.status_code for response in responses],
+                         [200, 200])
+        self.assertEqual(json.loads(responses[0].data),
+                         json.loads(responses[1].data))
+        society = Society.query.get(self.redemp_req.society_id)
+        self.assertEqual(society.used_points, self.redemp_req.value)
+        self.assertEqual(
+            PointsTransaction.query.filter_by(kind='redeemed').count(), 1)
+
+        response = self.client.put(
+            f"api/v1/societies/redeem/verify/{self.redemp_req.uuid}",
+            data=json.dumps(dict(status="rejected", rejection="late")),
+            headers=headers,
+            content_type='application/json'
+        )
+        self.assertEqual(response.status_code, 422)
+
+    def test_point_redemption_completion_notifies_through_outbox(self):
+        """Test that completion messages wait for the commit in the outbox."""
+        self.redemp_req.status = "approved"
+        self.redemp_req.save()
+
+        response = self.client.put(
+            f"api/v1/societies/redeem/funds/{self.redemp_req.uuid}",
+            data=json.dumps(dict(status="completed")),
+            headers=self.finance,
+            content_type='application/json'
+        )
+
+        self.assertEqual(response.status_code, 200)
+        recipients = {
+            (row.channel, row.recipient)
+            for row in OutboxMessage.query.filter_by(status='pending')}
+        self.assertIn(('email', self.test_cio.email), recipients)
+        self.assertIn(('email', self.redemp_req.user.email), recipients)
+        self.assertIn(('slack', self.redemp_req.user.email), recipients)
+
+    def test_expired_idempotency_keys_are_purged(self):
+        """Test that stored responses are only kept for their retention."""
+        headers = dict(self.success_ops, **{"Idempotency-Key": "retry-2"})
+        response = self.client.put(
+            f"api/v1/societies/redeem/verify/{self.redemp_req.uuid}",
+            data=json.dumps(dict(status="approved")),
+            headers=headers,
+            content_type='application/json'
+        )
+        self.assertEqual(response.status_code, 200)
+
+        self.assertEqual(purge_expired_keys(), 0)
+        stored = IdempotencyKey.query.one()
+        stored.created_at = datetime.utcnow() - timedelta(days=2)
+        stored.save()
+
+        self.assertEqual(purge_expired_keys(), 1)
+        self.assertEqual(IdempotencyKey.query.count(), 0)
+
+    def test_point_redemption_review_releases_reserved_points(self):
+        """Test that reviewing a request releases only what it reserved."""
+        society = self.redemp_req.society
+        society._total_points = 10000
+        society.save()
+        other_request = RedemptionRequest(
+            name="Hoodies", value=1000, user=self.redemp_req.user,
+            center=self.redemp_req.center, society=society)
+        self.assertTrue(self.redemp_req.hold_points(self.redemp_req.value))
+        self.assertTrue(other_request.hold_points(other_request.value))
+        other_request.save()
+        self.assertEqual(society.reserved_points, self.redemp_req.value + 1000)
+
+        response = self.client.put(
+            f"api/v1/societies/redeem/verify/{self.redemp_req.uuid}",
+            data=json.dumps(dict(status="approved")),
+            headers=self.success_ops,
+            content_type='application/json'
+        )
+
+        self.assertEqual(response.status_code, 200)
+        society = Society.query.get(society.uuid)
+        self.assertEqual(
+            (society.reserved_points, society.used_points,
+             society.remaining_points),
+            (1000, self.redemp_req.value,
+             10000 - self.redemp_req.value - 1000))
+        self.assertEqual(
+            RedemptionRequest.query.get(self.redemp_req.uuid).reserved_points,
+            0)
+
+    def test_society_release_points_requires_held_points(self):
+        """Test that releasing more points than are held is an error."""
+        with self.assertRaises(ValueError):
+            Society.release_points(self.redemp_req.society_id, 1)
+        with self.assertRaises(ValueError):
+            Society.reserve_points(self.redemp_req.society_id, -5)
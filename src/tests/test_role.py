@@ -4,6 +4,7 @@ import json
 import uuid
 
 from .base_test import BaseTestCase, db
+from api.services.auth import role_registry
 
 
 class RoleTestCase(BaseTestCase):
@@ -362,3 +363,28 @@ class SocietyRoleTestCase(BaseTestCase):
 
         self.assertEqual(message, response_details["message"])
         self.assertEqual(response.status_code, 404)
+
+    def test_role_registry_resolves_roles_without_queries(self):
+        """Test that a loaded role registry doesn't hit the database."""
+        role_registry.refresh()
+        with self.record_statements() as statements:
+            uuids = role_registry.uuids_for(["success ops", "unknown"])
+
+        self.assertEqual(statements, [])
+        self.assertEqual(uuids, {self.successops_role.uuid})
+
+    def test_role_registry_invalidated_on_role_changes(self):
+        """Test that creating and deleting roles refreshes the registry."""
+        role_registry.refresh()
+        response = self.client.post('/api/v1/roles',
+                                    data=json.dumps(dict(name="alumni")),
+                                    headers=self.successops_token,
+                                    content_type='application/json')
+        self.assertEqual(response.status_code, 201)
+        role_id = json.loads(response.data)["data"]["uuid"]
+        self.assertEqual(role_registry.uuid_for("alumni"), role_id)
+
+        response = self.client.delete(f'/api/v1/roles/{role_id}',
+                                      headers=self.successops_token)
+        self.assertEqual(response.status_code, 200)
+        self.assertIsNone(role_registry.uuid_for("alumni"))
@@ -1,4 +1,35 @@
+import json
+import os
+import tempfile
+import time
+
 from .base_test import BaseTestCase
+from api.services.slack_notify import (
+    FakeTransport, NotificationDispatcher, SlackDirectory,
+    role_member_emails)
+
+
+class FakeSlackClient(object):
+    """Answer users.list and users.lookupByEmail from fixed members."""
+
+    def __init__(self, pages, lookups=None):
+        self.pages = pages
+        self.lookups = lookups or {}
+        self.calls = []
+
+    def api_call(self, method, **kwargs):
+        self.calls.append((method, kwargs))
+        if method == "users.list":
+            page = kwargs.get('cursor') or 0
+            return dict(ok=True, members=self.pages[int(page)],
+                        response_metadata=dict(
+                            next_cursor=str(int(page) + 1)
+                            if int(page) + 1 < len(self.pages) else ''))
+        user_id = self.lookups.get(kwargs.get('email'))
+        if user_id:
+            return dict(ok=True, user=dict(id=user_id))
+        return dict(ok=False, error='users_not_found')
+
 
 class SlackNotifyTestCase(BaseTestCase):
     """Test notifications."""
@@ -22,3 +53,142 @@ class SlackNotifyTestCase(BaseTestCase):
                 if user['name'] == "societies_notify":
                     user_id = user["id"]
                     self.assertEqual(bot_id, user_id)
+
+    def test_dispatcher_coalesces_messages_per_recipient(self):
+        """Test that messages to one recipient are sent as one."""
+        transport = FakeTransport()
+        dispatcher = NotificationDispatcher(transport, run_async=False)
+        dispatcher.enqueue("a@andela.com", "first")
+        dispatcher.enqueue("b@andela.com", "second")
+        dispatcher.enqueue("a@andela.com", "third")
+        dispatcher.enqueue("a@andela.com", "first")
+        self.assertEqual(dispatcher.queue_depth, 4)
+
+        dispatcher.flush()
+
+        self.assertEqual(dispatcher.queue_depth, 0)
+        self.assertEqual(transport.sent, [
+            ("a@andela.com", "first\n\nthird"),
+            ("b@andela.com", "second")
+        ])
+
+    def test_async_dispatcher_delivers_in_background(self):
+        """Test that the worker thread delivers queued messages."""
+        transport = FakeTransport()
+        dispatcher = NotificationDispatcher(transport, window=0.01)
+        dispatcher.enqueue("a@andela.com", "hello")
+
+        for _ in range(100):
+            if transport.sent:
+                break
+            time.sleep(0.01)
+
+        self.assertEqual(transport.sent, [("a@andela.com", "hello")])
+
+    def test_dispatcher_survives_transport_errors(self):
+        """Test that a failing recipient doesn't block the others."""
+        transport = FakeTransport()
+        send = transport.send
+
+        def flaky_send(user_email, message):
+            if user_email == "broken@andela.com":
+                raise ConnectionError("Slack is down")
+            return send(user_email, message)
+
+        transport.send = flaky_send
+        dispatcher = NotificationDispatcher(transport, run_async=False)
+        dispatcher.enqueue("broken@andela.com", "hello")
+        dispatcher.enqueue("a@andela.com", "hello")
+        dispatcher.flush()
+
+        self.assertEqual(transport.sent, [("a@andela.com", "hello")])
+
+    def test_endpoint_notifications_go_through_dispatcher(self):
+        """Test that handlers queue messages instead of calling Slack."""
+        self.alibaba_ai_challenge.save()
+        self.secretary.society = self.test_user.society
+        self.secretary.save()
+        transport = self.app.extensions['slack_dispatcher'].transport
+
+        response = self.client.post(
+            'api/v1/logged-activities',
+            data=json.dumps(dict(activityId=self.alibaba_ai_challenge.uuid)),
+            headers=self.header
+        )
+
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual(len(transport.sent), 1)
+        self.assertEqual(transport.sent[0][0], self.secretary.email)
+
+    def test_slack_directory_builds_index_from_all_pages(self):
+        """Test that the directory indexes every users.list page once."""
+        client = FakeSlackClient([
+            [{"id": "U1", "profile": {"email": "One@andela.com"}}],
+            [{"id": "U2", "profile": {"email": "two@andela.com"}},
+             {"id": "U3", "deleted": True,
+              "profile": {"email": "gone@andela.com"}}]
+        ])
+        directory = SlackDirectory(client)
+
+        self.assertEqual(directory.get_slack_id("one@andela.com"), "U1")
+        self.assertEqual(directory.get_slack_id("two@andela.com"), "U2")
+        list_calls = [call for call in client.calls
+                      if call[0] == "users.list"]
+        self.assertEqual(len(list_calls), 2)
+        self.assertEqual(len(directory), 2)
+
+    def test_slack_directory_looks_up_misses_incrementally(self):
+        """Test that unknown emails are fetched one by one and remembered."""
+        client = FakeSlackClient(
+            [[]], lookups={"new@andela.com": "U9"})
+        directory = SlackDirectory(client)
+
+        self.assertEqual(directory.get_slack_id("new@andela.com"), "U9")
+        self.assertIsNone(directory.get_slack_id("nobody@andela.com"))
+        self.assertIsNone(directory.get_slack_id("nobody@andela.com"))
+        self.assertEqual(directory.get_slack_id("new@andela.com"), "U9")
+
+        lookups = [call for call in client.calls
+                   if call[0] == "users.lookupByEmail"]
+        self.assertEqual(len(lookups), 2)
+
+    def test_slack_directory_backs_off_after_failed_refresh(self):
+        """Test that a failed users.list isn't retried on every lookup."""
+        client = FakeSlackClient([])
+        client.api_call = lambda method, **kwargs: (
+            client.calls.append((method, kwargs)) or
+            dict(ok=False, error='ratelimited'))
+        directory = SlackDirectory(client, miss_interval=0)
+
+        directory.get_slack_id("one@andela.com")
+        directory.get_slack_id("two@andela.com")
+
+        self.assertEqual(
+            [method for method, _ in client.calls].count("users.list"), 1)
+
+    def test_slack_directory_is_persisted(self):
+        """Test that a saved index is reused without calling Slack."""
+        path = os.path.join(tempfile.mkdtemp(), "slack_directory.json")
+        client = FakeSlackClient(
+            [[{"id": "U1", "profile": {"email": "one@andela.com"}}]])
+        SlackDirectory(client, path=path).get_slack_id("one@andela.com")
+
+        other_client = FakeSlackClient([[]])
+        directory = SlackDirectory(other_client, path=path)
+
+        self.assertEqual(directory.get_slack_id("one@andela.com"), "U1")
+        self.assertEqual(other_client.calls, [])
+
+    def test_role_member_emails_filters_by_role_and_society(self):
+        """Test recipient resolution for a role within a society."""
+        self.secretary.save()
+        self.president.save()
+
+        self.assertEqual(
+            role_member_emails("society secretary", self.invictus.uuid),
+            {self.secretary.email})
+        self.assertEqual(
+            role_member_emails("society secretary", self.phoenix.uuid),
+            set())
+        self.assertEqual(role_member_emails("society president"),
+                         {self.president.email})
@@ -1,7 +1,8 @@
 """Test suite for Society Module."""
+import base64
 import json
 import uuid
-from .base_test import BaseTestCase, Society, Role, db
+from .base_test import BaseTestCase, Society, Role, LoggedActivity, db
 
 
 class SocietyBaseTestCase(BaseTestCase):
@@ -89,6 +90,68 @@ class SocietyBaseTestCase(BaseTestCase):
         self.assertIn(message, response_details["message"])
         self.assertEqual(response.status_code, 200)
 
+    def test_society_details_embed_first_page(self):
+        """Test the society details only embed the newest page."""
+        self.log_activities(12)
+        response = self.client.get(
+            f"api/v1/societies/{self.invictus.uuid}",
+            headers=self.success_ops)
+
+        self.assertEqual(response.status_code, 200)
+        details = json.loads(response.data)["societyDetails"]
+        self.assertEqual(len(details["loggedActivities"]), 10)
+        self.assertIn("points", details["loggedActivitiesSummary"])
+
+        response = self.client.get(details["loggedActivitiesNextUrl"],
+                                   headers=self.success_ops)
+        self.assertEqual(response.status_code, 200)
+        data = json.loads(response.data)["data"]
+        total = LoggedActivity.query.filter_by(
+            society_id=self.invictus.uuid).count()
+        self.assertEqual(len(data["loggedActivities"]), total - 10)
+        self.assertIsNone(data["next_url"])
+
+    def test_society_logged_activities_filters(self):
+        """Test filtering a society's logged activities."""
+        self.log_activities(3, status="approved")
+        self.log_activities(2, status="rejected")
+        url = f"api/v1/societies/{self.invictus.uuid}/logged-activities"
+
+        response = self.client.get(
+            url + "?status=approved&startDate=2018-01-02",
+            headers=self.success_ops)
+        data = json.loads(response.data)["data"]
+        self.assertEqual(data["count"], 2)
+        self.assertEqual({activity["status"]
+                          for activity in data["loggedActivities"]},
+                         {"approved"})
+
+        response = self.client.get(
+            url + "?status=Approved,REJECTED&endDate=2018-01-01",
+            headers=self.success_ops)
+        self.assertEqual(json.loads(response.data)["data"]["count"], 2)
+
+        response = self.client.get(url + "?status=unknown",
+                                   headers=self.success_ops)
+        self.assertEqual(response.status_code, 400)
+        response = self.client.get(url + "?startDate=01-01-2018",
+                                   headers=self.success_ops)
+        self.assertEqual(response.status_code, 400)
+
+    def test_society_logged_activities_paginated_by_page(self):
+        """Test page urls keep the society and the filters."""
+        self.log_activities(3)
+        response = self.client.get(
+            f"api/v1/societies/{self.invictus.uuid}/logged-activities"
+            "?limit=2&status=in%20review",
+            headers=self.success_ops)
+
+        data = json.loads(response.data)["data"]
+        self.assertEqual(data["pages"], 2)
+        self.assertIn(f"societies/{self.invictus.uuid}/logged-activities",
+                      data["next_url"])
+        self.assertIn("status=in+review", data["next_url"])
+
     def test_get_society_by_name(self):
         """Test a society can be retrieved by name."""
         response = self.client.get(f"api/v1/societies?q={self.istelle.name}",
@@ -113,6 +176,43 @@ class SocietyBaseTestCase(BaseTestCase):
         self.assertIn(message, response_details["message"])
         self.assertEqual(response.status_code, 200)
 
+    def test_get_societies_by_cursor(self):
+        """Test walking all societies with keyset pagination."""
+        url = "api/v1/societies?limit=2&count=true&cursor="
+        names = []
+        while url:
+            response = self.client.get(url, headers=self.header)
+            self.assertEqual(response.status_code, 200)
+            response_details = json.loads(response.data)
+            self.assertEqual(response_details["count"],
+                             Society.query.count())
+            self.assertLessEqual(len(response_details["data"]), 2)
+            names.extend(society["name"]
+                         for society in response_details["data"])
+            url = response_details["nextUrl"]
+            if url:
+                self.assertIn(response_details["nextCursor"], url)
+
+        expected = [society.name for society in Society.query.order_by(
+            Society.created_at.desc(), Society.uuid.desc())]
+        self.assertEqual(names, expected)
+
+    def test_get_societies_invalid_cursor(self):
+        """Test that a malformed cursor is rejected."""
+        response = self.client.get("api/v1/societies?cursor=not-a-cursor",
+                                   headers=self.header)
+
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(json.loads(response.data)["message"],
+                         "Invalid cursor.")
+
+        cursor = base64.urlsafe_b64encode(
+            json.dumps([None, self.istelle.uuid]).encode()).decode()
+        response = self.client.get(f"api/v1/societies?cursor={cursor}",
+                                   headers=self.header)
+
+        self.assertEqual(response.status_code, 400)
+
     def test_edit_society_details(self):
         """Test editing society details is successful."""
         society_details = dict(name="Stacked Deck",
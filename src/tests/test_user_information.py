@@ -1,10 +1,12 @@
 """Module test user information reource."""
+import csv
+import io
 import json
 from unittest import mock
 
 from flask import Response
 
-from .base_test import BaseTestCase, Center, Cohort, Society
+from .base_test import BaseTestCase, Center, Cohort, Society, User
 from api.utils.marshmallow_schemas import basic_info_schema
 
 
@@ -73,6 +75,38 @@ class UserInformationTestCase(BaseTestCase):
         self.assertDictEqual(response_data.get('data').get('cohort'),
                              expected_cohort_data)
 
+    def test_export_users_as_csv(self):
+        """Test streaming all users as CSV rows."""
+        self.test_user.save()
+        self.test_user_2.save()
+
+        response = self.client.get('/api/v1/users/all?paginate=false'
+                                   '&format=csv',
+                                   headers=self.successops_token)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.mimetype, 'text/csv')
+        self.assertIn('users.csv', response.headers['Content-Disposition'])
+        rows = list(csv.DictReader(
+            io.StringIO(response.get_data(as_text=True))))
+        self.assertEqual(len(rows), User.query.count())
+        self.assertIn(self.test_user.name, {row['name'] for row in rows})
+
+    def test_get_users_by_society(self):
+        """Test filtering users by the name of their society."""
+        self.test_user.save()
+        self.test_user_2.save()
+
+        response = self.client.get(
+            f'/api/v1/users/all?society={self.test_user.society.name}',
+            headers=self.successops_token)
+
+        self.assertEqual(response.status_code, 200)
+        users = json.loads(response.data)['data']['users']
+        self.assertTrue(users)
+        self.assertEqual({user['societyId'] for user in users},
+                         {self.test_user.society_id})
+
     def test_get_user_info_not_saved_in_DB(self):
         """Test retrive user info from ANDELA API sucesfully."""
         mock_location = Center(name='Mock-location')